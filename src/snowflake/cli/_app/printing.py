@@ -14,21 +14,27 @@
 
 from __future__ import annotations
 
+import csv
+import itertools
 import json
 import sys
+from contextlib import ExitStack, contextmanager, nullcontext, redirect_stdout
+from contextvars import ContextVar
 from datetime import datetime
 from json import JSONEncoder
 from pathlib import Path
 from textwrap import indent
-from typing import TextIO
+from typing import Dict, Iterable, Iterator, List, TextIO
 
 from rich import box, get_console
 from rich import print as rich_print
 from rich.live import Live
 from rich.table import Table
 from snowflake.cli.api.cli_global_context import get_cli_context
+from snowflake.cli.api.config import CLI_SECTION, get_config_value
 from snowflake.cli.api.output.formats import OutputFormat
 from snowflake.cli.api.output.types import (
+    ArrowQueryResult,
     CollectionResult,
     CommandResult,
     MessageResult,
@@ -37,8 +43,16 @@ from snowflake.cli.api.output.types import (
     StreamResult,
 )
 from snowflake.cli.api.sanitizers import sanitize_for_terminal
+from snowflake.cli.api.secure_path import SecurePath
 
 NO_ITEMS_FOUND: str = "No data"
+_NO_ITEM = object()
+OUTPUT_FILE_BUFFER_BYTES = 1024**2
+OUTPUT_SECTION_PATH = [CLI_SECTION, "output"]
+# Tables with more rows are printed row by row, with column widths computed from these rows
+DEFAULT_TABLE_SAMPLE_ROWS = 1000
+MIN_STREAMED_COLUMN_WIDTH = 10
+DELIMITERS = {OutputFormat.CSV: ",", OutputFormat.TSV: "\t"}
 
 # ensure we do not break URLs that wrap lines
 get_console().soft_wrap = True
@@ -75,6 +89,16 @@ def _get_table():
     return Table(show_header=True, box=box.ASCII)
 
 
+def _table_sample_rows() -> int:
+    return int(
+        get_config_value(
+            *OUTPUT_SECTION_PATH,
+            key="table_sample_rows",
+            default=DEFAULT_TABLE_SAMPLE_ROWS,
+        )
+    )
+
+
 def _print_multiple_table_results(obj: CollectionResult):
     items = obj.result
     try:
@@ -82,15 +106,75 @@ def _print_multiple_table_results(obj: CollectionResult):
     except StopIteration:
         rich_print(NO_ITEMS_FOUND, end="\n\n")
         return
+    sample_rows = _table_sample_rows()
+    sample = [first_item]
     table = _get_table()
     for column in first_item.keys():
         table.add_column(column, overflow="fold")
-    with Live(table, refresh_per_second=4):
+    # Rows are shown as they arrive only on a terminal; the live table is replaced
+    # by the final one, or by a streamed table if the result turns out to be large
+    with Live(
+        table, refresh_per_second=4, transient=True
+    ) if get_console().is_terminal else nullcontext():
         table.add_row(*[str(i) for i in first_item.values()])
         for item in items:
+            sample.append(item)
+            if len(sample) > sample_rows:
+                break
             table.add_row(*[str(i) for i in item.values()])
-    # Add separator between tables
-    rich_print(flush=True)
+
+    if len(sample) > sample_rows:
+        _print_streamed_table(
+            sample[:sample_rows], itertools.chain(sample[sample_rows:], items)
+        )
+    else:
+        rich_print(table, flush=True)
+
+
+def _print_streamed_table(sample: List[Dict], items: Iterator[Dict]):
+    """
+    Prints a table row by row, without keeping rows in memory. Widths of columns are
+    computed from the sampled first rows, and longer values are folded into multiple lines.
+    """
+    columns = list(sample[0].keys())
+    widths = [len(str(column)) for column in columns]
+    for row in sample:
+        for i, value in enumerate(row.values()):
+            widths[i] = max(widths[i], max(map(len, str(value).splitlines() or [""])))
+    # shrink the widest columns until the table fits into the console
+    max_width = get_console().width - 3 * len(columns) - 1
+    while sum(widths) > max_width and max(widths) > MIN_STREAMED_COLUMN_WIDTH:
+        widths[widths.index(max(widths))] -= 1
+
+    border = "+" + "-" * (sum(widths) + 3 * len(widths) - 1) + "+"
+    write = sys.stdout.write
+    write(border + "\n")
+    write(_format_table_row(columns, widths))
+    write("|" + "+".join("-" * (w + 2) for w in widths) + "|\n")
+    for row in itertools.chain(sample, items):
+        write(_format_table_row(row.values(), widths))
+    write(border + "\n")
+    sys.stdout.flush()
+
+
+def _format_table_row(values: Iterable, widths: List[int]) -> str:
+    cells = [
+        [
+            line[i : i + width]
+            for line in (str(value).splitlines() or [""])
+            for i in range(0, max(len(line), 1), width)
+        ]
+        for value, width in zip(values, widths)
+    ]
+    return "".join(
+        "| "
+        + " | ".join(
+            (cell[n] if n < len(cell) else "").ljust(width)
+            for cell, width in zip(cells, widths)
+        )
+        + " |\n"
+        for n in range(max(map(len, cells)))
+    )
 
 
 def is_structured_format(output_format):
@@ -102,6 +186,8 @@ def print_structured(result: CommandResult):
     printed_end_line = False
     if isinstance(result, MultipleResults):
         _stream_json(result)
+    elif isinstance(result, CollectionResult):
+        _write_json_array(result.result, sys.stdout, indent_size=4)
     elif isinstance(result, StreamResult):
         # A StreamResult prints each value onto its own line
         # instead of joining all the values into a JSON array
@@ -119,24 +205,125 @@ def print_structured(result: CommandResult):
 def _stream_json(result):
     """Simple helper for streaming multiple results as a JSON."""
     indent_size = 2
-
-    class _Indented:
-        def __init__(self, stream: TextIO):
-            self._stream = stream
-
-        def write(self, text: str):
-            return self._stream.write(indent(text, " " * indent_size))
+    prefix = " " * indent_size
 
     print("[")
-    results = result.result
-    res = next(results, None)
-    while res:
-        json.dump(res, _Indented(sys.stdout), cls=CustomJSONEncoder, indent=indent_size)  # type: ignore
-        if res := next(results, None):
+    for i, res in enumerate(result.result):
+        if i:
             print(",")
+        if isinstance(res, CollectionResult):
+            sys.stdout.write(prefix)
+            _write_json_array(res.result, sys.stdout, indent_size, prefix=prefix)
+        else:
+            sys.stdout.write(
+                indent(
+                    json.dumps(res, cls=CustomJSONEncoder, indent=indent_size), prefix
+                )
+            )
     print("\n]")
 
 
+def _write_json_array(
+    items: Iterable, stream: TextIO, indent_size: int, prefix: str = ""
+):
+    """
+    Writes items as a JSON array, encoding them one by one as they are produced,
+    so that the whole collection is never kept in memory. Lines following the
+    first one are prefixed with prefix.
+    """
+    items = iter(items)
+    first = next(items, _NO_ITEM)
+    if first is _NO_ITEM:
+        stream.write("[]")
+        return
+
+    item_prefix = prefix + " " * indent_size
+    separator = "[\n"
+    for item in itertools.chain([first], items):
+        encoded = json.dumps(item, cls=CustomJSONEncoder, indent=indent_size)
+        stream.write(separator + indent(encoded, item_prefix))
+        separator = ",\n"
+    stream.write(f"\n{prefix}]")
+
+
+def is_row_format(output_format):
+    return output_format in (OutputFormat.CSV, OutputFormat.TSV, OutputFormat.NDJSON)
+
+
+class _RowWriter:
+    """
+    Writes rows of results one by one, as CSV, TSV or JSON Lines. In delimited formats
+    a header is written before the first row, and again (after an empty line) whenever
+    the columns of rows change.
+    """
+
+    def __init__(self, output_format: OutputFormat, stream: TextIO):
+        self._output_format = output_format
+        self._stream = stream
+        self._columns: List[str] | None = None
+        if output_format in DELIMITERS:
+            self._csv_writer = csv.writer(
+                stream, delimiter=DELIMITERS[output_format], lineterminator="\n"
+            )
+
+    def write(self, result: CommandResult | None):
+        if isinstance(result, MultipleResults):
+            for r in result.result:
+                self.write(r)
+        elif isinstance(result, StreamResult):
+            for r in result.result:
+                self.write(r)
+                self._stream.flush()
+        elif (
+            isinstance(result, ArrowQueryResult)
+            and result.batches is not None
+            and self._output_format in DELIMITERS
+        ):
+            self._write_batches(result.column_names, result.batches)
+        elif isinstance(result, CollectionResult):
+            for row in result.result:
+                self._write_row(row)
+        elif isinstance(result, (ObjectResult, MessageResult)):
+            if result.result is not None:
+                self._write_row(result.result)
+        elif result is not None:
+            raise ValueError(f"Unexpected type {type(result)}")
+
+    def _write_row(self, row: Dict):
+        if self._output_format == OutputFormat.NDJSON:
+            self._stream.write(json.dumps(row, cls=CustomJSONEncoder) + "\n")
+            return
+
+        self._write_header(list(row.keys()))
+        self._csv_writer.writerow([_delimited_value(v) for v in row.values()])
+
+    def _write_batches(self, columns: List[str], batches: Iterable):
+        """Writes Arrow record batches column by column, without building a dictionary per row."""
+        for batch in batches:
+            if not batch.num_rows:
+                continue
+            self._write_header(columns)
+            self._csv_writer.writerows(
+                [_delimited_value(v) for v in row]
+                for row in zip(*(column.to_pylist() for column in batch.columns))
+            )
+
+    def _write_header(self, columns: List[str]):
+        if columns != self._columns:
+            if self._columns is not None:
+                self._stream.write("\n")
+            self._csv_writer.writerow(columns)
+            self._columns = columns
+
+
+def _delimited_value(value):
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, cls=CustomJSONEncoder)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
 def print_unstructured(obj: CommandResult | None):
     """Handles outputs like table, plain text and other unstructured types."""
     if not obj:
@@ -165,13 +352,78 @@ def _print_single_table(obj):
     rich_print(table, flush=True)
 
 
+class _OpenOutputFiles:
+    def __init__(self, stack: ExitStack):
+        self._stack = stack
+        self._files: Dict[Path, TextIO] = {}
+
+    def get(self, output_file: Path) -> TextIO:
+        if output_file not in self._files:
+            self._files[output_file] = self._stack.enter_context(
+                _open_output_file(output_file)
+            )
+        return self._files[output_file]
+
+
+_OPEN_OUTPUT_FILES: ContextVar[_OpenOutputFiles | None] = ContextVar(
+    "open_output_files", default=None
+)
+
+
+@contextmanager
+def keep_output_files_open():
+    """
+    Keeps output files opened by results printed inside the block open until its end,
+    so that every result printed by a command is written to the output file, instead
+    of each one truncating it.
+    """
+    with ExitStack() as stack:
+        token = _OPEN_OUTPUT_FILES.set(_OpenOutputFiles(stack))
+        try:
+            yield
+        finally:
+            _OPEN_OUTPUT_FILES.reset(token)
+
+
+def _open_output_file(output_file: Path):
+    return SecurePath(output_file).open(
+        "w", buffering=OUTPUT_FILE_BUFFER_BYTES, newline="", encoding="utf-8"
+    )
+
+
+@contextmanager
+def _redirect_output():
+    """Redirects the standard output to the output file, if one is configured."""
+    output_file = get_cli_context().output_file
+    if not output_file:
+        yield
+        return
+    open_output_files = _OPEN_OUTPUT_FILES.get()
+    if open_output_files is None:
+        with _open_output_file(output_file) as f, redirect_stdout(f):
+            yield
+        return
+    f = open_output_files.get(output_file)
+    with redirect_stdout(f):
+        yield
+    f.flush()
+
+
 def print_result(cmd_result: CommandResult, output_format: OutputFormat | None = None):
+    with _redirect_output():
+        _print_result(cmd_result, output_format)
+
+
+def _print_result(cmd_result: CommandResult, output_format: OutputFormat | None = None):
     output_format = output_format or _get_format_type()
     if is_structured_format(output_format):
         print_structured(cmd_result)
+    elif is_row_format(output_format):
+        _RowWriter(output_format, sys.stdout).write(cmd_result)
+        sys.stdout.flush()
     elif isinstance(cmd_result, (MultipleResults, StreamResult)):
         for res in cmd_result.result:
-            print_result(res)
+            _print_result(res)
     elif (
         isinstance(cmd_result, (MessageResult, ObjectResult, CollectionResult))
         or cmd_result is None
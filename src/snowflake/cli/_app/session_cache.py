@@ -0,0 +1,219 @@
+# Copyright (c) 2024 Snowflake Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+import snowflake.connector
+from snowflake.cli.api.cache_files import (
+    config_dir_cache_path,
+    read_cache_file,
+    write_cache_file,
+)
+from snowflake.cli.api.feature_flags import FeatureFlag
+from snowflake.cli.api.secure_path import SecurePath
+from snowflake.connector import SnowflakeConnection
+from snowflake.connector.errors import Error
+
+SESSION_CACHE_DIR_NAME = ".session_cache"
+SESSION_CACHE_VERSION = 2
+# sessions are not resumed if they are about to expire
+EXPIRY_MARGIN_SECONDS = 60
+# parameters which do not influence the session that is created
+_IGNORED_PARAMETERS = {
+    "passcode",
+    "enable_connection_diag",
+    "connection_diag_log_path",
+    "connection_diag_allowlist_path",
+}
+# parameters needed to reach the server of a cached session without its configuration
+_SERVER_PARAMETERS = ("account", "host", "port", "protocol")
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedSession:
+    connection_name: str
+    session_token: str
+    master_token: str
+    expires_at: float
+    "Unix timestamp after which the master token is no longer valid"
+    server_parameters: Dict[str, Any] = field(default_factory=dict)
+    context: Dict[str, Any] = field(default_factory=dict)
+    "Context of the session right after login, which resumed sessions are reset to"
+
+    def is_expired(self) -> bool:
+        return time.time() >= self.expires_at - EXPIRY_MARGIN_SECONDS
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "connection_name": self.connection_name,
+            "session_token": self.session_token,
+            "master_token": self.master_token,
+            "expires_at": self.expires_at,
+            "server_parameters": self.server_parameters,
+            "context": self.context,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> CachedSession:
+        return cls(
+            connection_name=data["connection_name"],
+            session_token=data["session_token"],
+            master_token=data["master_token"],
+            expires_at=float(data["expires_at"]),
+            server_parameters=data["server_parameters"],
+            context=data["context"],
+        )
+
+
+def session_cache_enabled() -> bool:
+    return FeatureFlag.ENABLE_SESSION_TOKEN_CACHE.is_enabled()
+
+
+def session_cache_dir() -> SecurePath:
+    return config_dir_cache_path(SESSION_CACHE_DIR_NAME)
+
+
+def _parameters_hash(connection_parameters: Dict) -> str:
+    hashed_parameters = {
+        k: v for k, v in connection_parameters.items() if k not in _IGNORED_PARAMETERS
+    }
+    return hashlib.sha256(
+        json.dumps(hashed_parameters, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+def _session_file(connection_name: str, connection_parameters: Dict) -> SecurePath:
+    key = f"{connection_name}:{_parameters_hash(connection_parameters)}"
+    file_name = hashlib.sha256(key.encode()).hexdigest() + ".json"
+    return session_cache_dir() / file_name
+
+
+def _read_session(session_file: SecurePath) -> Optional[CachedSession]:
+    return read_cache_file(session_file, SESSION_CACHE_VERSION, CachedSession.from_dict)
+
+
+def load_session(
+    connection_name: str, connection_parameters: Dict
+) -> Optional[CachedSession]:
+    """
+    Returns the session cached for the given connection and parameters, or None if there
+    is none. Expired sessions are removed from the cache.
+    """
+    session_file = _session_file(connection_name, connection_parameters)
+    if not session_file.exists():
+        return None
+
+    session = _read_session(session_file)
+    if session is None or session.is_expired():
+        log.debug("Removing expired cached session of connection %s", connection_name)
+        session_file.unlink(missing_ok=True)
+        return None
+    return session
+
+
+def save_session(
+    connection_name: str,
+    connection_parameters: Dict,
+    connection: SnowflakeConnection,
+    context: Dict[str, Any],
+    expires_at: Optional[float] = None,
+) -> None:
+    """
+    Stores the tokens of an open connection, so that following invocations of the CLI
+    can resume its session instead of logging in again. The file is readable by its owner only.
+    The context is the state of the session right after login, see CachedSession.context.
+    """
+    rest = connection.rest
+    if rest is None or not rest.token or not rest.master_token:
+        return
+
+    session = CachedSession(
+        connection_name=connection_name,
+        session_token=rest.token,
+        master_token=rest.master_token,
+        expires_at=expires_at or time.time() + rest.master_validity_in_seconds,
+        server_parameters={
+            k: connection_parameters[k]
+            for k in _SERVER_PARAMETERS
+            if k in connection_parameters
+        },
+        context=context,
+    )
+    write_cache_file(
+        _session_file(connection_name, connection_parameters),
+        SESSION_CACHE_VERSION,
+        session.to_dict(),
+        private=True,
+    )
+
+
+def forget_session(connection_name: str, connection_parameters: Dict) -> None:
+    _session_file(connection_name, connection_parameters).unlink(missing_ok=True)
+
+
+def close_server_session(session: CachedSession) -> None:
+    """
+    Closes the server side of a cached session, which is kept alive otherwise
+    until its master token expires.
+    """
+    if session.is_expired():
+        return
+    try:
+        connection = snowflake.connector.connect(
+            session_token=session.session_token,
+            master_token=session.master_token,
+            server_session_keep_alive=False,
+            **session.server_parameters,
+        )
+        connection.close()
+    except Error:
+        log.debug(
+            "Could not close cached session of connection %s",
+            session.connection_name,
+            exc_info=True,
+        )
+
+
+def purge_sessions(connection_name: Optional[str] = None) -> int:
+    """
+    Closes and removes the cached sessions of the given connection, or of all connections
+    if no name is given. Returns the number of removed sessions.
+    """
+    cache_dir = session_cache_dir()
+    if not cache_dir.exists():
+        return 0
+
+    removed = 0
+    for path in cache_dir.path.glob("*.json"):
+        session_file = SecurePath(path)
+        session = _read_session(session_file)
+        if session is not None:
+            if (
+                connection_name is not None
+                and session.connection_name != connection_name
+            ):
+                continue
+            close_server_session(session)
+        session_file.unlink(missing_ok=True)
+        removed += 1
+    return removed
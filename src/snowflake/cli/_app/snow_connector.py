@@ -15,12 +15,14 @@
 from __future__ import annotations
 
 import contextlib
+import json
 import logging
 import os
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 import snowflake.connector
 from click.exceptions import ClickException
+from snowflake.cli._app import session_cache
 from snowflake.cli._app.constants import (
     PARAM_APPLICATION_NAME,
 )
@@ -35,8 +37,13 @@ from snowflake.cli.api.exceptions import (
     InvalidConnectionConfiguration,
     SnowflakeConnectionError,
 )
+from snowflake.cli.api.project.util import (
+    to_identifier,
+    to_quoted_identifier,
+    to_string_literal,
+)
 from snowflake.cli.api.secure_path import SecurePath
-from snowflake.connector import SnowflakeConnection
+from snowflake.connector import DictCursor, SnowflakeConnection
 from snowflake.connector.errors import DatabaseError, ForbiddenError
 
 log = logging.getLogger(__name__)
@@ -62,6 +69,24 @@ SUPPORTED_ENV_OVERRIDES = [
     "token_file_path",
 ]
 
+# connection keys only needed to log in, not to resume a cached session
+_LOGIN_ONLY_PARAMETERS = {
+    "authenticator",
+    "password",
+    "passcode",
+    "private_key",
+    "private_key_file",
+    "private_key_file_pwd",
+    "private_key_raw",
+    "token",
+    "token_file_path",
+}
+
+_CONTEXT_KEYS = ("role", "warehouse", "database", "schema")
+# a session cannot stop using these once it uses them
+_UNSETTABLE_CONTEXT_KEYS = ("warehouse", "database", "schema")
+_UNQUOTED_PARAMETER_TYPES = {"BOOLEAN", "NUMBER"}
+
 # mapping of found key -> key to set
 CONNECTION_KEY_ALIASES = {"private_key_path": "private_key_file"}
 
@@ -80,6 +105,7 @@ def connect_to_snowflake(
     diag_log_path: Optional[str] = None,
     diag_allowlist_path: Optional[str] = None,
     connection_name: Optional[str] = None,
+    use_session_cache: bool = False,
     **overrides,
 ) -> SnowflakeConnection:
     if temporary_connection and connection_name:
@@ -126,6 +152,22 @@ def connect_to_snowflake(
         k: v for k, v in connection_parameters.items() if v is not None
     }
 
+    # Sessions are cached only for the primary connection of named connections logging
+    # in by themselves; other connections (e.g. pools) must not share its session
+    cache_session = (
+        use_session_cache
+        and connection_name is not None
+        and not enable_diag
+        and "session_token" not in connection_parameters
+        and "master_token" not in connection_parameters
+        and session_cache.session_cache_enabled()
+    )
+    if cache_session:
+        cache_key_parameters = dict(connection_parameters)
+        connection = _resume_cached_session(connection_name, cache_key_parameters)
+        if connection is not None:
+            return connection
+
     update_connection_details_with_private_key(connection_parameters)
 
     if mfa_passcode:
@@ -148,23 +190,211 @@ def connect_to_snowflake(
         using_session_token, using_master_token, connection_parameters
     )
 
+    if cache_session:
+        # The session has to outlive this invocation to be resumed by the next ones
+        connection_parameters["server_session_keep_alive"] = True
+
     _update_connection_application_name(connection_parameters)
 
     try:
-        # Whatever output is generated when creating connection,
-        # we don't want it in our output. This is particularly important
-        # for cases when external browser and json format are used.
-        # Redirecting both stdout and stderr for offline usage.
-        with contextlib.redirect_stdout(None), contextlib.redirect_stderr(None):
-            return snowflake.connector.connect(
-                application=command_info(),
-                **connection_parameters,
-            )
+        connection = _connect(connection_parameters)
     except ForbiddenError as err:
         raise SnowflakeConnectionError(err)
     except DatabaseError as err:
         raise InvalidConnectionConfiguration(err.msg)
 
+    if cache_session:
+        _save_new_session(connection_name, cache_key_parameters, connection)
+    return connection
+
+
+def _connect(connection_parameters: Dict) -> SnowflakeConnection:
+    # Whatever output is generated when creating connection,
+    # we don't want it in our output. This is particularly important
+    # for cases when external browser and json format are used.
+    # Redirecting both stdout and stderr for offline usage.
+    with contextlib.redirect_stdout(None), contextlib.redirect_stderr(None):
+        return snowflake.connector.connect(
+            application=command_info(),
+            **connection_parameters,
+        )
+
+
+def _save_new_session(
+    connection_name: str, connection_parameters: Dict, connection: SnowflakeConnection
+) -> None:
+    try:
+        context = _session_context(connection)
+    except DatabaseError as err:
+        log.debug("Cannot cache session of connection %s: %s", connection_name, err)
+        return
+    session_cache.save_session(
+        connection_name, connection_parameters, connection, context=context
+    )
+
+
+def _session_context(connection: SnowflakeConnection) -> Dict[str, Any]:
+    """
+    Returns the context of a session right after login, which resumed sessions are reset to.
+    """
+    cursor = connection.cursor(DictCursor)
+    (row,) = cursor.execute(
+        "select current_secondary_roles() as secondary_roles"
+    ).fetchall()
+    secondary_roles = json.loads(row["SECONDARY_ROLES"])
+    return {
+        **{key: getattr(connection, key) for key in _CONTEXT_KEYS},
+        "secondary_roles": (
+            "ALL"
+            if secondary_roles.get("value") == "ALL"
+            else secondary_roles.get("roles", "")
+        ),
+        "parameters": _session_parameters(cursor),
+    }
+
+
+def _session_parameters(cursor: DictCursor) -> Dict[str, str]:
+    """Returns the parameters set on the session level, as SQL literals."""
+    return {
+        row["key"]: (
+            row["value"]
+            if row["type"] in _UNQUOTED_PARAMETER_TYPES
+            else to_string_literal(row["value"])
+        )
+        for row in cursor.execute("show parameters in session").fetchall()
+        if row["level"] == "SESSION"
+    }
+
+
+def _resume_cached_session(
+    connection_name: str, connection_parameters: Dict
+) -> Optional[SnowflakeConnection]:
+    """
+    Connects using the tokens of a session cached by a previous invocation, if there is one.
+    Returns None if there is no such session or it cannot be resumed, in which case
+    the caller should log in.
+    """
+    session = session_cache.load_session(connection_name, connection_parameters)
+    if session is None:
+        return None
+
+    resume_parameters = {
+        k: v
+        for k, v in connection_parameters.items()
+        if k not in _LOGIN_ONLY_PARAMETERS
+    }
+    resume_parameters.update(
+        session_token=session.session_token,
+        master_token=session.master_token,
+        server_session_keep_alive=True,
+    )
+    _update_connection_application_name(resume_parameters)
+
+    try:
+        connection = _connect(resume_parameters)
+    except DatabaseError as err:
+        log.debug(
+            "Cannot resume cached session of connection %s: %s", connection_name, err
+        )
+        session_cache.forget_session(connection_name, connection_parameters)
+        return None
+
+    try:
+        reset = _reset_session(connection, connection_parameters, session.context)
+    except DatabaseError as err:
+        log.debug(
+            "Cannot reset cached session of connection %s: %s", connection_name, err
+        )
+        reset = False
+    if not reset:
+        connection.close()
+        session_cache.close_server_session(session)
+        session_cache.forget_session(connection_name, connection_parameters)
+        return None
+
+    log.debug("Resumed cached session of connection %s", connection_name)
+    rest = connection.rest
+    if rest and (rest.token, rest.master_token) != (
+        session.session_token,
+        session.master_token,
+    ):
+        # the tokens were renewed while validating the session
+        session_cache.save_session(
+            connection_name,
+            connection_parameters,
+            connection,
+            context=session.context,
+            expires_at=(
+                session.expires_at
+                if rest.master_token == session.master_token
+                else None
+            ),
+        )
+    return connection
+
+
+def _reset_session(
+    connection: SnowflakeConnection, connection_parameters: Dict, context: Dict
+) -> bool:
+    """
+    Resets a resumed session to the state it had right after login, undoing what previous
+    invocations changed: session parameters, session variables, secondary roles and the
+    current role, warehouse, database and schema. Temporary objects are not dropped, they
+    live as long as the session. Returns False if the session cannot be reset.
+
+    Costs three requests: two to find what was changed and one to reset it.
+    """
+    cursor = connection.cursor(DictCursor)
+    # also refreshes the current role, warehouse, database and schema of the connection
+    parameters = _session_parameters(cursor)
+    variables = [row["name"] for row in cursor.execute("show variables").fetchall()]
+
+    targets = {
+        key: (
+            to_identifier(connection_parameters[key])
+            if connection_parameters.get(key)
+            else context[key] and to_quoted_identifier(context[key])
+        )
+        for key in _CONTEXT_KEYS
+    }
+    if any(
+        targets[key] is None and getattr(connection, key) is not None
+        for key in _UNSETTABLE_CONTEXT_KEYS
+    ):
+        return False
+
+    login_parameters = context["parameters"]
+    statements = []
+    if unset_parameters := [k for k in parameters if k not in login_parameters]:
+        statements.append(f"alter session unset {', '.join(unset_parameters)}")
+    if changed_parameters := [
+        f"{k} = {v}" for k, v in login_parameters.items() if parameters.get(k) != v
+    ]:
+        statements.append(f"alter session set {' '.join(changed_parameters)}")
+    if variables:
+        statements.append(
+            f"unset ({', '.join(to_quoted_identifier(name) for name in variables)})"
+        )
+    for key in _CONTEXT_KEYS:
+        if targets[key]:
+            statements.append(f"use {key} {targets[key]}")
+        if key == "role":
+            statements.append(
+                f"use secondary roles {_secondary_roles(context['secondary_roles'])}"
+            )
+    cursor.execute(";\n".join(statements), num_statements=len(statements))
+    return True
+
+
+def _secondary_roles(secondary_roles: str) -> str:
+    if secondary_roles == "ALL":
+        return "all"
+    if not secondary_roles:
+        return "none"
+    return ", ".join(
+        to_quoted_identifier(role.strip()) for role in secondary_roles.split(",")
+    )
+
 
 def _avoid_closing_the_connection_if_it_was_shared(
     using_session_token: bool, using_master_token: bool, connection_parameters: Dict
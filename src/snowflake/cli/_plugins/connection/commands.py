@@ -28,6 +28,7 @@ from click import (  # type: ignore
 )
 from click.core import ParameterSource  # type: ignore
 from snowflake import connector
+from snowflake.cli._app.session_cache import purge_sessions
 from snowflake.cli._plugins.connection.util import (
     strip_if_value_present,
 )
@@ -361,6 +362,24 @@ def set_default(
     return MessageResult(f"Default connection set to: {name}")
 
 
+@app.command(requires_connection=False)
+def logout(
+    name: Optional[str] = typer.Argument(
+        None,
+        help="Name of the connection, as defined in your `config.toml` file. "
+        "If not provided, cached sessions of all connections are removed.",
+        show_default=False,
+    ),
+    **options,
+) -> CommandResult:
+    """
+    Closes and removes cached sessions, so that the next command logs in again.
+    """
+    removed = purge_sessions(connection_name=name)
+    target = f"connection {name}" if name else "all connections"
+    return MessageResult(f"Removed {removed} cached session(s) of {target}.")
+
+
 @app.command(requires_connection=True)
 def generate_jwt(
     **options,
@@ -30,6 +30,7 @@ from snowflake.cli._plugins.object.command_aliases import (
 from snowflake.cli._plugins.object.manager import ObjectManager
 from snowflake.cli.api.commands.common import OnErrorType
 from snowflake.cli.api.commands.flags import (
+    ExecuteParallelOption,
     ExecuteVariablesOption,
     OnErrorOption,
     PatternOption,
@@ -330,6 +331,7 @@ def execute(
     repository_path: str = RepoPathArgument,
     on_error: OnErrorType = OnErrorOption,
     variables: Optional[List[str]] = ExecuteVariablesOption,
+    parallel: int = ExecuteParallelOption,
     **options,
 ):
     """
@@ -342,6 +344,7 @@ def execute(
         on_error=on_error,
         variables=variables,
         requires_temporary_stage=True,
+        parallel=parallel,
     )
     return CollectionResult(results)
 
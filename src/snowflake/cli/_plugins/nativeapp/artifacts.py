@@ -14,8 +14,8 @@
 
 from __future__ import annotations
 
-import itertools
 import os
+import stat
 from collections import namedtuple
 from pathlib import Path
 from textwrap import dedent
@@ -27,6 +27,7 @@ from snowflake.cli.api.constants import DEFAULT_SIZE_LIMIT_MB
 from snowflake.cli.api.project.schemas.v1.native_app.path_mapping import PathMapping
 from snowflake.cli.api.project.util import to_identifier
 from snowflake.cli.api.secure_path import SecurePath
+from snowflake.cli.api.utils.path_utils import walk_tree
 from yaml import safe_load
 
 
@@ -166,12 +167,13 @@ class _ArtifactPathMap:
         if src_is_dir:
             # mark all subdirectories of this source as directories so that we can
             # detect accidental clobbering
-            for root, _, files in os.walk(absolute_src, followlinks=True):
-                canonical_subdir = Path(root).relative_to(absolute_src)
-                canonical_dest_subdir = dest / canonical_subdir
-                self._update_dest_is_dir(canonical_dest_subdir, is_dir=True)
-                for f in files:
-                    self._update_dest_is_dir(canonical_dest_subdir / f, is_dir=False)
+            self._update_dest_is_dir(dest, is_dir=True)
+            for relative_path, stat_result in walk_tree(
+                absolute_src, include_dirs=True
+            ):
+                self._update_dest_is_dir(
+                    dest / relative_path, is_dir=stat.S_ISDIR(stat_result.st_mode)
+                )
 
         # make sure we check for dest_is_dir consistency regardless of whether the
         # insertion happened. This update can fail, so we need to do it first to
@@ -385,13 +387,11 @@ class BundleMap:
         if absolute_src.is_dir() and expand_directories:
             # both src and dest are directories, and expanding directories was requested. Traverse src, and map each
             # file to the dest directory
-            for root, subdirs, files in os.walk(absolute_src, followlinks=True):
-                relative_root = Path(root).relative_to(absolute_src)
-                for name in itertools.chain(subdirs, files):
-                    src_file_for_output = src_for_output / relative_root / name
-                    dest_file_for_output = dest_for_output / relative_root / name
-                    if predicate(src_file_for_output, dest_file_for_output):
-                        yield src_file_for_output, dest_file_for_output
+            for relative_path, _ in walk_tree(absolute_src, include_dirs=True):
+                src_file_for_output = src_for_output / relative_path
+                dest_file_for_output = dest_for_output / relative_path
+                if predicate(src_file_for_output, dest_file_for_output):
+                    yield src_file_for_output, dest_file_for_output
 
     def all_mappings(
         self,
@@ -628,16 +628,13 @@ def symlink_or_copy(src: Path, dst: Path, deploy_root: Path) -> None:
         # 1. Create a new directory in the deploy root
         dst.mkdir(exist_ok=True)
         # 2. For all children of src, create their counterparts in dst now that it exists
-        for root, _, files in sorted(os.walk(absolute_src, followlinks=True)):
-            relative_root = Path(root).relative_to(absolute_src)
-            absolute_root_in_deploy = Path(dst, relative_root)
-            absolute_root_in_deploy.mkdir(parents=True, exist_ok=True)
-            for file in sorted(files):
-                absolute_file_in_project = Path(absolute_src, relative_root, file)
-                absolute_file_in_deploy = Path(absolute_root_in_deploy, file)
+        for relative_path, stat_result in walk_tree(absolute_src, include_dirs=True):
+            if stat.S_ISDIR(stat_result.st_mode):
+                Path(dst, relative_path).mkdir(parents=True, exist_ok=True)
+            else:
                 symlink_or_copy(
-                    src=absolute_file_in_project,
-                    dst=absolute_file_in_deploy,
+                    src=Path(absolute_src, relative_path),
+                    dst=Path(dst, relative_path),
                     deploy_root=deploy_root,
                 )
 
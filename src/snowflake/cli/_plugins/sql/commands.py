@@ -14,11 +14,20 @@
 
 from __future__ import annotations
 
+import itertools
 from pathlib import Path
 from typing import List, Optional
 
 import typer
-from snowflake.cli._plugins.sql.manager import SqlManager
+from click import UsageError
+from snowflake.cli._plugins.sql.manager import (
+    DEFAULT_BIND_BATCH_SIZE,
+    UNLOAD_DEFAULT_COMPRESSION,
+    SqlManager,
+    UnloadFormat,
+)
+from snowflake.cli._plugins.stage.manager import DEFAULT_MAX_CONCURRENT_GETS
+from snowflake.cli.api.cli_global_context import get_cli_context_manager
 from snowflake.cli.api.commands.decorators import with_project_definition
 from snowflake.cli.api.commands.flags import (
     variables_option,
@@ -26,13 +35,30 @@ from snowflake.cli.api.commands.flags import (
 from snowflake.cli.api.commands.overrideable_parameter import OverrideableOption
 from snowflake.cli.api.commands.snow_typer import SnowTyperFactory
 from snowflake.cli.api.commands.utils import parse_key_value_variables
-from snowflake.cli.api.output.types import CommandResult, MultipleResults, QueryResult
+from snowflake.cli.api.feature_flags import FeatureFlag
+from snowflake.cli.api.output.types import (
+    ArrowQueryResult,
+    CollectionResult,
+    CommandResult,
+    MultipleResults,
+    QueryResult,
+)
+from snowflake.connector.cursor import SnowflakeCursor
 
 # simple Typer with defaults because it won't become a command group as it contains only one command
 app = SnowTyperFactory()
 
 SOURCE_EXCLUSIVE_OPTIONS_NAMES = ["query", "files", "std_in"]
 
+
+def _bind_file_callback(value: Optional[Path]) -> Optional[Path]:
+    if value is not None:
+        # rows are bound on the server side, as required to bind whole batches at once;
+        # the parameter style is a property of the connection, not of its cursors
+        get_cli_context_manager().connection_context.update(paramstyle="qmark")
+    return value
+
+
 SourceOption = OverrideableOption(
     mutually_exclusive=SOURCE_EXCLUSIVE_OPTIONS_NAMES, show_default=False
 )
@@ -69,6 +95,73 @@ def execute_sql(
         "--retain-comments",
         help="Retains comments in queries passed to Snowflake",
     ),
+    async_batch: int = typer.Option(
+        1,
+        "--async-batch",
+        help="Number of statements executed at the same time. Results are still reported in the order of statements. "
+        "A statement preceded by a `-- !barrier` comment line, or changing the session (e.g. `USE` or `ALTER SESSION`), "
+        "starts only once all previous statements have completed.",
+        min=1,
+    ),
+    parallel_files: int = typer.Option(
+        1,
+        "--parallel-files",
+        help="Number of files executed at the same time, each on its own connection. Results are reported in the order of files. "
+        "If some files fail, the remaining files are still executed and the failures are reported at the end.",
+        min=1,
+    ),
+    bind_file: Optional[Path] = typer.Option(
+        None,
+        "--bind-file",
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+        readable=True,
+        help="CSV or JSON Lines (`.jsonl`) file with rows of values bound to the `?` placeholders of the query. "
+        "The query is executed for every row, in batches taking a single request each: "
+        "`INSERT` binds the whole batch at once, other statements are sent as one multi-statement request. "
+        "Requires `--query`.",
+        show_default=False,
+        callback=_bind_file_callback,
+    ),
+    bind_batch_size: int = typer.Option(
+        DEFAULT_BIND_BATCH_SIZE,
+        "--bind-batch-size",
+        help="Number of rows from `--bind-file` bound in a single execution of the query.",
+        min=1,
+    ),
+    bind_file_header: bool = typer.Option(
+        False,
+        "--bind-file-header",
+        help="Skips the first row of the CSV `--bind-file`, which contains column names.",
+        is_flag=True,
+    ),
+    output_dir: Optional[Path] = typer.Option(
+        None,
+        "--output-dir",
+        file_okay=False,
+        dir_okay=True,
+        help="Unloads the result of the last statement into files in this directory, instead of fetching it. "
+        "The result is written by `COPY INTO` to a temporary stage, from which the files are downloaded concurrently.",
+        show_default=False,
+    ),
+    unload_format: UnloadFormat = typer.Option(
+        UnloadFormat.CSV.value,
+        "--unload-format",
+        help="Format of the files written by `--output-dir`.",
+        case_sensitive=False,
+    ),
+    unload_compression: str = typer.Option(
+        UNLOAD_DEFAULT_COMPRESSION,
+        "--unload-compression",
+        help="Compression of the files written by `--output-dir`, for example `GZIP`, `SNAPPY` or `NONE`.",
+    ),
+    max_concurrent_gets: int = typer.Option(
+        DEFAULT_MAX_CONCURRENT_GETS,
+        "--max-concurrent-gets",
+        help="Maximum number of files downloaded at the same time by `--output-dir`.",
+        min=1,
+    ),
     **options,
 ) -> CommandResult:
     """
@@ -86,9 +179,70 @@ def execute_sql(
     if data_override:
         data = {v.key: v.value for v in parse_key_value_variables(data_override)}
 
+    if output_dir:
+        incompatible_options = [
+            option
+            for option, used in (
+                ("`--bind-file`", bind_file is not None),
+                ("`--async-batch`", async_batch > 1),
+                ("`--parallel-files`", parallel_files > 1),
+            )
+            if used
+        ]
+        if incompatible_options:
+            raise UsageError(
+                f"The `--output-dir` option cannot be used with {', '.join(incompatible_options)}."
+            )
+
+    if bind_file:
+        if not query:
+            raise UsageError("The `--bind-file` option requires `--query`.")
+        return CollectionResult(
+            SqlManager().execute_with_bind_file(
+                query,
+                bind_file,
+                batch_size=bind_batch_size,
+                data=data,
+                header=bind_file_header,
+            )
+        )
+
+    if output_dir:
+        single_statement, cursors, get_cursors = SqlManager().execute_unload(
+            query,
+            files,
+            std_in,
+            output_dir=output_dir,
+            data=data,
+            file_format=unload_format,
+            compression=unload_compression,
+            max_concurrent_gets=max_concurrent_gets,
+        )
+        unload_result = CollectionResult(
+            itertools.chain.from_iterable(QueryResult(c).result for c in get_cursors)
+        )
+        if single_statement:
+            return unload_result
+        # results of the previous statements are printed as usual
+        return MultipleResults(
+            itertools.chain((_query_result(c) for c in cursors), [unload_result])
+        )
+
     single_statement, cursors = SqlManager().execute(
-        query, files, std_in, data=data, retain_comments=retain_comments
+        query,
+        files,
+        std_in,
+        data=data,
+        retain_comments=retain_comments,
+        async_batch=async_batch,
+        parallel_files=parallel_files,
     )
     if single_statement:
-        return QueryResult(next(cursors))
-    return MultipleResults((QueryResult(c) for c in cursors))
+        return _query_result(next(cursors))
+    return MultipleResults((_query_result(c) for c in cursors))
+
+
+def _query_result(cursor: SnowflakeCursor) -> QueryResult:
+    if FeatureFlag.ENABLE_ARROW_QUERY_RESULTS.is_enabled():
+        return ArrowQueryResult(cursor)
+    return QueryResult(cursor)
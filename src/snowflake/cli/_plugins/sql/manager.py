@@ -14,22 +14,66 @@
 
 from __future__ import annotations
 
+import csv
+import json
+import re
 import sys
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from enum import Enum
 from io import StringIO
-from itertools import chain
+from itertools import chain, islice
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple
+from queue import Empty, SimpleQueue
+from typing import IO, Any, Deque, Dict, Generator, Iterable, List, Optional, Tuple
 
 from click import ClickException, UsageError
 from jinja2 import UndefinedError
 from snowflake.cli._plugins.sql.snowsql_templating import transpile_snowsql_templates
-from snowflake.cli.api.rendering.sql_templates import snowflake_sql_jinja_render
+from snowflake.cli._plugins.stage.manager import (
+    DEFAULT_MAX_CONCURRENT_GETS,
+    StageManager,
+)
+from snowflake.cli.api.cli_global_context import get_cli_context
+from snowflake.cli.api.console import cli_console
+from snowflake.cli.api.identifiers import FQN
+from snowflake.cli.api.rendering.sql_templates import (
+    snowflake_sql_jinja_render,
+    snowflake_sql_jinja_render_parts,
+    validate_sql_jinja_render_parts,
+)
 from snowflake.cli.api.secure_path import UNLIMITED, SecurePath
 from snowflake.cli.api.sql_execution import SqlExecutionMixin, VerboseCursor
-from snowflake.connector.cursor import SnowflakeCursor
+from snowflake.connector import SnowflakeConnection
+from snowflake.connector.cursor import DictCursor, SnowflakeCursor
 from snowflake.connector.util_text import split_statements
 
 IsSingleStatement = bool
+# (statement, whether all previous statements must complete before it is started)
+PipelinedStatement = Tuple[str, bool]
+
+ASYNC_POLL_INTERVAL_SECONDS = 0.2
+DEFAULT_BIND_BATCH_SIZE = 10_000
+BIND_FILE_FORMATS = (".csv", ".jsonl", ".ndjson")
+CSV_NULL_VALUES = ("", "\\N")
+UNLOAD_DEFAULT_COMPRESSION = "AUTO"
+BARRIER_COMMENT_REGEX = re.compile(
+    r"^\s*--\s*!barrier\s*$", re.MULTILINE | re.IGNORECASE
+)
+# Statements changing the state of the session, which later statements may depend on
+SESSION_STATEMENT_REGEX = re.compile(
+    r"^\s*(use|alter\s+session|set|unset|begin|start\s+transaction|commit|rollback|put|get)\b",
+    re.IGNORECASE,
+)
+
+
+class UnloadFormat(str, Enum):
+    CSV = "csv"
+    JSON = "json"
+    PARQUET = "parquet"
 
 
 class SqlManager(SqlExecutionMixin):
@@ -40,6 +84,8 @@ class SqlManager(SqlExecutionMixin):
         std_in: bool,
         data: Dict | None = None,
         retain_comments: bool = False,
+        async_batch: int = 1,
+        parallel_files: int = 1,
     ) -> Tuple[IsSingleStatement, Iterable[SnowflakeCursor]]:
         inputs = [query, files, std_in]
         # Check if any two inputs were provided simultaneously
@@ -49,41 +95,258 @@ class SqlManager(SqlExecutionMixin):
             )
 
         if std_in:
-            query = sys.stdin.read()
+            return self._execute_source(
+                source=None,
+                data=data,
+                retain_comments=retain_comments,
+                async_batch=async_batch,
+            )
         if query:
             return self._execute_single_query(
-                query=query, data=data, retain_comments=retain_comments
+                query=query,
+                data=data,
+                retain_comments=retain_comments,
+                async_batch=async_batch,
+            )
+
+        if files and parallel_files > 1 and len(files) > 1:
+            return False, self._execute_files_concurrently(
+                files=files,
+                parallel_files=parallel_files,
+                data=data,
+                retain_comments=retain_comments,
+                async_batch=async_batch,
             )
 
         if files:
-            # Multiple files
-            results = []
-            single_statement = False
+            # templates of all files are checked before any of them is executed
             for file in files:
-                query_from_file = SecurePath(file).read_text(
-                    file_size_limit_mb=UNLIMITED
-                )
-                single_statement, result = self._execute_single_query(
-                    query=query_from_file, data=data, retain_comments=retain_comments
+                self._validate_templates(file, data)
+
+            # Multiple files
+            results = [
+                self._execute_source(
+                    source=file,
+                    data=data,
+                    retain_comments=retain_comments,
+                    async_batch=async_batch,
+                    peek=len(files) == 1,
+                    validated=True,
                 )
-                results.append(result)
+                for file in files
+            ]
 
             # Use single_statement if there's only one, otherwise this is multi statement result
-            single_statement = len(files) == 1 and single_statement
-            return single_statement, chain.from_iterable(results)
+            single_statement = len(files) == 1 and results[0][0]
+            return single_statement, chain.from_iterable(
+                result for _, result in results
+            )
 
         # At that point, no stdin, query or files were provided
         raise UsageError("Use either query, filename or input option.")
 
+    def execute_with_bind_file(
+        self,
+        query: str,
+        bind_file: Path,
+        batch_size: int = DEFAULT_BIND_BATCH_SIZE,
+        data: Dict | None = None,
+        header: bool = False,
+    ) -> Generator[Dict, None, None]:
+        """
+        Executes the query for every row of a CSV or JSON Lines file, binding the values
+        of the row to the `?` placeholders of the query. Rows are read incrementally and
+        passed to executemany batch_size at a time. The connection has to bind them on
+        the server side, with the qmark parameter style, so that every batch takes a single request: INSERT statements are executed
+        once with array binding, other statements as a multi-statement request.
+        With header, the first row of a CSV file is skipped.
+        Yields a summary of every executed batch.
+        """
+        if bind_file.suffix.lower() not in BIND_FILE_FORMATS:
+            raise UsageError(
+                f"Unsupported bind file format: {bind_file.name}. "
+                f"Supported formats: {', '.join(BIND_FILE_FORMATS)}."
+            )
+        statements = self._split_single_statements(self._render_query(query, data))
+        if len(statements) != 1:
+            raise UsageError(
+                "The query used with a bind file must be a single statement."
+            )
+        return self._execute_bind_batches(
+            statements[0], _read_bind_rows(bind_file, header), batch_size
+        )
+
+    def execute_unload(
+        self,
+        query: str | None,
+        files: List[Path] | None,
+        std_in: bool,
+        output_dir: Path,
+        data: Dict | None = None,
+        file_format: UnloadFormat = UnloadFormat.CSV,
+        compression: str = UNLOAD_DEFAULT_COMPRESSION,
+        max_concurrent_gets: int = DEFAULT_MAX_CONCURRENT_GETS,
+    ) -> Tuple[IsSingleStatement, Iterable[SnowflakeCursor], Iterable[SnowflakeCursor]]:
+        """
+        Unloads the result of the last statement of the query (or files, or standard input)
+        into files in output_dir, instead of fetching it through the connection. The result
+        is written by COPY INTO to a temporary stage, and the produced files are downloaded
+        with up to max_concurrent_gets GETs at the same time.
+
+        Returns whether the last statement is the only one, the cursors of the previous
+        statements, executed as they are consumed, and the cursors of the executed GETs.
+        The previous statements are always executed before the unload.
+        """
+        if query:
+            statements: Iterable[str] = self._split_single_statements(
+                self._render_query(query, data)
+            )
+        elif std_in:
+            statements = self._read_statements(None, data, remove_comments=True)
+        else:
+            for file in files or []:
+                self._validate_templates(file, data)
+            statements = chain.from_iterable(
+                self._read_statements(file, data, remove_comments=True, validated=True)
+                for file in files or []
+            )
+
+        statements = iter(statements)
+        head = list(islice(statements, 2))
+        if not head:
+            raise UsageError("No statement to unload.")
+        statements = chain(head, statements)
+        last_statement: List[str] = []
+
+        def execute_previous_statements() -> Generator[SnowflakeCursor, None, None]:
+            statement = next(statements)
+            for next_statement in statements:
+                yield from self._execute_string(statement, cursor_class=VerboseCursor)
+                statement = next_statement
+            last_statement.append(statement)
+
+        previous_cursors = execute_previous_statements()
+
+        def unload() -> Generator[SnowflakeCursor, None, None]:
+            # executes previous statements whose results were not consumed
+            for _ in previous_cursors:
+                pass
+            yield from self._unload(
+                last_statement[0],
+                output_dir,
+                file_format,
+                compression,
+                max_concurrent_gets,
+            )
+
+        return len(head) == 1, previous_cursors, unload()
+
+    def _unload(
+        self,
+        statement: str,
+        output_dir: Path,
+        file_format: UnloadFormat,
+        compression: str,
+        max_concurrent_gets: int,
+    ) -> List[SnowflakeCursor]:
+        stage_manager = StageManager()
+        stage_fqn = FQN.from_stage(
+            f"snowflake_cli_tmp_unload_stage_{uuid.uuid4().hex}"
+        ).using_connection(conn=self._conn)
+        # Temporary stage, it will be dropped with end of session
+        stage_manager.create(stage_fqn, temporary=True)
+        stage_root = stage_manager.build_path(stage_fqn.identifier)
+
+        rows_unloaded = sum(
+            row.get("rows_unloaded") or 0
+            for row in self.execute_query(
+                self._unload_query(statement, stage_root.path_for_sql(), file_format)
+                + f" file_format = (type = {file_format.value} compression = {compression})"
+                + (" header = true" if file_format != UnloadFormat.JSON else ""),
+                cursor_class=DictCursor,
+            ).fetchall()
+        )
+        cli_console.step(f"Unloaded {rows_unloaded} rows, downloading files")
+
+        return stage_manager.get_recursive_concurrently(
+            stage_root.absolute_path(),
+            output_dir,
+            max_concurrent_gets=max_concurrent_gets,
+        )
+
+    @staticmethod
+    def _unload_query(statement: str, stage_path: str, file_format: UnloadFormat):
+        query = statement.strip().rstrip(";")
+        if file_format == UnloadFormat.JSON:
+            # JSON files are unloaded from a single column of objects
+            query = f"select object_construct(*) from ({query})"
+        return f"copy into {stage_path}/ from ({query})"
+
+    @staticmethod
+    def _split_single_statements(query: str) -> List[str]:
+        return [
+            statement
+            for statement, _ in split_statements(StringIO(query), remove_comments=True)
+            if statement
+        ]
+
+    def _execute_bind_batches(
+        self, statement: str, rows: Iterable[List[Any]], batch_size: int
+    ) -> Generator[Dict, None, None]:
+        if self._conn.is_pyformat:
+            raise ClickException(
+                "Binding rows from a file requires a connection using the qmark parameter style."
+            )
+        rows = iter(rows)
+        # executemany appends its own separator to statements other than INSERT
+        statement = statement.rstrip().rstrip(";")
+        cursor = self._conn.cursor()
+        batch_number = 0
+        while batch := list(islice(rows, batch_size)):
+            batch_number += 1
+            # INSERT statements bind the whole batch as arrays; other statements
+            # are sent as a single multi-statement request per batch
+            cursor.executemany(statement, batch, num_statements=1)
+            yield {
+                "batch": batch_number,
+                "rows": len(batch),
+                "rowcount": cursor.rowcount,
+            }
+
     def _execute_single_query(
-        self, query: str, data: Dict | None = None, retain_comments: bool = False
+        self,
+        query: str,
+        data: Dict | None = None,
+        retain_comments: bool = False,
+        async_batch: int = 1,
     ) -> Tuple[IsSingleStatement, Iterable[SnowflakeCursor]]:
+        return self._execute_rendered_query(
+            self._render_query(query, data),
+            retain_comments=retain_comments,
+            async_batch=async_batch,
+        )
+
+    @staticmethod
+    def _render_query(query: str, data: Dict | None = None) -> str:
         try:
             query = transpile_snowsql_templates(query)
-            query = snowflake_sql_jinja_render(content=query, data=data)
+            return snowflake_sql_jinja_render(content=query, data=data)
         except UndefinedError as err:
             raise ClickException(f"SQL template rendering error: {err}")
 
+    def _execute_rendered_query(
+        self,
+        query: str,
+        retain_comments: bool = False,
+        async_batch: int = 1,
+        verbose: bool = True,
+    ) -> Tuple[IsSingleStatement, Iterable[SnowflakeCursor]]:
+        if async_batch > 1:
+            pipelined = self._split_pipelined_statements(query, retain_comments)
+            return len(pipelined) == 1, self._execute_pipelined(
+                pipelined, async_batch, verbose
+            )
+
         statements = tuple(
             statement
             for statement, _ in split_statements(
@@ -93,5 +356,306 @@ class SqlManager(SqlExecutionMixin):
         single_statement = len(statements) == 1
 
         return single_statement, self._execute_string(
-            "\n".join(statements), cursor_class=VerboseCursor
+            "\n".join(statements),
+            cursor_class=VerboseCursor if verbose else SnowflakeCursor,
+        )
+
+    def _execute_source(
+        self,
+        source: Path | None,
+        data: Dict | None = None,
+        retain_comments: bool = False,
+        async_batch: int = 1,
+        peek: bool = True,
+        validated: bool = False,
+    ) -> Tuple[IsSingleStatement, Iterable[SnowflakeCursor]]:
+        """
+        Executes statements from a file, or from the standard input if source is None,
+        each as soon as it has been read, so that only one statement at a time is kept
+        in memory. With peek, the first two statements are read upfront to tell whether
+        the source consists of a single statement; otherwise, False is returned.
+        """
+        statements: Iterable = self._read_statements(
+            source,
+            data,
+            remove_comments=async_batch == 1 and not retain_comments,
+            validated=validated,
+        )
+        if async_batch > 1:
+            statements = self._pipelined_statements(statements, retain_comments)
+
+        single_statement = False
+        if peek:
+            head = list(islice(statements, 2))
+            single_statement = len(head) == 1
+            statements = chain(head, statements)
+
+        if async_batch > 1:
+            return single_statement, self._execute_pipelined(statements, async_batch)
+        return single_statement, chain.from_iterable(
+            self._execute_string(statement, cursor_class=VerboseCursor)
+            for statement in statements
+        )
+
+    def _read_statements(
+        self,
+        source: Path | None,
+        data: Dict | None,
+        remove_comments: bool,
+        validated: bool = False,
+    ) -> Generator[str, None, None]:
+        """
+        Reads the file (or the standard input, if source is None) incrementally,
+        yielding rendered statements one by one. SQL templates are rendered statement
+        by statement, as they cannot span multiple statements.
+
+        Unless the file has already been validated, its templates are checked upfront,
+        so that undefined variables or mixed syntax are reported before any statement
+        is executed. The standard input is not: each of its statements is rendered
+        right before being executed, so that they run as soon as they are read.
+        """
+        with self._open_source(source) as stream:
+            if source is not None and not validated:
+                self._validate_stream_templates(stream, data)
+                stream.seek(0)
+            try:
+                yield from snowflake_sql_jinja_render_parts(
+                    self._split_source_statements(stream, remove_comments), data
+                )
+            except UndefinedError as err:
+                raise ClickException(f"SQL template rendering error: {err}")
+
+    def _validate_templates(self, source: Path, data: Dict | None) -> None:
+        with self._open_source(source) as stream:
+            self._validate_stream_templates(stream, data)
+
+    def _validate_stream_templates(self, stream: IO[str], data: Dict | None) -> None:
+        try:
+            validate_sql_jinja_render_parts(
+                self._split_source_statements(stream, remove_comments=True), data
+            )
+        except UndefinedError as err:
+            raise ClickException(f"SQL template rendering error: {err}")
+
+    @staticmethod
+    @contextmanager
+    def _open_source(source: Path | None) -> Generator[IO[str], None, None]:
+        if source is None:
+            yield sys.stdin
+            return
+        with SecurePath(source).open("r", read_file_limit_mb=UNLIMITED) as stream:
+            yield stream
+
+    @staticmethod
+    def _split_source_statements(
+        stream: IO[str], remove_comments: bool
+    ) -> Generator[str, None, None]:
+        return (
+            transpile_snowsql_templates(statement)
+            for statement, _ in split_statements(
+                stream, remove_comments=remove_comments
+            )
+            if statement
         )
+
+    def _execute_files_concurrently(
+        self,
+        files: List[Path],
+        parallel_files: int,
+        data: Dict | None = None,
+        retain_comments: bool = False,
+        async_batch: int = 1,
+    ) -> Generator[SnowflakeCursor, None, None]:
+        """
+        Executes files at the same time, each on its own connection from a pool of up to
+        parallel_files connections opened with the parameters of the current one.
+
+        Cursors are yielded in the order of files: those of a file as soon as it and all
+        the files before it have completed, so that the output does not depend on timing.
+        A failing file does not stop the other ones; failures are reported together once
+        all files have been executed.
+        """
+        # templates are rendered upfront, as rendering depends on the CLI context
+        queries = [
+            self._render_query(
+                SecurePath(file).read_text(file_size_limit_mb=UNLIMITED), data
+            )
+            for file in files
+        ]
+        connection_context = get_cli_context().connection_context
+        pool: SimpleQueue[SnowflakeConnection] = SimpleQueue()
+        pool.put(self._conn)
+        opened_connections: List[SnowflakeConnection] = []
+
+        def execute_file(
+            query: str,
+        ) -> Tuple[List[SnowflakeCursor], Optional[Exception]]:
+            try:
+                connection = pool.get_nowait()
+            except Empty:
+                try:
+                    connection = connection_context.build_connection()
+                except Exception as err:
+                    return [], err
+                opened_connections.append(connection)
+
+            cursors: List[SnowflakeCursor] = []
+            try:
+                manager = SqlManager(connection)
+                _, results = manager._execute_rendered_query(  # noqa: SLF001
+                    query,
+                    retain_comments=retain_comments,
+                    async_batch=async_batch,
+                    verbose=False,
+                )
+                cursors.extend(results)
+            except Exception as err:
+                return cursors, err
+            finally:
+                pool.put(connection)
+            return cursors, None
+
+        failures: List[Tuple[Path, Exception]] = []
+        try:
+            with ThreadPoolExecutor(max_workers=parallel_files) as executor:
+                futures = [executor.submit(execute_file, query) for query in queries]
+                for file, future in zip(files, futures):
+                    cursors, error = future.result()
+                    cli_console.step(f"Results of {file}")
+                    for cursor in cursors:
+                        cli_console.message(cursor.query)
+                        yield cursor
+                    if error is not None:
+                        failures.append((file, error))
+        finally:
+            for connection in opened_connections:
+                connection.close()
+
+        if failures:
+            raise ClickException(
+                f"Execution of {len(failures)} of {len(files)} files failed:\n"
+                + "\n".join(f"{file}: {error}" for file, error in failures)
+            )
+
+    @classmethod
+    def _split_pipelined_statements(
+        cls, query: str, retain_comments: bool = False
+    ) -> List[PipelinedStatement]:
+        return list(cls._pipelined_statements([query], retain_comments))
+
+    @staticmethod
+    def _pipelined_statements(
+        parts: Iterable[str], retain_comments: bool = False
+    ) -> Generator[PipelinedStatement, None, None]:
+        """
+        Splits parts of a query (e.g. rendered statements, which may expand to several
+        statements) into statements, and marks those before which all previous statements
+        must complete: statements preceded by a `-- !barrier` comment line, and statements
+        changing the session, such as USE or ALTER SESSION.
+        """
+        barrier = False
+        for part in parts:
+            for raw_statement, _ in split_statements(
+                StringIO(part), remove_comments=False
+            ):
+                barrier = (
+                    barrier or BARRIER_COMMENT_REGEX.search(raw_statement) is not None
+                )
+                # comment only statements are skipped, a barrier applies to the next one
+                for statement, _ in split_statements(
+                    StringIO(raw_statement), remove_comments=True
+                ):
+                    if not statement:
+                        continue
+                    is_barrier = barrier or bool(
+                        SESSION_STATEMENT_REGEX.match(statement)
+                    )
+                    yield (raw_statement if retain_comments else statement), is_barrier
+                    barrier = False
+
+    def _execute_pipelined(
+        self,
+        statements: Iterable[PipelinedStatement],
+        async_batch: int,
+        verbose: bool = True,
+    ) -> Generator[SnowflakeCursor, None, None]:
+        """
+        Executes statements asynchronously, with up to async_batch of them running at
+        the same time, and yields their cursors in the original order of statements.
+        Statements marked as barriers are started only once all previous statements
+        complete, and execute synchronously, so that later statements see their effects.
+
+        If a statement fails, no new statement is started; statements that are already
+        running are awaited, then the error is raised.
+        """
+        pending: Deque[SnowflakeCursor] = deque()
+        try:
+            for statement, barrier in statements:
+                if barrier:
+                    while pending:
+                        yield self._wait_for_results(pending.popleft())
+                cursor = self._conn.cursor()
+                if verbose:
+                    cli_console.message(statement)
+                if barrier:
+                    cursor.execute(statement)
+                    yield cursor
+                    continue
+                cursor.execute_async(statement)
+                pending.append(cursor)
+                if len(pending) >= async_batch:
+                    yield self._wait_for_results(pending.popleft())
+            while pending:
+                yield self._wait_for_results(pending.popleft())
+        except Exception:
+            for cursor in pending:
+                try:
+                    self._wait_for_results(cursor)
+                except Exception:
+                    self._log.debug("Statement %s failed", cursor.sfqid, exc_info=True)
+            raise
+
+    def _wait_for_results(self, cursor: SnowflakeCursor) -> SnowflakeCursor:
+        while self._conn.is_still_running(self._conn.get_query_status(cursor.sfqid)):
+            time.sleep(ASYNC_POLL_INTERVAL_SECONDS)
+        # raises if the statement failed
+        cursor.get_results_from_sfqid(cursor.sfqid)
+        return cursor
+
+
+def _read_bind_rows(
+    bind_file: Path, header: bool = False
+) -> Generator[List[Any], None, None]:
+    """
+    Reads rows of values from a CSV file, or a JSON Lines file containing an array
+    or an object per line, one row at a time. CSV values are read as strings, except
+    empty and `\\N` values, which are read as NULL. With header, the first row of
+    a CSV file is skipped.
+    """
+    is_csv = bind_file.suffix.lower() == ".csv"
+    with SecurePath(bind_file).open(
+        "r", read_file_limit_mb=UNLIMITED, newline="" if is_csv else None
+    ) as f:
+        if is_csv:
+            reader = csv.reader(f)
+            if header:
+                next(reader, None)
+            for row in reader:
+                yield [None if value in CSV_NULL_VALUES else value for value in row]
+            return
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as err:
+                raise ClickException(
+                    f"Invalid JSON in {bind_file.name}, line {line_number}: {err}"
+                )
+            if isinstance(row, dict):
+                row = list(row.values())
+            if not isinstance(row, list):
+                raise ClickException(
+                    f"Expected an array or an object in {bind_file.name}, line {line_number}."
+                )
+            yield row
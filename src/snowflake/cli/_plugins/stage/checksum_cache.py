@@ -0,0 +1,234 @@
+# Copyright (c) 2024 Snowflake Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Generator, Optional, Tuple
+
+from snowflake.cli.api.cache_files import (
+    config_dir_cache_path,
+    read_cache_file,
+    write_cache_file,
+)
+from snowflake.cli.api.feature_flags import FeatureFlag
+from snowflake.cli.api.secure_path import SecurePath
+
+CHECKSUM_CACHE_FILE_NAME = ".stage_checksums.cache"
+CHECKSUM_CACHE_VERSION = 1
+DEFAULT_MAX_ENTRIES = 100_000
+
+# Files modified this recently are not cached, as a later modification within
+# the same mtime tick would go unnoticed (the "racy git" problem).
+RACY_MTIME_WINDOW_NS = 2 * 10**9
+
+# Reading an entry refreshes its last use time only if it is older than this, so that
+# runs which find every checksum in the cache do not need to rewrite the cache file.
+LAST_USED_RESOLUTION_SECONDS = 24 * 60 * 60
+
+# key used for the plain (single-part) md5sum of a file
+PLAIN_MD5_KEY = "md5"
+
+log = logging.getLogger(__name__)
+
+FileSignature = Tuple[int, int, int]  # (size, mtime_ns, inode)
+
+
+def _file_signature(stat_result: os.stat_result) -> FileSignature:
+    return stat_result.st_size, stat_result.st_mtime_ns, stat_result.st_ino
+
+
+def _chunk_key(chunk_size: int | None) -> str:
+    return str(chunk_size) if chunk_size else PLAIN_MD5_KEY
+
+
+@dataclass
+class _CacheEntry:
+    signature: FileSignature
+    last_used: float
+    checksums: Dict[str, str] = field(default_factory=dict)
+
+    def to_json(self) -> list:
+        return [*self.signature, self.last_used, self.checksums]
+
+    @classmethod
+    def from_json(cls, data: list) -> _CacheEntry:
+        size, mtime_ns, inode, last_used, checksums = data
+        return cls(
+            signature=(int(size), int(mtime_ns), int(inode)),
+            last_used=float(last_used),
+            checksums=dict(checksums),
+        )
+
+
+class ChecksumCache:
+    """
+    Persistent cache of local file md5sums (plain and multi-part), keyed by the
+    absolute path of a file together with its size, mtime and inode. An entry is
+    invalidated as soon as any of these change. The cache holds at most
+    max_entries files; the least recently used entries are evicted on save.
+    The cache can be shared between hashing threads.
+    """
+
+    def __init__(self, cache_file: SecurePath, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self._cache_file = cache_file
+        self._max_entries = max_entries
+        self._entries: Dict[str, _CacheEntry] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def default_cache_file() -> SecurePath:
+        return config_dir_cache_path(CHECKSUM_CACHE_FILE_NAME)
+
+    @classmethod
+    def load(
+        cls,
+        cache_file: Optional[SecurePath] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> ChecksumCache:
+        cache = cls(cache_file or cls.default_cache_file(), max_entries=max_entries)
+        cache.read()
+        return cache
+
+    def read(self) -> None:
+        """
+        Replaces the in-memory entries with the contents of the cache file.
+        A missing, outdated or corrupted cache file results in an empty cache.
+        """
+        entries = read_cache_file(
+            self._cache_file,
+            CHECKSUM_CACHE_VERSION,
+            lambda data: {
+                path: _CacheEntry.from_json(entry)
+                for path, entry in data["entries"].items()
+            },
+        )
+        self._entries = entries or {}
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self,
+        file: Path,
+        chunk_size: int | None = None,
+        stat_result: Optional[os.stat_result] = None,
+    ) -> str | None:
+        """
+        Returns the cached md5sum of the given file for the given chunk size,
+        or None if it is not known or the file has changed since it was cached.
+        A stat result of the file obtained by the caller can be passed to avoid another stat.
+        """
+        key = str(file.absolute())
+        signature = _file_signature(stat_result or os.stat(file))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            if entry.signature != signature:
+                del self._entries[key]
+                self._dirty = True
+                return None
+
+            now = time.time()
+            if now - entry.last_used > LAST_USED_RESOLUTION_SECONDS:
+                entry.last_used = now
+                self._dirty = True
+            return entry.checksums.get(_chunk_key(chunk_size))
+
+    def put(
+        self,
+        file: Path,
+        chunk_size: int | None,
+        checksum: str,
+        stat_result: Optional[os.stat_result] = None,
+    ) -> None:
+        """
+        Stores the md5sum computed for the given file and chunk size. Other checksums
+        already known for the file are kept, unless the file has changed.
+        If given, stat_result should be obtained before the file was hashed.
+        """
+        stat_result = stat_result or os.stat(file)
+        if time.time_ns() - stat_result.st_mtime_ns < RACY_MTIME_WINDOW_NS:
+            log.debug("Not caching checksum of recently modified file %s", file)
+            return
+
+        key = str(file.absolute())
+        signature = _file_signature(stat_result)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.signature != signature:
+                entry = _CacheEntry(signature=signature, last_used=time.time())
+                self._entries[key] = entry
+
+            entry.checksums[_chunk_key(chunk_size)] = checksum
+            entry.last_used = time.time()
+            self._dirty = True
+
+    def invalidate(self, file: Path) -> None:
+        with self._lock:
+            if self._entries.pop(str(file.absolute()), None) is not None:
+                self._dirty = True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = {}
+            self._dirty = True
+
+    def _evict(self) -> None:
+        excess = len(self._entries) - self._max_entries
+        if excess <= 0:
+            return
+        least_recently_used = sorted(
+            self._entries, key=lambda path: self._entries[path].last_used
+        )
+        for path in least_recently_used[:excess]:
+            del self._entries[path]
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+
+        self._evict()
+        entries = {path: entry.to_json() for path, entry in self._entries.items()}
+        if write_cache_file(
+            self._cache_file, CHECKSUM_CACHE_VERSION, {"entries": entries}
+        ):
+            self._dirty = False
+
+
+@contextmanager
+def checksum_cache() -> Generator[Optional[ChecksumCache], None, None]:
+    """
+    Yields the persistent checksum cache if it is enabled, otherwise None.
+    The cache is saved when the context exits.
+    """
+    if not FeatureFlag.ENABLE_STAGE_CHECKSUM_CACHE.is_enabled():
+        yield None
+        return
+
+    cache = ChecksumCache.load()
+    try:
+        yield cache
+    finally:
+        cache.save()
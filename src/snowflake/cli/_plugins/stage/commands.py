@@ -29,14 +29,21 @@ from snowflake.cli._plugins.stage.diff import (
     DiffResult,
     compute_stage_diff,
 )
-from snowflake.cli._plugins.stage.manager import StageManager
+from snowflake.cli._plugins.stage.manager import (
+    DEFAULT_LOAD_BATCH_FILES,
+    DEFAULT_MAX_CONCURRENT_LISTS,
+    DEFAULT_MAX_CONCURRENT_PUTS,
+    StageManager,
+)
 from snowflake.cli._plugins.stage.utils import print_diff_to_console
 from snowflake.cli.api.cli_global_context import get_cli_context
 from snowflake.cli.api.commands.common import OnErrorType
 from snowflake.cli.api.commands.flags import (
+    ExecuteParallelOption,
     ExecuteVariablesOption,
     OnErrorOption,
     PatternOption,
+    identifier_argument,
     identifier_stage_argument,
     identifier_stage_path_argument,
     like_option,
@@ -79,13 +86,33 @@ add_object_command_aliases(
 
 @app.command("list-files", requires_connection=True)
 def stage_list_files(
-    stage_name: str = StagePathArgument, pattern=PatternOption, **options
+    stage_name: str = StagePathArgument,
+    pattern=PatternOption,
+    prefixes: Optional[List[str]] = typer.Option(
+        None,
+        "--prefix",
+        help="Lists only the files whose path starts with the given prefix, relative to the stage path. "
+        "Can be specified multiple times, in which case the prefixes are listed concurrently.",
+        show_default=False,
+    ),
+    max_concurrent_lists: int = typer.Option(
+        DEFAULT_MAX_CONCURRENT_LISTS,
+        help="Maximum number of prefixes listed at the same time.",
+        min=1,
+    ),
+    **options,
 ) -> CommandResult:
     """
     Lists the stage contents.
     """
-    cursor = StageManager().list_files(stage_name=stage_name, pattern=pattern)
-    return QueryResult(cursor)
+    return CollectionResult(
+        StageManager().iter_files(
+            stage_name,
+            pattern=pattern,
+            prefixes=prefixes,
+            max_concurrent_lists=max_concurrent_lists,
+        )
+    )
 
 
 @app.command("copy", requires_connection=True)
@@ -95,7 +122,7 @@ def copy(
         show_default=False,
     ),
     destination_path: str = typer.Argument(
-        help="Target directory path for copy operation. Should be stage if source is local or local if source is stage.",
+        help="Target directory path for copy operation. Should be stage if source is local or local if source is stage. If both paths are stages, files are copied on the server side.",
         show_default=False,
     ),
     overwrite: bool = typer.Option(
@@ -114,22 +141,55 @@ def copy(
         default=False,
         help="Specifies whether Snowflake uses gzip to compress files during upload. Ignored when downloading.",
     ),
+    sync: bool = typer.Option(
+        False,
+        "--sync",
+        help="Downloads only files which are missing locally or differ from the files on the stage. Requires `--recursive`. "
+        "When copying between stages, copies only files which are missing from or differ from the files on the target stage.",
+        is_flag=True,
+    ),
+    pattern=PatternOption,
+    max_concurrent_puts: int = typer.Option(
+        DEFAULT_MAX_CONCURRENT_PUTS,
+        "--max-concurrent-puts",
+        help="Maximum number of directories uploaded at the same time when copying files recursively to a stage Concurrent uploads run in separate cursors of the single connection used by the command.",
+        min=1,
+    ),
     **options,
 ) -> CommandResult:
     """
     Copies all files from target path to target directory. This works for both uploading
-    to and downloading files from the stage.
+    to and downloading files from the stage, as well as for copying files between stages.
     """
     is_get = is_stage_path(source_path)
     is_put = is_stage_path(destination_path)
 
+    if not is_get and not is_put:
+        raise click.ClickException(
+            "Both source and target path are local. This operation is not supported."
+        )
+
     if is_get and is_put:
+        _check_no_upload_options_for_stage_to_stage_copy()
+        cursors = StageManager().copy_stage_to_stage(
+            source_path=source_path,
+            destination_path=destination_path,
+            recursive=recursive,
+            pattern=pattern,
+            only_changed=sync,
+        )
+        return CollectionResult(
+            itertools.chain.from_iterable(QueryResult(c).result for c in cursors)
+        )
+
+    if sync and not (is_get and recursive):
         raise click.ClickException(
-            "Both source and target path are remote. This operation is not supported."
+            "The `--sync` flag can only be used when downloading files with `--recursive`"
+            " or when copying files between stages."
         )
-    if not is_get and not is_put:
+    if pattern is not None:
         raise click.ClickException(
-            "Both source and target path are local. This operation is not supported."
+            "The `--pattern` option can only be used when copying files between stages."
         )
 
     if is_get:
@@ -138,6 +198,7 @@ def copy(
             source_path=source_path,
             destination_path=destination_path,
             parallel=parallel,
+            sync=sync,
         )
     return _put(
         recursive=recursive,
@@ -146,6 +207,91 @@ def copy(
         parallel=parallel,
         overwrite=overwrite,
         auto_compress=auto_compress,
+        max_concurrent_puts=max_concurrent_puts,
+    )
+
+
+def _check_no_upload_options_for_stage_to_stage_copy():
+    from click.core import ParameterSource  # type: ignore
+
+    ctx = click.get_current_context()
+    # COPY FILES has no equivalent of these options, they only apply to PUT and GET
+    passed_options = [
+        f"`--{name.replace('_', '-')}`"
+        for name in ("overwrite", "parallel", "auto_compress", "max_concurrent_puts")
+        if ctx.get_parameter_source(name) != ParameterSource.DEFAULT  # type: ignore
+    ]
+    if passed_options:
+        raise click.UsageError(
+            f"{', '.join(passed_options)} cannot be used when copying files between stages."
+        )
+
+
+@app.command("load", requires_connection=True)
+def stage_load(
+    source_path: Path = typer.Argument(
+        help="Local file, directory or glob pattern of the files to load. Glob patterns have to be enclosed in quotes.",
+        show_default=False,
+    ),
+    table_name: FQN = identifier_argument(sf_object="table", example="my_table"),
+    file_format: Optional[str] = typer.Option(
+        None,
+        "--file-format",
+        help="Name of an existing file format used to load the files.",
+        show_default=False,
+    ),
+    file_format_options: Optional[str] = typer.Option(
+        None,
+        "--file-format-options",
+        help='File format options used to load the files, for example "type = csv skip_header = 1". '
+        "If neither `--file-format` nor `--file-format-options` is specified, the format is inferred from file extensions.",
+        show_default=False,
+    ),
+    copy_options: Optional[str] = typer.Option(
+        None,
+        "--copy-options",
+        help='Additional options of the `COPY INTO` statement, for example "on_error = continue".',
+        show_default=False,
+    ),
+    batch_size: int = typer.Option(
+        DEFAULT_LOAD_BATCH_FILES,
+        "--batch-size",
+        help="Maximum number of files uploaded and loaded together.",
+        min=1,
+    ),
+    parallel: int = typer.Option(
+        4,
+        help="Number of parallel threads to use when uploading files.",
+    ),
+    auto_compress: bool = typer.Option(
+        default=False,
+        help="Specifies whether Snowflake uses gzip to compress files during upload.",
+    ),
+    max_concurrent_puts: int = typer.Option(
+        DEFAULT_MAX_CONCURRENT_PUTS,
+        "--max-concurrent-puts",
+        help="Maximum number of batches uploaded at the same time Concurrent uploads run in separate cursors of the single connection used by the command.",
+        min=1,
+    ),
+    **options,
+) -> CommandResult:
+    """
+    Loads local files into a table. Files are uploaded in batches to a temporary stage,
+    and each batch is loaded with `COPY INTO` as soon as it is uploaded, while next
+    batches are still uploading.
+    """
+    return CollectionResult(
+        StageManager().load_files(
+            local_path=source_path,
+            table=table_name,
+            file_format=file_format,
+            file_format_options=file_format_options,
+            copy_options=copy_options,
+            batch_size=batch_size,
+            parallel=parallel,
+            auto_compress=auto_compress,
+            max_concurrent_puts=max_concurrent_puts,
+        )
     )
 
 
@@ -186,13 +332,20 @@ def stage_diff(
         help="Path to local folder",
         show_default=False,
     ),
+    hash_workers: Optional[int] = typer.Option(
+        None,
+        "--hash-workers",
+        help="Number of threads used to compute checksums of local files. Defaults to the `hash_workers` option of the `[cli.stage]` configuration section, or a value based on the number of CPUs.",
+        min=1,
+        show_default=False,
+    ),
     **options,
 ) -> Optional[CommandResult]:
     """
     Diffs a stage with a local folder.
     """
     diff: DiffResult = compute_stage_diff(
-        local_root=Path(folder_name), stage_fqn=stage_name
+        local_root=Path(folder_name), stage_fqn=stage_name, hash_workers=hash_workers
     )
     if get_cli_context().output_format == OutputFormat.JSON:
         return ObjectResult(diff.to_dict())
@@ -210,6 +363,7 @@ def execute(
     ),
     on_error: OnErrorType = OnErrorOption,
     variables: Optional[List[str]] = ExecuteVariablesOption,
+    parallel: int = ExecuteParallelOption,
     **options,
 ):
     """
@@ -217,12 +371,21 @@ def execute(
     e.g. `@stage/*.sql`, `@stage/dev/*`. Only files with `.sql` extension will be executed.
     """
     results = StageManager().execute(
-        stage_path_str=stage_path, on_error=on_error, variables=variables
+        stage_path_str=stage_path,
+        on_error=on_error,
+        variables=variables,
+        parallel=parallel,
     )
     return CollectionResult(results)
 
 
-def get(recursive: bool, source_path: str, destination_path: str, parallel: int):
+def get(
+    recursive: bool,
+    source_path: str,
+    destination_path: str,
+    parallel: int,
+    sync: bool = False,
+):
     target = Path(destination_path).resolve()
     if not recursive:
         cli_console.warning(
@@ -233,9 +396,14 @@ def get(recursive: bool, source_path: str, destination_path: str, parallel: int)
         )
         return QueryResult(cursor)
 
-    cursors = StageManager().get_recursive(
-        stage_path=source_path, dest_path=target, parallel=parallel
-    )
+    if sync:
+        cursors = StageManager().get_recursive_sync(
+            stage_path=source_path, dest_path=target, parallel=parallel
+        )
+    else:
+        cursors = StageManager().get_recursive(
+            stage_path=source_path, dest_path=target, parallel=parallel
+        )
     results = [list(QueryResult(c).result) for c in cursors]
     flattened_results = list(itertools.chain.from_iterable(results))
     sorted_results = sorted(
@@ -252,6 +420,7 @@ def _put(
     parallel: int,
     overwrite: bool,
     auto_compress: bool,
+    max_concurrent_puts: int = DEFAULT_MAX_CONCURRENT_PUTS,
 ):
     if recursive and not source_path.is_file():
         cursor_generator = StageManager().put_recursive(
@@ -260,6 +429,7 @@ def _put(
             overwrite=overwrite,
             parallel=parallel,
             auto_compress=auto_compress,
+            max_concurrent_puts=max_concurrent_puts,
         )
         return CollectionResult(cursor_generator)
     else:
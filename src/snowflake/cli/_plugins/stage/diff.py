@@ -15,54 +15,186 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass, field
+import os
+import sys
+import time
+from array import array
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from enum import IntEnum
 from pathlib import Path, PurePosixPath
-from typing import Collection, Dict, List, Optional, Tuple
+from typing import Any, Collection, Dict, Iterable, Iterator, List, Optional, Tuple
 
+from click import ClickException
 from snowflake.cli._plugins.nativeapp.artifacts import BundleMap
+from snowflake.cli.api.config import get_config_value
 from snowflake.cli.api.exceptions import (
     SnowflakeSQLExecutionError,
 )
-from snowflake.connector.cursor import DictCursor
-
-from .manager import StageManager
-from .md5 import UnknownMD5FormatError, file_matches_md5sum
+from snowflake.cli.api.feature_flags import FeatureFlag
+from snowflake.cli.api.utils.path_utils import walk_tree
+
+from .checksum_cache import ChecksumCache, checksum_cache
+from .manager import STAGE_SECTION_PATH, StageManager
+from .manifest import (
+    DEPLOY_MANIFEST_FILE_NAME,
+    DeployManifest,
+    ManifestEntry,
+    load_deploy_manifest,
+    save_deploy_manifest,
+)
+from .md5 import (
+    UnknownMD5FormatError,
+    compute_md5sums_cached,
+    file_matches_md5sum,
+)
 
 log = logging.getLogger(__name__)
 
 StagePathType = PurePosixPath  # alias PurePosixPath as StagePath for clarity
 
 
-@dataclass
-class DiffResult:
+class DiffStatus(IntEnum):
+    IDENTICAL = 0
+    DIFFERENT = 1
+    ONLY_LOCAL = 2
+    ONLY_ON_STAGE = 3
+
+
+def _stage_path_sort_key(path: str) -> List[str]:
+    # orders '/'-separated strings the same way as the corresponding StagePathType objects
+    return path.split("/")
+
+
+class _PathsView(list):
     """
-    Each collection is a list of stage paths ('/'-separated, regardless of the platform), relative to the stage root.
+    Read-only list of the paths with one status, built on access. Modifying it in place
+    would have no effect on the diff, so it raises instead.
     """
 
-    identical: List[StagePathType] = field(default_factory=list)
-    "Files with matching md5sums"
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(
+            "Paths of a DiffResult are built on access and cannot be modified in place; "
+            "assign a new list to the attribute or use DiffResult.add or DiffResult.add_paths instead"
+        )
 
-    different: List[StagePathType] = field(default_factory=list)
-    "Files that may be different between the stage and the local directory"
+    append = extend = insert = remove = pop = clear = sort = reverse = _read_only
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
 
-    only_local: List[StagePathType] = field(default_factory=list)
-    "Files that only exist in the local directory"
 
-    only_on_stage: List[StagePathType] = field(default_factory=list)
-    "Files that only exist on the stage"
+def _status_property(status: DiffStatus, doc: str) -> property:
+    def getter(self: DiffResult) -> List[StagePathType]:
+        return _PathsView(StagePathType(p) for p in self.paths_with_status(status))
 
-    def has_changes(self) -> bool:
-        return (
-            len(self.different) > 0
-            or len(self.only_local) > 0
-            or len(self.only_on_stage) > 0
+    def setter(self: DiffResult, paths: Iterable[StagePathType | str]) -> None:
+        self.set_paths(status, paths)
+
+    return property(getter, setter, doc=doc)
+
+
+class DiffResult:
+    """
+    Stage paths ('/'-separated, regardless of the platform) relative to the stage root, with the status of each.
+
+    To keep diffs of very large stages small, paths are stored as interned strings in a single column, with their
+    statuses in a parallel byte array. The lists of StagePathType exposed by identical, different, only_local and
+    only_on_stage are built on access and are read-only; assign to them (or use add) to modify the diff.
+    """
+
+    identical = _status_property(DiffStatus.IDENTICAL, "Files with matching md5sums")
+    different = _status_property(
+        DiffStatus.DIFFERENT,
+        "Files that may be different between the stage and the local directory",
+    )
+    only_local = _status_property(
+        DiffStatus.ONLY_LOCAL, "Files that only exist in the local directory"
+    )
+    only_on_stage = _status_property(
+        DiffStatus.ONLY_ON_STAGE, "Files that only exist on the stage"
+    )
+
+    def __init__(
+        self,
+        identical: Iterable[StagePathType | str] = (),
+        different: Iterable[StagePathType | str] = (),
+        only_local: Iterable[StagePathType | str] = (),
+        only_on_stage: Iterable[StagePathType | str] = (),
+        upload_status: Optional[Dict[StagePathType, str]] = None,
+        manifest: Optional[DeployManifest] = None,
+    ):
+        self._paths: List[str] = []
+        self._statuses = array("B")
+        for status, paths in zip(
+            DiffStatus, [identical, different, only_local, only_on_stage]
+        ):
+            for path in paths:
+                self.add(path, status)
+
+        self.upload_status: Dict[StagePathType, str] = upload_status or {}
+        "Status reported by PUT (e.g. UPLOADED or SKIPPED) for each file uploaded when syncing the diff"
+
+        self.manifest: Optional[DeployManifest] = manifest
+        "Known state of the whole stage, if deploy manifests are enabled. Updated and uploaded when syncing the diff"
+
+    def add(self, path: StagePathType | str, status: DiffStatus) -> None:
+        self._paths.append(sys.intern(str(path)))
+        self._statuses.append(status)
+
+    def add_paths(
+        self, paths: Iterable[StagePathType | str], status: DiffStatus
+    ) -> None:
+        for path in paths:
+            self.add(path, status)
+
+    def entries(self) -> Iterator[Tuple[str, int]]:
+        """Yields (path, status) pairs, with paths as strings, in the order they were added."""
+        return zip(self._paths, self._statuses)
+
+    def paths_with_status(self, status: DiffStatus) -> Iterator[str]:
+        """Yields the paths with the given status, as strings, in the order they were added."""
+        return (p for p, s in self.entries() if s == status)
+
+    def set_paths(
+        self, status: DiffStatus, paths: Iterable[StagePathType | str]
+    ) -> None:
+        """Replaces all paths with the given status."""
+        paths = list(paths)
+        kept = [(p, s) for p, s in self.entries() if s != status]
+        self._paths = [p for p, _ in kept]
+        self._statuses = array("B", [s for _, s in kept])
+        self.add_paths(paths, status)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DiffResult):
+            return NotImplemented
+        return all(
+            list(self.paths_with_status(status))
+            == list(other.paths_with_status(status))
+            for status in DiffStatus
+        )
+
+    def __repr__(self) -> str:
+        counts = ", ".join(
+            f"{status.name.lower()}={self._statuses.count(status)}"
+            for status in DiffStatus
         )
+        return f"DiffResult({counts})"
+
+    def has_changes(self) -> bool:
+        return self._statuses.count(DiffStatus.IDENTICAL) != len(self._statuses)
 
     def to_dict(self) -> dict:
+        def sorted_paths(status: DiffStatus) -> List[str]:
+            return sorted(self.paths_with_status(status), key=_stage_path_sort_key)
+
         return {
-            "modified": [str(p) for p in sorted(self.different)],
-            "added": [str(p) for p in sorted(self.only_local)],
-            "deleted": [str(p) for p in sorted(self.only_on_stage)],
+            "modified": sorted_paths(DiffStatus.DIFFERENT),
+            "added": sorted_paths(DiffStatus.ONLY_LOCAL),
+            "deleted": sorted_paths(DiffStatus.ONLY_ON_STAGE),
         }
 
 
@@ -73,14 +205,7 @@ def enumerate_files(path: Path) -> List[Path]:
     if not path.is_dir():
         raise ValueError("Path must point to a directory")
 
-    paths: List[Path] = []
-    for child in sorted(path.iterdir()):
-        if child.is_dir():
-            paths += enumerate_files(child)
-        else:
-            paths.append(child)
-
-    return paths
+    return [path / relative_path for relative_path, _ in walk_tree(path)]
 
 
 def strip_stage_name(path: str) -> StagePathType:
@@ -88,14 +213,17 @@ def strip_stage_name(path: str) -> StagePathType:
     return StagePathType(*path.split("/")[1:])
 
 
-def build_md5_map(list_stage_cursor: DictCursor) -> Dict[StagePathType, Optional[str]]:
+def build_md5_map(stage_files: Iterable[Dict[str, Any]]) -> Dict[str, Optional[str]]:
     """
-    Returns a mapping of relative stage paths to their md5sums.
+    Returns a mapping of relative stage paths, as interned '/'-separated strings, to their md5sums.
+    Accepts a cursor of a stage listing, or any other iterable of the listed rows.
     """
-    return {
-        strip_stage_name(file["name"]): file["md5"]
-        for file in list_stage_cursor.fetchall()
+    md5_map = {
+        sys.intern(file["name"].partition("/")[2]): file["md5"] for file in stage_files
     }
+    # the deploy manifest describes the stage, it is never part of a diff
+    md5_map.pop(DEPLOY_MANIFEST_FILE_NAME, None)
+    return md5_map
 
 
 def preserve_from_diff(
@@ -104,61 +232,147 @@ def preserve_from_diff(
     """
     Returns a filtered version of the provided diff, keeping only the provided stage paths.
     """
-    paths_to_preserve = set(stage_paths_to_sync)
-    preserved_diff: DiffResult = DiffResult()
-    preserved_diff.identical = [i for i in diff.identical if i in paths_to_preserve]
-    preserved_diff.different = [i for i in diff.different if i in paths_to_preserve]
-    preserved_diff.only_local = [i for i in diff.only_local if i in paths_to_preserve]
-    preserved_diff.only_on_stage = [
-        i for i in diff.only_on_stage if i in paths_to_preserve
-    ]
+    paths_to_preserve = {str(p) for p in stage_paths_to_sync}
+    preserved_diff = DiffResult(manifest=diff.manifest)
+    for path, status in diff.entries():
+        if path in paths_to_preserve:
+            preserved_diff.add(path, status)
     return preserved_diff
 
 
+def _matches_remote_md5(
+    local_file: Path,
+    stat_result: os.stat_result,
+    remote_md5: Optional[str],
+    cache: Optional[ChecksumCache],
+) -> bool:
+    # N.B. file size on stage is not always accurate, so cannot fail fast
+    try:
+        # We are assuming that we will not get accidental collisions here due to the
+        # large space of the md5sum (32 * 4 = 128 bits means 1-in-9-trillion chance)
+        # combined with the fact that the file name + path must also match elsewhere.
+        return file_matches_md5sum(local_file, remote_md5, cache, stat_result)
+    except UnknownMD5FormatError:
+        log.warning(
+            "Could not compare md5 for %s, assuming file has changed",
+            local_file,
+            exc_info=True,
+        )
+        return False
+
+
+def _matches_manifest_entry(
+    local_file: Path,
+    stat_result: os.stat_result,
+    entry: ManifestEntry,
+    cache: Optional[ChecksumCache],
+) -> bool:
+    if entry.md5 is None:
+        return False
+    if entry.size is not None and entry.size != stat_result.st_size:
+        return False
+    md5s = compute_md5sums_cached(local_file, [None], cache, stat_result=stat_result)
+    return md5s[None] == entry.md5
+
+
+def _configured_hash_workers() -> Optional[int]:
+    hash_workers = get_config_value(
+        *STAGE_SECTION_PATH, key="hash_workers", default=None
+    )
+    if hash_workers is None:
+        return None
+    try:
+        hash_workers = int(hash_workers)
+    except ValueError:
+        hash_workers = 0
+    if hash_workers < 1:
+        raise ClickException(
+            "The hash_workers option of the [cli.stage] configuration section must be a positive integer."
+        )
+    return hash_workers
+
+
 def compute_stage_diff(
     local_root: Path,
     stage_fqn: str,
+    hash_workers: Optional[int] = None,
 ) -> DiffResult:
     """
     Diffs the files in a stage with a local folder.
+    Local files that also exist on the stage are hashed concurrently using up to
+    hash_workers threads (by default, the hash_workers option of the [cli.stage]
+    configuration section, or a value based on the number of CPUs). Local md5sums
+    are reused from the persistent checksum cache, if it is enabled.
+
+    If deploy manifests are enabled and the stage has one, the local files are compared
+    with the manifest instead of listing the whole stage.
     """
+    if not local_root.is_dir():
+        raise ValueError("Path must point to a directory")
     stage_manager = StageManager()
-    local_files = enumerate_files(local_root)
-    remote_md5 = build_md5_map(stage_manager.list_files(stage_fqn))
+
+    manifest: Optional[DeployManifest] = None
+    if FeatureFlag.ENABLE_STAGE_DEPLOY_MANIFEST.is_enabled():
+        manifest = load_deploy_manifest(stage_manager, stage_fqn)
+
+    if manifest is not None:
+        remote: Dict[str, Any] = {
+            str(path): entry for path, entry in manifest.entries.items()
+        }
+        matches_remote = _matches_manifest_entry
+    else:
+        remote = build_md5_map(stage_manager.iter_files(stage_fqn))
+        matches_remote = _matches_remote_md5
 
     result: DiffResult = DiffResult()
 
-    for local_file in local_files:
-        relpath = local_file.relative_to(local_root)
-        stage_path = to_stage_path(relpath)
-        if stage_path not in remote_md5:
+    files_to_compare: List[Tuple[Path, os.stat_result, str, Any]] = []
+    # the stat results of the walk are reused to look up cached md5sums
+    for stage_path, stat_result in walk_tree(local_root):
+        if stage_path not in remote:
             # doesn't exist on the stage
-            result.only_local.append(stage_path)
+            result.add(stage_path, DiffStatus.ONLY_LOCAL)
         else:
-            # N.B. file size on stage is not always accurate, so cannot fail fast
-            try:
-                if file_matches_md5sum(local_file, remote_md5[stage_path]):
-                    # We are assuming that we will not get accidental collisions here due to the
-                    # large space of the md5sum (32 * 4 = 128 bits means 1-in-9-trillion chance)
-                    # combined with the fact that the file name + path must also match elsewhere.
-                    result.identical.append(stage_path)
-                else:
-                    # either the file has changed, or we can't tell if it has
-                    result.different.append(stage_path)
-            except UnknownMD5FormatError:
-                log.warning(
-                    "Could not compare md5 for %s, assuming file has changed",
-                    local_file,
-                    exc_info=True,
-                )
-                result.different.append(stage_path)
-
             # mark this file as seen
-            del remote_md5[stage_path]
+            files_to_compare.append(
+                (
+                    local_root / stage_path,
+                    stat_result,
+                    stage_path,
+                    remote.pop(stage_path),
+                )
+            )
+
+    with checksum_cache() as cache, ThreadPoolExecutor(
+        max_workers=hash_workers or _configured_hash_workers()
+    ) as executor:
+        # map() yields results in submission order, keeping the diff deterministic
+        matches = executor.map(
+            lambda item: matches_remote(item[0], item[1], item[3], cache),
+            files_to_compare,
+        )
+        for (_, _, stage_path, _), is_identical in zip(files_to_compare, matches):
+            if is_identical:
+                result.add(stage_path, DiffStatus.IDENTICAL)
+            else:
+                # either the file has changed, or we can't tell if it has
+                result.add(stage_path, DiffStatus.DIFFERENT)
 
     # every entry here is a file we never saw locally
-    for stage_path in remote_md5.keys():
-        result.only_on_stage.append(stage_path)
+    for stage_path in remote.keys():
+        result.add(stage_path, DiffStatus.ONLY_ON_STAGE)
+
+    if FeatureFlag.ENABLE_STAGE_DEPLOY_MANIFEST.is_enabled() and manifest is None:
+        # local md5sums of the files on the stage are not known yet, they are
+        # filled in when the diff is synced
+        manifest = DeployManifest(
+            entries={
+                StagePathType(stage_path): ManifestEntry(md5=None)
+                for stage_path, status in result.entries()
+                if status != DiffStatus.ONLY_LOCAL
+            }
+        )
+    result.manifest = manifest
 
     return result
 
@@ -191,40 +405,117 @@ def delete_only_on_stage_files(
 ):
     """
     Deletes all files from a Snowflake stage according to the input list of filenames, using a custom role.
+    The files are removed in bulk, with as few REMOVE statements as possible.
     """
-    for _stage_path in only_on_stage:
-        stage_manager.remove(stage_name=stage_fqn, path=str(_stage_path), role=role)
+    if not only_on_stage:
+        return
+    stage_manager.remove_files(
+        stage_name=stage_fqn, paths=[str(p) for p in only_on_stage], role=role
+    )
 
 
-def put_files_on_stage(
+def put_files_on_stage_batched(
     stage_manager: StageManager,
     stage_fqn: str,
     deploy_root_path: Path,
     stage_paths: List[StagePathType],
     role: Optional[str] = None,
     overwrite: bool = False,
-):
+    parallel: int = 4,
+) -> Dict[StagePathType, str]:
     """
     Uploads all files given input list of filenames on your local filesystem, to a Snowflake stage, using a custom role.
+    Files are grouped by their stage directory and each group is uploaded with a single PUT statement.
+    Returns the status reported by PUT for each of the uploaded files.
     """
-    for _stage_path in stage_paths:
-        stage_sub_path = get_stage_subpath(_stage_path)
+    groups: Dict[str, List[StagePathType]] = defaultdict(list)
+    for stage_path in stage_paths:
+        groups[get_stage_subpath(stage_path)].append(stage_path)
+
+    upload_status: Dict[StagePathType, str] = {}
+    for stage_sub_path, paths in groups.items():
         full_stage_path = (
             f"{stage_fqn}/{stage_sub_path}" if stage_sub_path else stage_fqn
         )
-        stage_manager.put(
-            local_path=deploy_root_path / to_local_path(_stage_path),
-            stage_path=full_stage_path,
-            role=role,
-            overwrite=overwrite,
+        # hidden files are not matched by the wildcard, so they are uploaded one by one
+        batched_paths = [p for p in paths if not p.name.startswith(".")]
+        single_paths = [p for p in paths if p.name.startswith(".")]
+        if len(batched_paths) == 1:
+            single_paths += batched_paths
+            batched_paths = []
+
+        if batched_paths:
+            rows = stage_manager.put_files(
+                local_files=[
+                    deploy_root_path / to_local_path(p) for p in batched_paths
+                ],
+                stage_path=full_stage_path,
+                parallel=parallel,
+                overwrite=overwrite,
+                role=role,
+            )
+            paths_by_name = {p.name: p for p in batched_paths}
+            for row in rows:
+                if stage_path := paths_by_name.get(row["source"]):
+                    upload_status[stage_path] = row["status"]
+
+        for stage_path in single_paths:
+            rows = stage_manager.put(
+                local_path=deploy_root_path / to_local_path(stage_path),
+                stage_path=full_stage_path,
+                role=role,
+                overwrite=overwrite,
+                parallel=parallel,
+                use_dict_cursor=True,
+            ).fetchall()
+            for row in rows:
+                upload_status[stage_path] = row["status"]
+
+    return upload_status
+
+
+def _record_uploads_in_manifest(
+    manifest: DeployManifest, deploy_root_path: Path, diff_result: DiffResult
+) -> None:
+    """
+    Updates the manifest to describe the stage once the diff is synced.
+    Local files are hashed before they are uploaded, so that a file modified in the
+    meantime is seen as different on the next diff.
+    """
+    for stage_path in diff_result.only_on_stage:
+        manifest.entries.pop(stage_path, None)
+
+    stage_paths = diff_result.different + diff_result.only_local
+    # identical files can be described by their local md5sum as well
+    stage_paths += [
+        p
+        for p in diff_result.identical
+        if p not in manifest.entries or manifest.entries[p].md5 is None
+    ]
+    local_files = [deploy_root_path / to_local_path(p) for p in stage_paths]
+    uploaded_at = time.time()
+    with checksum_cache() as cache, ThreadPoolExecutor() as executor:
+        md5s = executor.map(
+            lambda f: compute_md5sums_cached(f, [None], cache)[None], local_files
         )
+        for stage_path, local_file, md5 in zip(stage_paths, local_files, md5s):
+            manifest.entries[stage_path] = ManifestEntry(
+                md5=md5, size=local_file.stat().st_size, uploaded_at=uploaded_at
+            )
 
 
 def sync_local_diff_with_stage(
-    role: str | None, deploy_root_path: Path, diff_result: DiffResult, stage_fqn: str
+    role: str | None,
+    deploy_root_path: Path,
+    diff_result: DiffResult,
+    stage_fqn: str,
+    parallel: int = 4,
 ):
     """
     Syncs a given local directory's contents with a Snowflake stage, including removing old files, and re-uploading modified and new files.
+    The role is switched once for the whole operation, and modified and new files are uploaded in batches,
+    one PUT statement per stage directory. The status of each upload is recorded in the diff result.
+    If the diff carries a deploy manifest, the updated manifest is uploaded to the stage once all files are synced.
     """
     stage_manager = StageManager()
     log.info(
@@ -232,21 +523,36 @@ def sync_local_diff_with_stage(
         deploy_root_path,
     )
 
+    manifest = diff_result.manifest
+    if manifest is not None:
+        _record_uploads_in_manifest(manifest, deploy_root_path, diff_result)
+
     try:
-        delete_only_on_stage_files(
-            stage_manager, stage_fqn, diff_result.only_on_stage, role
-        )
-        put_files_on_stage(
-            stage_manager,
-            stage_fqn,
-            deploy_root_path,
-            diff_result.different,
-            role,
-            overwrite=True,
-        )
-        put_files_on_stage(
-            stage_manager, stage_fqn, deploy_root_path, diff_result.only_local, role
-        )
+        with stage_manager.use_role(role) if role else nullcontext():
+            delete_only_on_stage_files(
+                stage_manager, stage_fqn, diff_result.only_on_stage
+            )
+            diff_result.upload_status.update(
+                put_files_on_stage_batched(
+                    stage_manager,
+                    stage_fqn,
+                    deploy_root_path,
+                    diff_result.different,
+                    overwrite=True,
+                    parallel=parallel,
+                )
+            )
+            diff_result.upload_status.update(
+                put_files_on_stage_batched(
+                    stage_manager,
+                    stage_fqn,
+                    deploy_root_path,
+                    diff_result.only_local,
+                    parallel=parallel,
+                )
+            )
+            if manifest is not None:
+                save_deploy_manifest(stage_manager, stage_fqn, manifest)
     except Exception as err:
         # Could be ProgrammingError or IntegrityError from SnowflakeCursor
         log.error(err)
@@ -16,28 +16,46 @@ from __future__ import annotations
 
 import fnmatch
 import glob
+import hashlib
+import itertools
+import json
 import logging
 import os
 import re
 import shutil
 import sys
 import time
-from collections import deque
+import uuid
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import nullcontext
 from dataclasses import dataclass
 from os import path
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from tempfile import TemporaryDirectory
-from textwrap import dedent
-from typing import Deque, Dict, Generator, List, Optional, Union
+from textwrap import dedent, indent
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from click import ClickException, UsageError
 from snowflake.cli._plugins.snowpark.package_utils import parse_requirements
+from snowflake.cli._plugins.stage.checksum_cache import checksum_cache
+from snowflake.cli._plugins.stage.md5 import UnknownMD5FormatError, file_matches_md5sum
 from snowflake.cli.api.commands.common import (
     OnErrorType,
     Variable,
 )
 from snowflake.cli.api.commands.utils import parse_key_value_variables
+from snowflake.cli.api.config import CLI_SECTION, get_config_value
 from snowflake.cli.api.console import cli_console
 from snowflake.cli.api.constants import PYTHON_3_12
 from snowflake.cli.api.identifiers import FQN
@@ -66,6 +84,49 @@ EXECUTE_SUPPORTED_FILES_FORMATS = (
 # Replace magic numbers with constants
 OMIT_FIRST = slice(1, None)
 
+# Upper bound on the length of a single PATTERN used to select multiple files at once
+MAX_FILES_PATTERN_LENGTH = 10_000
+DEFAULT_MAX_CONCURRENT_PUTS = 4
+DEFAULT_MAX_CONCURRENT_GETS = 4
+DEFAULT_MAX_CONCURRENT_LISTS = 4
+COPY_FILES_MAX_FILES = 1000
+DEFAULT_LOAD_BATCH_FILES = 50
+# File format options inferred from extensions of loaded files
+LOAD_FILE_FORMATS = {
+    ".csv": "type = CSV",
+    ".tsv": "type = CSV field_delimiter = '\\t'",
+    ".json": "type = JSON",
+    ".jsonl": "type = JSON",
+    ".ndjson": "type = JSON",
+    ".parquet": "type = PARQUET",
+    ".avro": "type = AVRO",
+    ".orc": "type = ORC",
+    ".xml": "type = XML",
+}
+STAGE_SECTION_PATH = [CLI_SECTION, "stage"]
+
+PYTHON_EXECUTION_PACKAGES = ("snowflake-snowpark-python", "snowflake.core")
+PYTHON_EXECUTION_PROCEDURE_PREFIX = "SNOWFLAKE_CLI_EXECUTE_PYTHON"
+# bump when the handler changes, so that procedures created by older versions are not reused
+PYTHON_EXECUTION_PROCEDURE_VERSION = 2
+PYTHON_EXECUTION_PROCEDURE_HANDLER = dedent(
+    """\
+    import json
+
+    from snowflake.snowpark.files import SnowflakeFile
+
+
+    def main(_, file_path, variables):
+        with SnowflakeFile.open(file_path, require_scoped_url=False) as f:
+            file_content = f.read()
+
+        wrapper = "import os\\nos.environ.update(" + json.dumps(variables or {}) + ")\\n"
+        exec(wrapper + file_content)
+    """
+)
+EXECUTE_POLL_INTERVAL_SECONDS = 0.2
+REGEX_SPECIAL_CHARACTERS = frozenset(".[]{}()*+?|$")
+
 
 @dataclass
 class StagePathParts:
@@ -216,6 +277,11 @@ class UserStagePathParts(StagePathParts):
         return list(Path(file_path).parts[stage_path_length:-1])
 
 
+def _is_parent_directory(parent: str, directory: str) -> bool:
+    """Is `parent` one of the ('/'-separated) parent directories of `directory`?"""
+    return parent != directory and (parent == "" or directory.startswith(parent + "/"))
+
+
 class StageManager(SqlExecutionMixin):
     def __init__(self):
         super().__init__()
@@ -274,6 +340,41 @@ class StageManager(SqlExecutionMixin):
             query += f" pattern = '{pattern}'"
         return self.execute_query(query, cursor_class=DictCursor)
 
+    def iter_files(
+        self,
+        stage_name: str | StagePath,
+        pattern: str | None = None,
+        prefixes: Optional[Sequence[str]] = None,
+        max_concurrent_lists: int = DEFAULT_MAX_CONCURRENT_LISTS,
+    ) -> Generator[Dict, None, None]:
+        """
+        Lists files on a stage, yielding a row (dict) per file as results are fetched,
+        instead of materialising the whole listing.
+
+        If prefixes are given, the stage is partitioned into separate `ls @stage/<prefix>`
+        queries, up to max_concurrent_lists of which run at the same time. Rows are yielded
+        in the order of the prefixes.
+        """
+        if not isinstance(stage_name, StagePath):
+            stage_name = self.build_path(stage_name)
+        if not prefixes:
+            yield from self.list_files(stage_name, pattern=pattern)
+            return
+
+        root = stage_name.absolute_path().rstrip("/")
+        paths = (self.build_path(f"{root}/{prefix.lstrip('/')}") for prefix in prefixes)
+        with ThreadPoolExecutor(max_workers=max_concurrent_lists) as executor:
+            # listings are started at most max_concurrent_lists ahead of the rows being consumed
+            pending = deque(
+                executor.submit(self.list_files, path, pattern)
+                for path in itertools.islice(paths, max_concurrent_lists)
+            )
+            while pending:
+                cursor = pending.popleft().result()
+                if (path := next(paths, None)) is not None:
+                    pending.append(executor.submit(self.list_files, path, pattern))
+                yield from cursor
+
     @staticmethod
     def _assure_is_existing_directory(path: Path) -> None:
         spath = SecurePath(path)
@@ -310,6 +411,143 @@ class StageManager(SqlExecutionMixin):
 
         return results
 
+    def get_recursive_sync(
+        self,
+        stage_path: str,
+        dest_path: Path,
+        parallel: int = 4,
+        max_concurrent_gets: int = DEFAULT_MAX_CONCURRENT_GETS,
+    ) -> List[SnowflakeCursor]:
+        """
+        Same as get_recursive, but skips files which already exist locally with the content
+        reported by the stage (compared using md5sums). Files to download are grouped by
+        directory, each group is downloaded with a single GET using a pattern, and up to
+        max_concurrent_gets GETs run at the same time.
+        """
+        stage_root = self.build_path(stage_path)
+
+        stage_files: List[Tuple[StagePath, Path, Optional[str]]] = []
+        for file in self.iter_files(stage_root):
+            file_path = self._listed_file_path(stage_root, file["name"])
+            local_dir = file_path.get_local_target_path(
+                target_dir=dest_path, stage_root=stage_root
+            )
+            stage_files.append((file_path, local_dir, file["md5"]))
+
+        def is_up_to_date(local_file: Path, md5: Optional[str]) -> bool:
+            try:
+                return local_file.is_file() and file_matches_md5sum(
+                    local_file, md5, cache
+                )
+            except UnknownMD5FormatError:
+                return False
+
+        with checksum_cache() as cache, ThreadPoolExecutor() as executor:
+            up_to_date = list(
+                executor.map(
+                    is_up_to_date,
+                    [local_dir / f.name for f, local_dir, _ in stage_files],
+                    [md5 for _, _, md5 in stage_files],
+                )
+            )
+
+        groups: Dict[Tuple[str, Path], List[StagePath]] = defaultdict(list)
+        for (file_path, local_dir, _), skip in zip(stage_files, up_to_date):
+            if not skip:
+                groups[(file_path.parent.absolute_path(), local_dir)].append(file_path)
+        log.info(
+            "Downloading %d files, %d files are up to date",
+            len(stage_files) - sum(up_to_date),
+            sum(up_to_date),
+        )
+
+        for _, local_dir in groups:
+            self._assure_is_existing_directory(local_dir)
+        return self._get_groups_concurrently(
+            [(local_dir, files) for (_, local_dir), files in groups.items()],
+            parallel=parallel,
+            max_concurrent_gets=max_concurrent_gets,
+        )
+
+    def get_recursive_concurrently(
+        self,
+        stage_path: str,
+        dest_path: Path,
+        parallel: int = 4,
+        max_concurrent_gets: int = DEFAULT_MAX_CONCURRENT_GETS,
+    ) -> List[SnowflakeCursor]:
+        """
+        Same as get_recursive, but files of every directory are split into up to
+        max_concurrent_gets parts, each downloaded with GETs using patterns, and up to
+        max_concurrent_gets GETs run at the same time.
+        """
+        stage_root = self.build_path(stage_path)
+
+        groups: Dict[Tuple[str, Path], List[StagePath]] = defaultdict(list)
+        for file in self.iter_files(stage_root):
+            file_path = self._listed_file_path(stage_root, file["name"])
+            local_dir = file_path.get_local_target_path(
+                target_dir=dest_path, stage_root=stage_root
+            )
+            groups[(file_path.parent.absolute_path(), local_dir)].append(file_path)
+
+        for _, local_dir in groups:
+            self._assure_is_existing_directory(local_dir)
+        return self._get_groups_concurrently(
+            [
+                (local_dir, files[part::max_concurrent_gets])
+                for (_, local_dir), files in groups.items()
+                for part in range(min(max_concurrent_gets, len(files)))
+            ],
+            parallel=parallel,
+            max_concurrent_gets=max_concurrent_gets,
+        )
+
+    def _get_groups_concurrently(
+        self,
+        groups: List[Tuple[Path, List[StagePath]]],
+        parallel: int,
+        max_concurrent_gets: int,
+    ) -> List[SnowflakeCursor]:
+        """
+        Downloads every group of files from the same stage directory into its local
+        directory, with a single GET per batch of files expressible as a pattern.
+        Up to max_concurrent_gets groups are downloaded at the same time.
+        """
+
+        def download(local_dir: Path, files: List[StagePath]) -> List[SnowflakeCursor]:
+            target = self._to_uri(f"{local_dir}/")
+            stage_dir = files[0].parent
+            files_by_name = {f.name: f for f in files}
+            batches, single_names = self._coalesce_into_patterns(
+                stage_dir, [f.name for f in files]
+            )
+            cursors = []
+            for batch_names, pattern in batches:
+                if len(batch_names) == 1:
+                    single_names.extend(batch_names)
+                    continue
+                cursors.append(
+                    self.execute_query(
+                        f"get {stage_dir.path_for_sql()} {target} parallel={parallel} "
+                        f"pattern = {to_string_literal(pattern)}"
+                    )
+                )
+            for name in single_names:
+                cursors.append(
+                    self.execute_query(
+                        f"get {files_by_name[name].path_for_sql()} {target} parallel={parallel}"
+                    )
+                )
+            return cursors
+
+        with ThreadPoolExecutor(max_workers=max_concurrent_gets) as executor:
+            futures = [
+                executor.submit(download, local_dir, files)
+                for local_dir, files in groups
+            ]
+            return [cursor for future in futures for cursor in future.result()]
+
     def put(
         self,
         local_path: Union[str, Path],
@@ -360,6 +598,45 @@ class StageManager(SqlExecutionMixin):
         else:
             dest_path.mkdir(exist_ok=True, parents=True)
 
+    def put_files(
+        self,
+        local_files: List[Path],
+        stage_path: str,
+        parallel: int = 4,
+        overwrite: bool = False,
+        role: Optional[str] = None,
+        auto_compress: bool = False,
+    ) -> List[dict]:
+        """
+        Uploads the given files into a single stage directory using one PUT statement.
+        The files are symlinked (or copied, if symlinks are not supported) into a temporary
+        directory, which is then uploaded using a wildcard. File names have to be unique
+        and cannot start with a dot, as such files are not matched by the wildcard.
+        Returns the rows reported by PUT, one per file.
+        """
+        names = [f.name for f in local_files]
+        if len(set(names)) != len(names):
+            raise ValueError("Files uploaded with a single PUT must have unique names")
+        if any(name.startswith(".") for name in names):
+            raise ValueError("Hidden files cannot be uploaded with a wildcard PUT")
+
+        with TemporaryDirectory() as tmp:
+            for local_file in local_files:
+                self._symlink_or_copy(
+                    source_root=local_file.parent,
+                    source_file_or_dir=local_file,
+                    dest_dir=Path(tmp),
+                )
+            return self.put(
+                local_path=Path(tmp),
+                stage_path=stage_path,
+                parallel=parallel,
+                overwrite=overwrite,
+                role=role,
+                auto_compress=auto_compress,
+                use_dict_cursor=True,
+            ).fetchall()
+
     def put_recursive(
         self,
         local_path: Path,
@@ -368,10 +645,59 @@ class StageManager(SqlExecutionMixin):
         overwrite: bool = False,
         role: Optional[str] = None,
         auto_compress: bool = False,
+        max_concurrent_puts: int = DEFAULT_MAX_CONCURRENT_PUTS,
     ) -> Generator[dict, None, None]:
+        """
+        Uploads files matching local_path (a directory or a glob pattern), preserving the
+        directory structure. All (local directory -> stage directory) groups are planned up front
+        and uploaded with one PUT each, running up to max_concurrent_puts PUTs at the same time.
+        Results are yielded group by group, in a deterministic order.
+
+        The PUTs share the connection of this manager, each running in a cursor of its own.
+        No additional connections are opened: they would require logging in again, and would
+        not see the role used for the upload or temporary stages of the current session.
+        """
         if local_path.is_file():
             raise UsageError("Cannot use recursive upload with a single file.")
 
+        destination_root = StagePath.from_stage_str(stage_path)
+        upload_plan = self._plan_recursive_put(local_path)
+
+        def upload(relative_dir: PurePosixPath, files: List[Path]) -> List[dict]:
+            destination = destination_root / str(relative_dir)
+            results = self._put_directory_files(
+                local_files=files,
+                stage_path=destination.absolute_path(),
+                parallel=parallel,
+                overwrite=overwrite,
+                auto_compress=auto_compress,
+            )
+            # Rewrite results to have resolved paths for better UX
+            for item in results:
+                item["source"] = Path(relative_dir / item["source"])
+                item["target"] = str(destination / item["target"])
+            return results
+
+        with self.use_role(role) if role else nullcontext():
+            with ThreadPoolExecutor(max_workers=max_concurrent_puts) as executor:
+                futures = [
+                    executor.submit(upload, relative_dir, files)
+                    for relative_dir, files in upload_plan
+                ]
+                try:
+                    for future in futures:
+                        yield from future.result()
+                finally:
+                    for future in futures:
+                        future.cancel()
+
+    @staticmethod
+    def _plan_recursive_put(local_path: Path) -> List[Tuple[PurePosixPath, List[Path]]]:
+        """
+        Groups files matching local_path (a directory or a glob pattern) by their directory,
+        relative to the deepest existing directory of local_path. Each group can be uploaded
+        to the corresponding stage directory with a single PUT.
+        """
         if local_path.is_dir():
             root = local_path
             glob_pattern = str(local_path / "**/*")
@@ -379,96 +705,170 @@ class StageManager(SqlExecutionMixin):
             root = Path([p for p in local_path.parents if p.is_dir()][0])
             glob_pattern = str(local_path)
 
-        with TemporaryDirectory() as tmp:
-            temp_dir_with_copy = Path(tmp)
+        groups: Dict[PurePosixPath, List[Path]] = defaultdict(list)
+        for file_path in glob.iglob(glob_pattern, recursive=True):
+            local_file = Path(file_path)
+            if local_file.is_file():
+                relative_dir = local_file.parent.relative_to(root).as_posix()
+                groups[PurePosixPath(relative_dir)].append(local_file)
 
-            # Create a symlink or copy the file to the temp directory
-            for file_or_dir in glob.iglob(glob_pattern, recursive=True):
-                self._symlink_or_copy(
-                    source_root=root,
-                    source_file_or_dir=Path(file_or_dir),
-                    dest_dir=temp_dir_with_copy,
-                )
+        return [(directory, sorted(groups[directory])) for directory in sorted(groups)]
 
-            # Find the deepest directories, we will be iterating from bottom to top
-            deepest_dirs_list = self._find_deepest_directories(temp_dir_with_copy)
+    def _put_directory_files(
+        self,
+        local_files: List[Path],
+        stage_path: str,
+        parallel: int,
+        overwrite: bool,
+        auto_compress: bool,
+    ) -> List[dict]:
+        # Hidden files are not matched by the wildcard used by put_files
+        hidden_files = [f for f in local_files if f.name.startswith(".")]
+        visible_files = [f for f in local_files if not f.name.startswith(".")]
+
+        results: List[dict] = []
+        if visible_files:
+            results.extend(
+                self.put_files(
+                    local_files=visible_files,
+                    stage_path=stage_path,
+                    parallel=parallel,
+                    overwrite=overwrite,
+                    auto_compress=auto_compress,
+                )
+            )
+        for hidden_file in hidden_files:
+            results.extend(
+                self.put(
+                    local_path=hidden_file,
+                    stage_path=stage_path,
+                    parallel=parallel,
+                    overwrite=overwrite,
+                    auto_compress=auto_compress,
+                    use_dict_cursor=True,
+                ).fetchall()
+            )
+        return results
 
-            while deepest_dirs_list:
-                # Remove as visited
-                directory = deepest_dirs_list.pop(0)
+    def load_files(
+        self,
+        local_path: Path,
+        table: FQN,
+        file_format: Optional[str] = None,
+        file_format_options: Optional[str] = None,
+        copy_options: Optional[str] = None,
+        batch_size: int = DEFAULT_LOAD_BATCH_FILES,
+        parallel: int = 4,
+        auto_compress: bool = False,
+        max_concurrent_puts: int = DEFAULT_MAX_CONCURRENT_PUTS,
+    ) -> Generator[dict, None, None]:
+        """
+        Loads local files matching local_path (a file, a directory or a glob pattern) into
+        a table. Files are split into batches of up to batch_size files, which are uploaded
+        to a temporary stage, up to max_concurrent_puts at the same time. As soon as a batch
+        is uploaded, it is loaded with COPY INTO (purging the loaded files from the stage),
+        while the next batches are still uploading. Yields statistics of every batch,
+        in the order in which batches are loaded. As in put_recursive, concurrent PUTs run
+        in separate cursors of the connection of this manager, which owns the temporary stage.
+
+        The file format is either the name of an existing file format, inline format
+        options, or inferred from the extension of the loaded files.
+        """
+        batches = [
+            files[i : i + batch_size]
+            for _, files in self._plan_recursive_put(local_path)
+            for i in range(0, len(files), batch_size)
+        ]
+        if not batches:
+            raise ClickException(f"No files to load found in {local_path}.")
+        file_format_sql = self._load_file_format(
+            [f for files in batches for f in files], file_format, file_format_options
+        )
 
-                # We reached root but there are still directories to process
-                if directory == temp_dir_with_copy and deepest_dirs_list:
-                    continue
+        stage_fqn = FQN.from_stage(
+            f"snowflake_cli_tmp_load_stage_{uuid.uuid4().hex}"
+        ).using_connection(conn=self._conn)
+        # Temporary stage, it will be dropped with end of session
+        self.create(stage_fqn, temporary=True)
+        stage_root = self.build_path(stage_fqn.identifier)
+
+        def upload(batch_number: int, files: List[Path]) -> float:
+            start = time.perf_counter()
+            self._put_directory_files(
+                local_files=files,
+                stage_path=(stage_root / f"batch_{batch_number}").absolute_path(),
+                parallel=parallel,
+                overwrite=True,
+                auto_compress=auto_compress,
+            )
+            return time.perf_counter() - start
 
-                # Upload the directory content, at this moment the directory has only files
-                if list(directory.iterdir()):
-                    destination = StagePath.from_stage_str(
-                        stage_path
-                    ) / directory.relative_to(temp_dir_with_copy)
-                    results: list[dict] = self.put(
-                        local_path=directory,
-                        stage_path=destination,
-                        parallel=parallel,
-                        overwrite=overwrite,
-                        role=role,
-                        auto_compress=auto_compress,
-                        use_dict_cursor=True,
+        with ThreadPoolExecutor(max_workers=max_concurrent_puts) as executor:
+            futures = {
+                executor.submit(upload, batch_number, files): batch_number
+                for batch_number, files in enumerate(batches, start=1)
+            }
+            try:
+                for future in as_completed(futures):
+                    batch_number = futures[future]
+                    upload_seconds = future.result()
+                    start = time.perf_counter()
+                    batch_path = stage_root / f"batch_{batch_number}"
+                    rows = self.execute_query(
+                        f"copy into {table.identifier} from {batch_path.path_for_sql()}/ "
+                        f"file_format = ({file_format_sql}) purge = true"
+                        + (f" {copy_options}" if copy_options else ""),
+                        cursor_class=DictCursor,
                     ).fetchall()
-
-                    # Rewrite results to have resolved paths for better UX
-                    for item in results:
-                        item["source"] = (directory / item["source"]).relative_to(
-                            temp_dir_with_copy
-                        )
-                        item["target"] = str(destination / item["target"])
-                        yield item
-
-                # We end if we reach the root directory
-                if directory == temp_dir_with_copy:
-                    break
-
-                # Add parent directory to the list if it's not already there
-                if directory.parent not in deepest_dirs_list:
-                    deepest_dirs_list.append(directory.parent)
-
-                # Remove the directory so the parent directory will contain only files
-                shutil.rmtree(directory)
+                    load_seconds = time.perf_counter() - start
+
+                    size = sum(f.stat().st_size for f in batches[batch_number - 1])
+                    total_seconds = upload_seconds + load_seconds
+                    yield {
+                        "batch": batch_number,
+                        "files": len(batches[batch_number - 1]),
+                        "bytes": size,
+                        "rows_loaded": sum(row.get("rows_loaded") or 0 for row in rows),
+                        "upload_seconds": round(upload_seconds, 3),
+                        "load_seconds": round(load_seconds, 3),
+                        "mb_per_second": round(
+                            size / 1024**2 / total_seconds if total_seconds else 0, 3
+                        ),
+                    }
+            finally:
+                for future in futures:
+                    future.cancel()
 
     @staticmethod
-    def _find_deepest_directories(root_directory: Path) -> list[Path]:
-        """
-        BFS to find the deepest directories. Build a tree of directories
-        structure and return leaves.
-        """
-        deepest_dirs: list[Path] = list()
-
-        queue: Deque[Path] = deque()
-        queue.append(root_directory)
-        while queue:
-            current_dir = queue.popleft()
-            # Sorted to have deterministic order
-            children_directories = sorted(
-                list(d for d in current_dir.iterdir() if d.is_dir())
+    def _load_file_format(
+        files: List[Path],
+        file_format: Optional[str],
+        file_format_options: Optional[str],
+    ) -> str:
+        if file_format and file_format_options:
+            raise UsageError(
+                "Specify either the name of a file format or file format options, not both."
             )
-            if not children_directories and current_dir not in deepest_dirs:
-                deepest_dirs.append(current_dir)
-            else:
-                queue.extend([c for c in children_directories if c not in deepest_dirs])
-        deepest_dirs_list = sorted(
-            list(deepest_dirs), key=lambda d: len(d.parts), reverse=True
-        )
-        return deepest_dirs_list
+        if file_format:
+            return f"format_name = {file_format}"
+        if file_format_options:
+            return file_format_options
+
+        formats = set()
+        for file in files:
+            suffixes = [s for s in file.suffixes if s.lower() not in (".gz", ".bz2")]
+            formats.add(LOAD_FILE_FORMATS.get(suffixes[-1].lower() if suffixes else ""))
+        if len(formats) != 1 or None in formats:
+            raise UsageError(
+                "Cannot infer the file format from the extensions of the loaded files. "
+                "Specify the file format explicitly."
+            )
+        return formats.pop()
 
     def copy_files(self, source_path: str, destination_path: str) -> SnowflakeCursor:
         source_stage_path = self.build_path(source_path)
         # We copy only into stage
-        destination_stage_path = StagePath.from_stage_str(destination_path)
-
-        if destination_stage_path.is_user_stage():
-            raise ClickException(
-                "Destination path cannot be a user stage. Please provide a named stage."
-            )
+        destination_stage_path = self._copy_destination(destination_path)
 
         log.info(
             "Copying files from %s to %s", source_stage_path, destination_stage_path
@@ -478,6 +878,106 @@ class StageManager(SqlExecutionMixin):
         query = f"copy files into {dest} from {source_stage_path}"
         return self.execute_query(query)
 
+    @staticmethod
+    def _copy_destination(destination_path: str) -> StagePath:
+        destination_stage_path = StagePath.from_stage_str(destination_path)
+        if destination_stage_path.is_user_stage():
+            raise ClickException(
+                "Destination path cannot be a user stage. Please provide a named stage."
+            )
+        return destination_stage_path
+
+    def copy_stage_to_stage(
+        self,
+        source_path: str,
+        destination_path: str,
+        recursive: bool = False,
+        pattern: Optional[str] = None,
+        only_changed: bool = False,
+    ) -> List[SnowflakeCursor]:
+        """
+        Copies files from one stage to another using COPY FILES, so that the file contents
+        never leave Snowflake. Paths of the copied files relative to source_path are kept
+        in destination_path; without recursive, files in subdirectories are not copied.
+
+        If only_changed is set, both stages are listed first and only the files which are
+        missing from the destination, or whose md5sum differs, are copied. Unless the whole
+        directory is copied, files are passed explicitly to COPY FILES, in batches of
+        COPY_FILES_MAX_FILES.
+        """
+        source = self.build_path(source_path)
+        destination = self._copy_destination(destination_path)
+        source_dir = source.parent if source.is_file() else source
+        dest = destination.absolute_path().rstrip("/") + "/"
+        from_dir = source_dir.absolute_path().rstrip("/") + "/"
+
+        if recursive and not only_changed and not pattern and not source.is_file():
+            log.info("Copying all files from %s to %s", from_dir, dest)
+            return [self.execute_query(f"copy files into {dest} from {from_dir}")]
+
+        source_md5s = self._list_relative_md5s(source, source_dir, recursive, pattern)
+        if source.is_file():
+            source_md5s = {
+                path: md5
+                for path, md5 in source_md5s.items()
+                if path == source.relative_to(source_dir)
+            }
+        if only_changed:
+            destination_md5s = self._list_relative_md5s(
+                destination, destination, recursive=True
+            )
+            files = [
+                path
+                for path, md5 in source_md5s.items()
+                if md5 is None or destination_md5s.get(path) != md5
+            ]
+        else:
+            files = list(source_md5s)
+        log.info(
+            "Copying %d files from %s to %s, %d files are up to date",
+            len(files),
+            from_dir,
+            dest,
+            len(source_md5s) - len(files),
+        )
+
+        cursors = []
+        for i in range(0, len(files), COPY_FILES_MAX_FILES):
+            files_list = ", ".join(
+                to_string_literal(str(path))
+                for path in files[i : i + COPY_FILES_MAX_FILES]
+            )
+            cursors.append(
+                self.execute_query(
+                    f"copy files into {dest} from {from_dir} files = ({files_list})"
+                )
+            )
+        return cursors
+
+    def _list_relative_md5s(
+        self,
+        stage_path: StagePath,
+        root: StagePath,
+        recursive: bool,
+        pattern: Optional[str] = None,
+    ) -> Dict[PurePosixPath, Optional[str]]:
+        """
+        Lists the files under stage_path, returning their md5sums by path relative to root.
+        Files listed because their path merely starts with the same characters as root
+        (e.g. dir_2/file.txt for root dir) are skipped.
+        """
+        md5s: Dict[PurePosixPath, Optional[str]] = {}
+        for file in self.iter_files(stage_path, pattern=pattern):
+            try:
+                path = self._listed_file_path(stage_path, file["name"]).relative_to(
+                    root
+                )
+            except ValueError:
+                continue
+            if recursive or len(path.parts) == 1:
+                md5s[path] = file["md5"]
+        return md5s
+
     def remove(
         self, stage_name: str, path: str, role: Optional[str] = None
     ) -> SnowflakeCursor:
@@ -491,6 +991,90 @@ class StageManager(SqlExecutionMixin):
             stage_path = self.build_path(stage_name) / path
             return self.execute_query(f"remove {stage_path.path_for_sql()}")
 
+    def remove_files(
+        self,
+        stage_name: str,
+        paths: List[str],
+        role: Optional[str] = None,
+        max_pattern_length: int = MAX_FILES_PATTERN_LENGTH,
+    ) -> List[SnowflakeCursor]:
+        """
+        Removes the given files (paths relative to stage_name) from a stage using as few
+        statements as possible: paths are coalesced into anchored regular expressions passed
+        as PATTERN to REMOVE, each at most max_pattern_length characters long.
+        Paths that cannot be safely expressed as a regular expression are removed one by one.
+        If provided with a role, the role is switched only once for all the statements.
+        """
+        stage_path = self.build_path(stage_name)
+        batches, single_paths = self._coalesce_into_patterns(
+            stage_path, paths, max_pattern_length
+        )
+
+        results = []
+        with self.use_role(role) if role else nullcontext():
+            for batch_paths, pattern in batches:
+                if len(batch_paths) == 1:
+                    # a plain REMOVE does not need to list the stage
+                    single_paths.extend(batch_paths)
+                    continue
+                results.append(
+                    self.execute_query(
+                        f"remove {stage_path.root_path().path_for_sql()} pattern = {to_string_literal(pattern)}"
+                    )
+                )
+            for path in single_paths:
+                results.append(self.remove(stage_name=stage_name, path=path))
+        return results
+
+    @classmethod
+    def _coalesce_into_patterns(
+        cls,
+        stage_path: StagePath,
+        paths: List[str],
+        max_pattern_length: int = MAX_FILES_PATTERN_LENGTH,
+    ) -> Tuple[List[Tuple[List[str], str]], List[str]]:
+        """
+        Splits paths (relative to stage_path) into batches, each with an anchored regular
+        expression matching exactly the files of the batch, as listed on the stage.
+        Returns the batches and the paths which cannot be safely expressed as a pattern.
+        """
+        # Files listed on a named stage are prefixed with the stage name, on the user stage they are not
+        name_prefix = "" if stage_path.is_user_stage() else "[^/]+/"
+
+        unsafe_paths: List[str] = []
+        batches: List[List[Tuple[str, str]]] = []
+        batch_length = max_pattern_length
+        for path in paths:
+            pattern = cls._path_to_pattern(str(stage_path.path / path))
+            if pattern is None:
+                unsafe_paths.append(path)
+                continue
+            if batch_length + len(pattern) + 1 > max_pattern_length:
+                batches.append([])
+                batch_length = len(name_prefix) + len("^()$")
+            batches[-1].append((path, pattern))
+            batch_length += len(pattern) + 1
+
+        return [
+            (
+                [path for path, _ in batch],
+                f"^{name_prefix}({'|'.join(pattern for _, pattern in batch)})$",
+            )
+            for batch in batches
+        ], unsafe_paths
+
+    @staticmethod
+    def _path_to_pattern(path: str) -> Optional[str]:
+        """
+        Returns a regular expression matching exactly the given stage path, or None
+        if the path contains characters which cannot be safely used in a pattern.
+        Special characters are escaped with bracket expressions, as backslashes
+        would need another level of escaping in the string literal.
+        """
+        if not re.fullmatch(r"[ -~]+", path) or any(c in path for c in "\\^'"):
+            return None
+        return "".join(f"[{c}]" if c in REGEX_SPECIAL_CHARACTERS else c for c in path)
+
     def create(
         self, fqn: FQN, comment: Optional[str] = None, temporary: bool = False
     ) -> SnowflakeCursor:
@@ -501,12 +1085,13 @@ class StageManager(SqlExecutionMixin):
         return self.execute_query(query)
 
     def iter_stage(self, stage_path: StagePath):
-        for file in self.list_files(stage_path.absolute_path()).fetchall():
-            if stage_path.is_user_stage():
-                path = StagePath.get_user_stage() / file["name"]
-            else:
-                path = self.build_path(file["name"])
-            yield path
+        for file in self.iter_files(stage_path):
+            yield self._listed_file_path(stage_path, file["name"])
+
+    def _listed_file_path(self, stage_path: StagePath, name: str) -> StagePath:
+        if stage_path.is_user_stage():
+            return StagePath.get_user_stage() / name
+        return self.build_path(name)
 
     def execute(
         self,
@@ -514,7 +1099,12 @@ class StageManager(SqlExecutionMixin):
         on_error: OnErrorType,
         variables: Optional[List[str]] = None,
         requires_temporary_stage: bool = False,
+        parallel: int = 1,
     ):
+        """
+        Executes all matching files from the stage path, one after another. If parallel is greater than 1,
+        up to that many files are executed at the same time, and results are yielded as executions complete.
+        """
         if requires_temporary_stage:
             (
                 stage_path_parts,
@@ -527,7 +1117,12 @@ class StageManager(SqlExecutionMixin):
             stage_path_parts = self._stage_path_part_factory(stage_path_str)
             stage_path = self.build_path(stage_path_str)
 
-        all_files_list = self._get_files_list_from_stage(stage_path.root_path())
+        # md5 sums are kept to look up the requirements file of Python executions
+        listed_files = {
+            file["name"]: file.get("md5")
+            for file in self.iter_files(stage_path.root_path())
+        }
+        all_files_list = list(listed_files)
         if not all_files_list:
             raise ClickException(f"No files found on stage '{stage_path}'")
 
@@ -555,9 +1150,10 @@ class StageManager(SqlExecutionMixin):
 
         if any(file.endswith(".py") for file in sorted_file_path_list):
             self._python_exe_procedure = self._bootstrap_snowpark_execution_environment(
-                stage_path
+                stage_path, listed_files=listed_files
             )
 
+        files_to_execute = []
         for file_path in sorted_file_path_list:
             file_stage_path = stage_path_parts.add_stage_prefix(file_path)
 
@@ -567,7 +1163,18 @@ class StageManager(SqlExecutionMixin):
                 original_path = original_path_parts.add_stage_prefix(file_path)
             else:
                 original_path = file_stage_path
+            files_to_execute.append((file_path, file_stage_path, original_path))
+
+        if parallel > 1:
+            return self._execute_concurrently(
+                files=files_to_execute,
+                parallel=parallel,
+                on_error=on_error,
+                sql_variables=sql_variables,
+                python_variables=python_variables,
+            )
 
+        for file_path, file_stage_path, original_path in files_to_execute:
             if file_path.endswith(".py"):
                 result = self._execute_python(
                     file_stage_path=file_stage_path,
@@ -618,8 +1225,7 @@ class StageManager(SqlExecutionMixin):
     def _get_files_list_from_stage(
         self, stage_path: StagePath, pattern: str | None = None
     ) -> List[str]:
-        files_list_result = self.list_files(stage_path, pattern=pattern).fetchall()
-        return [f["name"] for f in files_list_result]
+        return [f["name"] for f in self.iter_files(stage_path, pattern=pattern)]
 
     def _filter_files_list(
         self, stage_path_parts: StagePathParts, files_on_stage: List[str]
@@ -683,6 +1289,137 @@ class StageManager(SqlExecutionMixin):
         if on_error == OnErrorType.BREAK:
             raise exception
 
+    def _execute_concurrently(
+        self,
+        files: List[Tuple[str, str, str]],
+        parallel: int,
+        on_error: OnErrorType,
+        sql_variables: Optional[str],
+        python_variables: Dict,
+    ) -> Generator[Dict, None, None]:
+        """
+        Executes (file path, file stage path, original path) tuples, running up to `parallel` SQL files
+        at the same time with asynchronous queries. Files in the same directory are executed one at a time,
+        in order, and a directory is started only once all files of its parent directories have been executed.
+        Files from unrelated directories are executed concurrently. Python files are executed synchronously
+        when their turn comes. Results are yielded as executions complete.
+
+        With on_error=break, no new file is started after the first failure. Executions that are already
+        running are awaited and their failures reported, then the first error is raised.
+        """
+        files_by_directory: Dict[str, Deque[Tuple[str, str, str]]] = {}
+        for file in files:
+            files_by_directory.setdefault(path.dirname(file[0]), deque()).append(file)
+
+        waiting = deque(files_by_directory.items())
+        running: Dict[
+            str, Tuple[str, Deque[Tuple[str, str, str]], str, SnowflakeCursor]
+        ] = {}
+        error: Optional[Exception] = None
+
+        def failure(original_file: str, exception: ProgrammingError) -> Optional[Dict]:
+            nonlocal error
+            if on_error == OnErrorType.BREAK and error is None:
+                error = exception
+                return None
+            return StageManager._error_result(file=original_file, msg=exception.msg)
+
+        def next_directory() -> Optional[Tuple[str, Deque[Tuple[str, str, str]]]]:
+            # the first waiting directory none of whose parent directories is still being executed
+            unfinished = [d for d, _ in waiting] + [d for d, *_ in running.values()]
+            for i, (directory, directory_files) in enumerate(waiting):
+                if not any(_is_parent_directory(d, directory) for d in unfinished):
+                    del waiting[i]
+                    return directory, directory_files
+            return None
+
+        try:
+            while running or (waiting and error is None):
+                while waiting and error is None and len(running) < parallel:
+                    if (next_group := next_directory()) is None:
+                        break
+                    directory, directory_files = next_group
+                    (
+                        file_path,
+                        file_stage_path,
+                        original_path,
+                    ) = directory_files.popleft()
+                    if file_path.endswith(".py"):
+                        try:
+                            yield self._execute_python(
+                                file_stage_path=file_stage_path,
+                                on_error=on_error,
+                                variables=python_variables,
+                                original_file=original_path,
+                            )
+                        except Exception as e:
+                            error = error or e
+                        if directory_files:
+                            waiting.appendleft((directory, directory_files))
+                        continue
+
+                    cursor = self._conn.cursor()
+                    try:
+                        cursor.execute_async(
+                            self._execute_immediate_query(
+                                file_stage_path, sql_variables
+                            )
+                        )
+                    except ProgrammingError as e:
+                        cursor.close()
+                        if result := failure(original_path, e):
+                            yield result
+                        if directory_files:
+                            waiting.appendleft((directory, directory_files))
+                        continue
+                    running[cursor.sfqid] = (
+                        directory,
+                        directory_files,
+                        original_path,
+                        cursor,
+                    )
+
+                finished = False
+                for query_id, (
+                    directory,
+                    directory_files,
+                    original_path,
+                    cursor,
+                ) in list(running.items()):
+                    if self._conn.is_still_running(
+                        self._conn.get_query_status(query_id)
+                    ):
+                        continue
+                    finished = True
+                    del running[query_id]
+                    cursor.close()
+                    try:
+                        self._conn.get_query_status_throw_if_error(query_id)
+                        yield StageManager._success_result(file=original_path)
+                    except ProgrammingError as e:
+                        if result := failure(original_path, e):
+                            yield result
+                    # the next file from the same directory keeps the turn of its directory
+                    if directory_files:
+                        waiting.appendleft((directory, directory_files))
+
+                if running and not finished:
+                    time.sleep(EXECUTE_POLL_INTERVAL_SECONDS)
+        finally:
+            for *_, cursor in running.values():
+                cursor.close()
+
+        if error is not None:
+            raise error
+
+    def _execute_immediate_query(
+        self, file_stage_path: str, variables: Optional[str]
+    ) -> str:
+        query = f"execute immediate from {self.quote_stage_name(file_stage_path)}"
+        if variables:
+            query += variables
+        return query
+
     def _call_execute_immediate(
         self,
         file_stage_path: str,
@@ -691,10 +1428,9 @@ class StageManager(SqlExecutionMixin):
         original_file: str,
     ) -> Dict:
         try:
-            query = f"execute immediate from {self.quote_stage_name(file_stage_path)}"
-            if variables:
-                query += variables
-            self.execute_query(query)
+            self.execute_query(
+                self._execute_immediate_query(file_stage_path, variables)
+            )
             return StageManager._success_result(file=original_file)
         except ProgrammingError as e:
             StageManager._handle_execution_exception(on_error=on_error, exception=e)
@@ -716,21 +1452,10 @@ class StageManager(SqlExecutionMixin):
         if not req_files_on_stage:
             return []
 
-        # Construct all possible path for requirements file for this context
-        req_file_name = "requirements.txt"
-        possible_req_files = []
-        while not current_dir.is_root():
-            current_file = current_dir / req_file_name
-            possible_req_files.append(current_file)
-            current_dir = current_dir.parent
-
-        current_file = current_dir / req_file_name
-        possible_req_files.append(current_file)
-
         # Now for every possible path check if the file exists on stage,
         # if yes break, we use the first possible file
         requirements_file: StagePath | None = None
-        for req_file in possible_req_files:
+        for req_file in self._possible_requirements_files(current_dir):
             if (
                 req_file.absolute_path(no_fqn=True, at_prefix=False)
                 in req_files_on_stage
@@ -742,7 +1467,22 @@ class StageManager(SqlExecutionMixin):
         if requirements_file is None:
             return []
 
-        # req_file at this moment is the first found requirements file
+        return self._read_requirements_file(requirements_file, stage_path)
+
+    @staticmethod
+    def _possible_requirements_files(current_dir: StagePath) -> List[StagePath]:
+        """Returns all possible paths of the requirements file for this context, closest first."""
+        req_file_name = "requirements.txt"
+        possible_req_files = []
+        while not current_dir.is_root():
+            possible_req_files.append(current_dir / req_file_name)
+            current_dir = current_dir.parent
+        possible_req_files.append(current_dir / req_file_name)
+        return possible_req_files
+
+    def _read_requirements_file(
+        self, requirements_file: StagePath, stage_path: StagePath
+    ) -> List[str]:
         requirements_path = requirements_file.with_stage(stage_path.stage)
         with SecurePath.temporary_directory() as tmp_dir:
             self.get(str(requirements_path), tmp_dir.path)
@@ -752,8 +1492,24 @@ class StageManager(SqlExecutionMixin):
 
         return [req.package_name for req in requirements]
 
-    def _bootstrap_snowpark_execution_environment(self, stage_path: StagePath):
-        """Prepares Snowpark session for executing Python code remotely."""
+    def _bootstrap_snowpark_execution_environment(
+        self,
+        stage_path: StagePath,
+        listed_files: Optional[Dict[str, Optional[str]]] = None,
+    ) -> Union[str, Callable]:
+        """
+        Prepares the environment for executing Python code remotely. Returns the name of a permanent
+        procedure if the python_procedure_schema is configured, or a Snowpark temporary procedure otherwise.
+        """
+        procedure_schema = get_config_value(
+            *STAGE_SECTION_PATH, key="python_procedure_schema", default=None
+        )
+        if procedure_schema:
+            # the permanent procedure is called with plain SQL, no Snowpark session is needed
+            return self._get_cached_python_execution_procedure(
+                procedure_schema, stage_path, listed_files
+            )
+
         if sys.version_info >= PYTHON_3_12:
             raise ClickException(
                 f"Executing Python files is not supported in Python >= 3.12. Current version: {sys.version}"
@@ -761,9 +1517,8 @@ class StageManager(SqlExecutionMixin):
 
         from snowflake.snowpark.functions import sproc
 
-        self.snowpark_session.add_packages("snowflake-snowpark-python")
-        self.snowpark_session.add_packages("snowflake.core")
         requirements = self._check_for_requirements_file(stage_path)
+        self.snowpark_session.add_packages(*PYTHON_EXECUTION_PACKAGES)
         self.snowpark_session.add_packages(*requirements)
 
         @sproc(is_permanent=False, session=self.snowpark_session)
@@ -789,6 +1544,96 @@ class StageManager(SqlExecutionMixin):
 
         return _python_execution_procedure
 
+    def _get_cached_python_execution_procedure(
+        self,
+        schema: str,
+        stage_path: StagePath,
+        listed_files: Optional[Dict[str, Optional[str]]] = None,
+    ) -> str:
+        """
+        Returns the name of a permanent procedure executing Python files, created in the given schema
+        with caller's rights. The name is derived from the md5 of the requirements file found on stage,
+        the Python version and the code version, so the requirements are only downloaded and the procedure
+        only created if no procedure exists yet for them.
+        """
+        current_dir = stage_path.parent if stage_path.is_file() else stage_path
+        if listed_files is None:
+            listed_files = {
+                file["name"]: file.get("md5")
+                for file in self.iter_files(
+                    current_dir, pattern=r".*requirements\.txt$"
+                )
+            }
+        requirements_file = next(
+            (
+                req_file
+                for req_file in self._possible_requirements_files(current_dir)
+                if req_file.absolute_path(no_fqn=True, at_prefix=False) in listed_files
+            ),
+            None,
+        )
+
+        requirements: Optional[List[str]] = None
+        requirements_md5 = None
+        if requirements_file is not None:
+            requirements_md5 = listed_files[
+                requirements_file.absolute_path(no_fqn=True, at_prefix=False)
+            ]
+            if not requirements_md5:
+                # without md5 the procedure can only be identified by its packages
+                requirements = sorted(
+                    set(self._read_requirements_file(requirements_file, stage_path))
+                )
+
+        runtime_version = f"{sys.version_info.major}.{sys.version_info.minor}"
+        key = hashlib.sha256(
+            json.dumps(
+                [
+                    PYTHON_EXECUTION_PROCEDURE_VERSION,
+                    runtime_version,
+                    requirements_md5,
+                    requirements,
+                ]
+            ).encode()
+        ).hexdigest()[:16]
+        procedure_name = (
+            f"{PYTHON_EXECUTION_PROCEDURE_PREFIX}"
+            f"_V{PYTHON_EXECUTION_PROCEDURE_VERSION}_{key.upper()}"
+        )
+        qualified_procedure_name = f"{schema}.{procedure_name}"
+
+        existing_procedure = self.execute_query(
+            f"show procedures like {to_string_literal(procedure_name)} in schema {schema}"
+        ).fetchone()
+        if existing_procedure is not None:
+            return qualified_procedure_name
+
+        if requirements is None:
+            requirements = (
+                self._read_requirements_file(requirements_file, stage_path)
+                if requirements_file is not None
+                else []
+            )
+        packages = sorted({*PYTHON_EXECUTION_PACKAGES, *requirements})
+        self.execute_query(
+            dedent(
+                f"""\
+                create procedure if not exists {qualified_procedure_name}(file_path varchar, variables object)
+                returns varchar
+                language python
+                runtime_version = '{runtime_version}'
+                packages = ({", ".join(to_string_literal(p) for p in packages)})
+                handler = 'main'
+                comment = 'Created by Snowflake CLI to execute Python files from stages'
+                execute as caller
+                as $$
+                {indent(PYTHON_EXECUTION_PROCEDURE_HANDLER, " " * 16).strip()}
+                $$
+                """
+            )
+        )
+        return qualified_procedure_name
+
     def _execute_python(
         self,
         file_stage_path: str,
@@ -797,13 +1642,26 @@ class StageManager(SqlExecutionMixin):
         original_file: str,
     ):
         """
-        Executes Python file from stage using a Snowpark temporary procedure.
+        Executes Python file from stage using a Snowpark temporary procedure,
+        or the permanent procedure if one is configured.
         Currently, there's no option to pass input to the execution.
         """
+        file_path = self.get_standard_stage_prefix(file_stage_path)
+        if isinstance(self._python_exe_procedure, str):
+            try:
+                self.execute_query(
+                    f"call {self._python_exe_procedure}({to_string_literal(file_path)}, "
+                    f"parse_json({to_string_literal(json.dumps(variables or {}))})::object)"
+                )
+                return StageManager._success_result(file=original_file)
+            except ProgrammingError as e:
+                StageManager._handle_execution_exception(on_error=on_error, exception=e)
+                return StageManager._error_result(file=original_file, msg=e.msg)
+
         from snowflake.snowpark.exceptions import SnowparkSQLException
 
         try:
-            self._python_exe_procedure(self.get_standard_stage_prefix(file_stage_path), variables, session=self.snowpark_session)  # type: ignore
+            self._python_exe_procedure(file_path, variables, session=self.snowpark_session)  # type: ignore
             return StageManager._success_result(file=original_file)
         except SnowparkSQLException as e:
             StageManager._handle_execution_exception(on_error=on_error, exception=e)
@@ -0,0 +1,191 @@
+# Copyright (c) 2024 Snowflake Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from tempfile import TemporaryDirectory
+from typing import Any, Dict, Optional, Tuple
+
+from snowflake.cli._plugins.stage.manager import StageManager
+from snowflake.cli.api.cache_files import (
+    config_dir_cache_path,
+    dump_versioned_json,
+    load_versioned_json,
+    read_cache_file,
+    write_cache_file,
+)
+from snowflake.cli.api.secure_path import UNLIMITED, SecurePath
+
+# Hidden file kept in the root of a stage, describing the files deployed to it
+DEPLOY_MANIFEST_FILE_NAME = ".snowflake_cli_deploy_manifest.json"
+DEPLOY_MANIFEST_VERSION = 1
+LOCAL_MANIFESTS_DIR_NAME = ".stage_deploy_manifests"
+
+log = logging.getLogger(__name__)
+
+# (md5, last_modified) of the manifest file, as listed on the stage
+ManifestStamp = Tuple[str, str]
+
+
+@dataclass
+class ManifestEntry:
+    md5: Optional[str]
+    "Plain md5sum of the local file that was uploaded, None if unknown"
+
+    size: Optional[int] = None
+    uploaded_at: Optional[float] = None
+
+    def to_json(self) -> list:
+        return [self.md5, self.size, self.uploaded_at]
+
+    @classmethod
+    def from_json(cls, data: list) -> ManifestEntry:
+        md5, size, uploaded_at = data
+        return cls(md5=md5, size=size, uploaded_at=uploaded_at)
+
+
+@dataclass
+class DeployManifest:
+    """
+    Describes the files deployed to a stage, with the md5sums of the local files they were
+    uploaded from. As opposed to the md5sums reported by the stage, these can be compared
+    with local files regardless of the encryption used by the stage.
+    """
+
+    entries: Dict[PurePosixPath, ManifestEntry] = field(default_factory=dict)
+
+    stamp: Optional[ManifestStamp] = field(default=None, compare=False)
+    "Stamp of the manifest file on the stage this manifest was read from, None if it was not"
+
+    def to_json(self) -> str:
+        return dump_versioned_json(DEPLOY_MANIFEST_VERSION, self.to_dict())
+
+    @classmethod
+    def from_json(cls, text: str, stamp: Optional[ManifestStamp] = None):
+        return cls.from_dict(
+            load_versioned_json(text, DEPLOY_MANIFEST_VERSION), stamp=stamp
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "entries": {
+                str(path): entry.to_json() for path, entry in self.entries.items()
+            }
+        }
+
+    @classmethod
+    def from_dict(
+        cls, data: Dict[str, Any], stamp: Optional[ManifestStamp] = None
+    ) -> DeployManifest:
+        return cls(
+            entries={
+                PurePosixPath(path): ManifestEntry.from_json(entry)
+                for path, entry in data["entries"].items()
+            },
+            stamp=stamp,
+        )
+
+
+def _local_manifest_file(stage_fqn: str) -> SecurePath:
+    file_name = hashlib.sha256(stage_fqn.encode()).hexdigest() + ".json"
+    return config_dir_cache_path(LOCAL_MANIFESTS_DIR_NAME, file_name)
+
+
+def _remote_manifest_stamp(
+    stage_manager: StageManager, stage_fqn: str
+) -> Optional[ManifestStamp]:
+    """Lists only the manifest file on the stage, returning None if it does not exist."""
+    rows = stage_manager.list_files(
+        f"{stage_fqn}/{DEPLOY_MANIFEST_FILE_NAME}"
+    ).fetchall()
+    for row in rows:
+        if row["name"].split("/")[-1] == DEPLOY_MANIFEST_FILE_NAME:
+            return row["md5"], str(row["last_modified"])
+    return None
+
+
+def _read_local_manifest(
+    stage_fqn: str, stamp: ManifestStamp
+) -> Optional[DeployManifest]:
+    manifest = read_cache_file(
+        _local_manifest_file(stage_fqn),
+        DEPLOY_MANIFEST_VERSION,
+        lambda data: DeployManifest.from_dict(data, stamp=tuple(data["stamp"])),
+    )
+    if manifest is None or manifest.stamp != stamp:
+        return None
+    return manifest
+
+
+def _write_local_manifest(stage_fqn: str, manifest: DeployManifest) -> None:
+    write_cache_file(
+        _local_manifest_file(stage_fqn),
+        DEPLOY_MANIFEST_VERSION,
+        {"stamp": manifest.stamp, **manifest.to_dict()},
+    )
+
+
+def load_deploy_manifest(
+    stage_manager: StageManager, stage_fqn: str
+) -> Optional[DeployManifest]:
+    """
+    Returns the deploy manifest of the given stage, or None if the stage has none.
+    Only the manifest file is listed on the stage; if it did not change since this
+    machine last wrote or read it, the local copy is used, otherwise it is downloaded.
+    """
+    stamp = _remote_manifest_stamp(stage_manager, stage_fqn)
+    if stamp is None:
+        return None
+
+    if (manifest := _read_local_manifest(stage_fqn, stamp)) is not None:
+        return manifest
+
+    with TemporaryDirectory() as tmp:
+        stage_manager.get(
+            stage_path=f"{stage_fqn}/{DEPLOY_MANIFEST_FILE_NAME}", dest_path=Path(tmp)
+        )
+        downloaded = SecurePath(Path(tmp) / DEPLOY_MANIFEST_FILE_NAME)
+        try:
+            manifest = DeployManifest.from_json(
+                downloaded.read_text(file_size_limit_mb=UNLIMITED), stamp=stamp
+            )
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            log.warning("Ignoring invalid deploy manifest of stage %s", stage_fqn)
+            return None
+
+    _write_local_manifest(stage_fqn, manifest)
+    return manifest
+
+
+def save_deploy_manifest(
+    stage_manager: StageManager, stage_fqn: str, manifest: DeployManifest
+) -> None:
+    """
+    Uploads the manifest to the stage, and keeps a local copy of it, so that the next
+    diff against the stage does not need to download it.
+    """
+    with TemporaryDirectory() as tmp:
+        manifest_file = SecurePath(Path(tmp) / DEPLOY_MANIFEST_FILE_NAME)
+        manifest_file.write_text(manifest.to_json())
+        stage_manager.put(
+            local_path=manifest_file.path, stage_path=stage_fqn, overwrite=True
+        )
+
+    manifest.stamp = _remote_manifest_stamp(stage_manager, stage_fqn)
+    if manifest.stamp is not None:
+        _write_local_manifest(stage_fqn, manifest)
@@ -17,17 +17,22 @@ from __future__ import annotations
 import hashlib
 import logging
 import math
-import os.path
+import mmap
+import os
 import re
 from pathlib import Path
-from typing import List, Tuple
+from typing import TYPE_CHECKING, BinaryIO, Dict, List, Optional, Sequence, Tuple
 
 from click.exceptions import ClickException
 from snowflake.cli.api.secure_path import UNLIMITED, SecurePath
 from snowflake.connector.constants import S3_CHUNK_SIZE, S3_MAX_PARTS, S3_MIN_PART_SIZE
 
+if TYPE_CHECKING:
+    from snowflake.cli._plugins.stage.checksum_cache import ChecksumCache
+
 ONE_MEGABYTE = 1024**2
 READ_BUFFER_BYTES = 64 * 1024
+HASH_BLOCK_BYTES = ONE_MEGABYTE
 MD5SUM_REGEX = r"^[A-Fa-f0-9]{32}$"
 MULTIPART_MD5SUM_REGEX = r"^([A-Fa-f0-9]{32})-(\d+)$"
 
@@ -57,10 +62,76 @@ def parse_multipart_md5sum(checksum: str) -> Tuple[str, int] | None:
     return None
 
 
-def compute_md5sum(file: Path, chunk_size: int | None = None) -> str:
+class _MD5Hasher:
     """
-    Returns a hexadecimal checksum for the file located at the given path.
-    If chunk_size is given, computes a multi-part md5sum.
+    Incrementally computes a plain or multi-part md5sum from consecutive blocks of a file.
+    """
+
+    def __init__(self, chunk_size: int | None):
+        self._chunk_size = chunk_size
+        self._part_digests: List[bytes] = []
+        self._hasher = hashlib.md5()
+        self._bytes_in_part = 0
+
+    def update(self, block: memoryview) -> None:
+        if not self._chunk_size:
+            self._hasher.update(block)
+            return
+
+        offset = 0
+        while offset < len(block):
+            size = min(self._chunk_size - self._bytes_in_part, len(block) - offset)
+            self._hasher.update(block[offset : offset + size])
+            offset += size
+            self._bytes_in_part += size
+            if self._bytes_in_part == self._chunk_size:
+                # push the hash of this chunk + reset
+                self._part_digests.append(self._hasher.digest())
+                self._hasher = hashlib.md5()
+                self._bytes_in_part = 0
+
+    def hexdigest(self) -> str:
+        if not self._chunk_size:
+            return self._hasher.hexdigest()
+
+        part_digests = self._part_digests
+        if self._bytes_in_part:
+            part_digests = part_digests + [self._hasher.digest()]
+        # multi-part hash (e.g. aws)
+        digests_md5 = hashlib.md5(b"".join(part_digests))
+        return f"{digests_md5.hexdigest()}-{len(part_digests)}"
+
+
+def _update_hashers(f: BinaryIO, file_size: int, hashers: List[_MD5Hasher]) -> None:
+    """
+    Feeds the whole content of an open file to all hashers in a single pass.
+    The file is memory-mapped when possible, so blocks are passed to the hashers without copying.
+    """
+    try:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                for offset in range(0, file_size, HASH_BLOCK_BYTES):
+                    with view[offset : offset + HASH_BLOCK_BYTES] as block:
+                        for hasher in hashers:
+                            hasher.update(block)
+            return
+    except (OSError, ValueError):
+        log.debug("Cannot memory-map %s, falling back to buffered reads", f.name)
+
+    buffer = bytearray(READ_BUFFER_BYTES)
+    with memoryview(buffer) as view:
+        while size := f.readinto(buffer):
+            with view[:size] as block:
+                for hasher in hashers:
+                    hasher.update(block)
+
+
+def compute_md5sums(
+    file: Path, chunk_sizes: Sequence[int | None]
+) -> Dict[int | None, str]:
+    """
+    Returns hexadecimal checksums for the file located at the given path, one for each
+    of the given chunk sizes (None meaning a plain md5sum), reading the file only once.
     """
     if not file.is_file():
         raise ValueError(
@@ -74,45 +145,111 @@ def compute_md5sum(file: Path, chunk_size: int | None = None) -> str:
     file_size = os.path.getsize(file)
     if file_size == 0:
         # simple md5 with no content
-        return hashlib.md5().hexdigest()
+        return {chunk_size: hashlib.md5().hexdigest() for chunk_size in chunk_sizes}
 
+    hashers = {chunk_size: _MD5Hasher(chunk_size) for chunk_size in chunk_sizes}
     with SecurePath(file).open("rb", read_file_limit_mb=UNLIMITED) as f:
-        md5s: List[hashlib._Hash] = []  # noqa: SLF001
-        hasher = hashlib.md5()
-
-        remains = file_size
-        remains_in_chunk: int = min(chunk_size, remains) if chunk_size else remains
-        while remains > 0:
-            sz = min(READ_BUFFER_BYTES, remains_in_chunk)
-            buf = f.read(sz)
-            hasher.update(buf)
-            remains_in_chunk -= sz
-            remains -= sz
-            if remains_in_chunk == 0:
-                if not chunk_size:
-                    # simple md5; only one chunk processed
-                    return hasher.hexdigest()
-                else:
-                    # push the hash of this chunk + reset
-                    md5s.append(hasher)
-                    hasher = hashlib.md5()
-                    remains_in_chunk = min(chunk_size, remains)
+        _update_hashers(f, file_size, list(hashers.values()))
+
+    return {chunk_size: hasher.hexdigest() for chunk_size, hasher in hashers.items()}
+
+
+def compute_md5sum(file: Path, chunk_size: int | None = None) -> str:
+    """
+    Returns a hexadecimal checksum for the file located at the given path.
+    If chunk_size is given, computes a multi-part md5sum.
+    """
+    return compute_md5sums(file, [chunk_size])[chunk_size]
+
+
+def compute_md5sums_cached(
+    file: Path,
+    chunk_sizes: Sequence[int | None],
+    cache: Optional[ChecksumCache] = None,
+    expected_md5: Optional[str] = None,
+    stat_result: Optional[os.stat_result] = None,
+) -> Dict[int | None, str]:
+    """
+    Same as compute_md5sums, but consults the given checksum cache first and
+    stores newly computed checksums in it. If one of the cached checksums equals
+    expected_md5, the file is not read and only the cached checksums are returned.
+    A stat result of the file obtained before calling this function can be passed
+    to avoid stat-ing the file again.
+    """
+    md5s: Dict[int | None, str] = {}
+    if cache is not None:
+        stat_result = stat_result or os.stat(file)
+        for chunk_size in chunk_sizes:
+            if (md5 := cache.get(file, chunk_size, stat_result)) is not None:
+                md5s[chunk_size] = md5
+        if expected_md5 is not None and expected_md5 in md5s.values():
+            return md5s
+
+    missing_chunk_sizes = [c for c in chunk_sizes if c not in md5s]
+    if missing_chunk_sizes:
+        computed_md5s = compute_md5sums(file, missing_chunk_sizes)
+        if cache is not None:
+            for chunk_size, md5 in computed_md5s.items():
+                cache.put(file, chunk_size, md5, stat_result)
+        md5s.update(computed_md5s)
+    return md5s
 
-        # multi-part hash (e.g. aws)
-        digests = b"".join(m.digest() for m in md5s)
-        digests_md5 = hashlib.md5(digests)
-        return f"{digests_md5.hexdigest()}-{len(md5s)}"
 
+def multipart_chunk_size_candidates(file_size: int, num_chunks: int) -> List[int]:
+    """
+    Returns the chunk sizes, most likely first, that a file of the given size may have
+    been uploaded with to produce a multi-part md5sum consisting of num_chunks parts.
 
-def file_matches_md5sum(local_file: Path, remote_md5: str | None) -> bool:
+    Uses values from the Python connector to make educated guesses on chunk size.
+    """
+    candidates: List[int] = []
+
+    # If this file uses the maximum number of parts supported by the cloud backend,
+    # the chunk size is likely not a clean multiple of a megabyte. Try reverse engineering
+    # from the file size first, then fall back to the usual detection method.
+    # At time of writing this logic would trigger for files >= 80GiB (python connector)
+    if num_chunks == S3_MAX_PARTS:
+        candidates.append(max(math.ceil(file_size / S3_MAX_PARTS), S3_MIN_PART_SIZE))
+
+    # Estimates the chunk size the multi-part file must have been uploaded with
+    # by trying chunk sizes that give the most evenly-sized chunks.
+    #
+    # First we'll try the chunk size that's a multiple of S3_CHUNK_SIZE (8mb) from
+    # the python connector that results in num_chunks, then we'll do the same with
+    # a smaller granularity (1mb) that is used by default in some AWS multi-part
+    # upload implementations.
+    #
+    # We're working backwards from num_chunks here because it's the only value we know.
+    for chunk_size_alignment in [S3_CHUNK_SIZE, ONE_MEGABYTE]:
+        # +1 because we need at least one chunk when file_size < num_chunks * chunk_size_alignment
+        # -1 because we don't want to add an extra chunk when file_size is an exact multiple of num_chunks * chunk_size_alignment
+        multiplier = 1 + ((file_size - 1) // (num_chunks * chunk_size_alignment))
+        candidates.append(multiplier * chunk_size_alignment)
+
+    # a chunk size splitting the file into a different number of parts can never match
+    return [
+        chunk_size
+        for i, chunk_size in enumerate(candidates)
+        if chunk_size > 0
+        and chunk_size not in candidates[:i]
+        and math.ceil(file_size / chunk_size) == num_chunks
+    ]
+
+
+def file_matches_md5sum(
+    local_file: Path,
+    remote_md5: str | None,
+    cache: Optional[ChecksumCache] = None,
+    stat_result: Optional[os.stat_result] = None,
+) -> bool:
     """
     Try a few different md5sums to determine if a local file is identical
     to a file that has a given remote md5sum.
 
-    Handles the multi-part md5sums generated by e.g. AWS S3, using values
-    from the Python connector to make educated guesses on chunk size.
-
-    Assumes that upload time would dominate local hashing time.
+    Handles the multi-part md5sums generated by e.g. AWS S3. All candidate chunk
+    sizes are hashed in a single pass over the file. If a checksum cache is provided,
+    previously computed md5sums of unchanged files are reused. A stat result of the
+    local file can be passed to avoid stat-ing it again.
     """
     if not remote_md5:
         # no hash available
@@ -120,37 +257,25 @@ def file_matches_md5sum(local_file: Path, remote_md5: str | None) -> bool:
 
     if is_md5sum(remote_md5):
         # regular hash
-        return compute_md5sum(local_file) == remote_md5
+        md5s = compute_md5sums_cached(
+            local_file, [None], cache, stat_result=stat_result
+        )
+        return md5s[None] == remote_md5
 
     if md5_and_chunks := parse_multipart_md5sum(remote_md5):
         # multi-part hash (e.g. aws)
         (_, num_chunks) = md5_and_chunks
-        file_size = os.path.getsize(local_file)
-
-        # If this file uses the maximum number of parts supported by the cloud backend,
-        # the chunk size is likely not a clean multiple of a megabyte. Try reverse engineering
-        # from the file size first, then fall back to the usual detection method.
-        # At time of writing this logic would trigger for files >= 80GiB (python connector)
-        if num_chunks == S3_MAX_PARTS:
-            chunk_size = max(math.ceil(file_size / S3_MAX_PARTS), S3_MIN_PART_SIZE)
-            if compute_md5sum(local_file, chunk_size) == remote_md5:
-                return True
-
-        # Estimates the chunk size the multi-part file must have been uploaded with
-        # by trying chunk sizes that give the most evenly-sized chunks.
-        #
-        # First we'll try the chunk size that's a multiple of S3_CHUNK_SIZE (8mb) from
-        # the python connector that results in num_chunks, then we'll do the same with
-        # a smaller granularity (1mb) that is used by default in some AWS multi-part
-        # upload implementations.
-        #
-        # We're working backwards from num_chunks here because it's the only value we know.
-        for chunk_size_alignment in [S3_CHUNK_SIZE, ONE_MEGABYTE]:
-            # +1 because we need at least one chunk when file_size < num_chunks * chunk_size_alignment
-            # -1 because we don't want to add an extra chunk when file_size is an exact multiple of num_chunks * chunk_size_alignment
-            multiplier = 1 + ((file_size - 1) // (num_chunks * chunk_size_alignment))
-            chunk_size = multiplier * chunk_size_alignment
-            if compute_md5sum(local_file, chunk_size) == remote_md5:
+        file_size = stat_result.st_size if stat_result else os.path.getsize(local_file)
+        chunk_sizes = multipart_chunk_size_candidates(file_size, num_chunks)
+        if chunk_sizes:
+            md5s = compute_md5sums_cached(
+                local_file,
+                chunk_sizes,
+                cache,
+                expected_md5=remote_md5,
+                stat_result=stat_result,
+            )
+            if remote_md5 in md5s.values():
                 return True
 
         # we were unable to figure out the chunk size, or the files are different
@@ -0,0 +1,95 @@
+# Copyright (c) 2024 Snowflake Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Cache files kept by the CLI next to its configuration file. Caches are an optimisation
+only: a missing, outdated or corrupted cache file is ignored, and failing to write one
+never fails the command.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from snowflake.cli.api.secure_path import UNLIMITED, SecurePath
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def config_dir_cache_path(*parts: str) -> SecurePath:
+    """
+    Returns the path of a cache file or directory in the directory of the configuration file.
+    The path is resolved on each call, so that it follows the currently loaded configuration.
+    """
+    from snowflake.connector import config_manager
+
+    return SecurePath(config_manager.CONFIG_MANAGER.file_path.parent.joinpath(*parts))
+
+
+def dump_versioned_json(version: int, data: Dict[str, Any]) -> str:
+    return json.dumps({"version": version, **data}, separators=(",", ":"))
+
+
+def load_versioned_json(text: str, version: int) -> Dict[str, Any]:
+    """Parses JSON written by dump_versioned_json, raising ValueError if it is of another version."""
+    data = json.loads(text)
+    if data.get("version") != version:
+        raise ValueError(f"Unsupported version: {data.get('version')}")
+    return data
+
+
+def read_cache_file(
+    cache_file: SecurePath, version: int, parse: Callable[[Dict[str, Any]], T]
+) -> Optional[T]:
+    """
+    Returns the data of a cache file converted by parse, or None if the file is missing,
+    outdated or corrupted.
+    """
+    if not cache_file.exists():
+        return None
+    try:
+        return parse(
+            load_versioned_json(
+                cache_file.read_text(file_size_limit_mb=UNLIMITED), version
+            )
+        )
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        log.debug("Ignoring corrupted cache file %s", cache_file, exc_info=True)
+        return None
+
+
+def write_cache_file(
+    cache_file: SecurePath,
+    version: int,
+    data: Dict[str, Any],
+    private: bool = False,
+) -> bool:
+    """
+    Writes data to a cache file, readable by its owner only if private is set.
+    Returns whether the file was written.
+    """
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        if private:
+            cache_file.touch()
+            cache_file.restrict_permissions()
+        cache_file.write_text(dump_versioned_json(version, data))
+        return True
+    except OSError:
+        log.debug("Could not save cache file %s", cache_file, exc_info=True)
+        return False
@@ -43,6 +43,7 @@ class _CliGlobalContextManager:
     )
 
     output_format: OutputFormat = OutputFormat.TABLE
+    output_file: Path | None = None
     silent: bool = False
     verbose: bool = False
     experimental: bool = False
@@ -165,6 +166,10 @@ class _CliGlobalContextAccess:
     def output_format(self) -> OutputFormat:
         return self._manager.output_format
 
+    @property
+    def output_file(self) -> Path | None:
+        return self._manager.output_file
+
     @property
     def verbose(self) -> bool:
         return self._manager.verbose
@@ -194,7 +199,7 @@ class _CliGlobalContextAccess:
     @property
     def _should_force_mute_intermediate_output(self) -> bool:
         """Computes whether cli_console output should be muted."""
-        return self._manager.output_format == OutputFormat.JSON
+        return self._manager.output_format != OutputFormat.TABLE
 
 
 _CLI_CONTEXT_MANAGER: ContextVar[_CliGlobalContextManager | None] = ContextVar(
@@ -17,6 +17,7 @@ from __future__ import annotations
 import inspect
 from functools import wraps
 from inspect import Signature
+from pathlib import Path
 from typing import Callable, Dict, List, Optional, get_type_hints
 
 from snowflake.cli.api.cli_global_context import get_cli_context
@@ -32,6 +33,7 @@ from snowflake.cli.api.commands.flags import (
     HostOption,
     MasterTokenOption,
     MfaPasscodeOption,
+    OutputFileOption,
     OutputFormatOption,
     PasswordOption,
     PortOption,
@@ -335,6 +337,12 @@ GLOBAL_OPTIONS = [
         annotation=OutputFormat,
         default=OutputFormatOption,
     ),
+    inspect.Parameter(
+        "output_file",
+        inspect.Parameter.KEYWORD_ONLY,
+        annotation=Optional[Path],
+        default=OutputFileOption,
+    ),
     inspect.Parameter(
         "verbose",
         inspect.Parameter.KEYWORD_ONLY,
@@ -321,12 +321,23 @@ DiagAllowlistPathOption: Path = typer.Option(
 OutputFormatOption = typer.Option(
     OutputFormat.TABLE.value,
     "--format",
-    help="Specifies the output format.",
+    help="Specifies the output format: TABLE, JSON, CSV, TSV or NDJSON (JSON Lines).",
+    metavar="FORMAT",
     case_sensitive=False,
     callback=_context_callback("output_format"),
     rich_help_panel=_CLI_BEHAVIOUR,
 )
 
+OutputFileOption = typer.Option(
+    None,
+    "--output-file",
+    help="Writes the output of the command to this file instead of the standard output.",
+    callback=_context_callback("output_file"),
+    dir_okay=False,
+    show_default=False,
+    rich_help_panel=_CLI_BEHAVIOUR,
+)
+
 SilentOption = typer.Option(
     False,
     "--silent",
@@ -413,6 +424,14 @@ ExecuteVariablesOption = variables_option(
     "In case of SQL files string values must be quoted in `''` (consider embedding quoting in the file).",
 )
 
+ExecuteParallelOption = typer.Option(
+    1,
+    "--parallel",
+    help="Number of files executed at the same time. Files in the same directory are always executed one after another, "
+    "in alphabetical order, while files from different directories are executed concurrently.",
+    min=1,
+)
+
 
 def like_option(help_example: str):
     return typer.Option(
@@ -99,11 +99,14 @@ class SnowTyper(typer.Typer):
             @wraps(command_callable)
             def command_callable_decorator(*args, **kw):
                 """Wrapper around command callable. This is what happens at "runtime"."""
+                from snowflake.cli._app.printing import keep_output_files_open
+
                 execution = ExecutionMetadata()
                 self.pre_execute(execution, require_warehouse=require_warehouse)
                 try:
-                    result = command_callable(*args, **kw)
-                    self.process_result(result)
+                    with keep_output_files_open():
+                        result = command_callable(*args, **kw)
+                        self.process_result(result)
                     execution.complete(ExecutionStatus.SUCCESS)
                 except BaseException as err:
                     execution.complete(ExecutionStatus.FAILURE)
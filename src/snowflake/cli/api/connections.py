@@ -55,6 +55,7 @@ class ConnectionContext:
     session_token: Optional[str] = None
     master_token: Optional[str] = None
     token_file_path: Optional[Path] = None
+    paramstyle: Optional[str] = None
 
     VALIDATED_FIELD_NAMES = ["schema"]
 
@@ -118,7 +119,11 @@ class ConnectionContext:
         if not self.temporary_connection and not self.connection_name:
             self.connection_name = get_default_connection_name()
 
-    def build_connection(self):
+    def build_connection(self, use_session_cache: bool = False):
+        """
+        Connects to Snowflake. Only the primary connection of a command should use
+        the session cache; any other connection gets a session of its own.
+        """
         from snowflake.cli._app.snow_connector import connect_to_snowflake
 
         # Ignore warnings about bad owner or permissions on Windows
@@ -130,7 +135,9 @@ class ConnectionContext:
                 module="snowflake.connector.config_manager",
             )
 
-        return connect_to_snowflake(**self.present_values_as_dict())
+        return connect_to_snowflake(
+            use_session_cache=use_session_cache, **self.present_values_as_dict()
+        )
 
 
 class OpenConnectionCache:
@@ -183,7 +190,7 @@ class OpenConnectionCache:
             # This means that we could return a stale (incorrect) connection for the
             # given ConnectionContext if get_env_value or get_connection_dict would
             # have returned different values (i.e. env / config have changed).
-            self.connections[key] = ctx.build_connection()
+            self.connections[key] = ctx.build_connection(use_session_cache=True)
         except Exception:
             logger.debug(
                 "ConnectionCache: failed to connect using %s; not caching.", key
@@ -1,4 +1,3 @@
-import os
 from pathlib import Path
 from typing import Any, List, NoReturn, Optional
 
@@ -41,6 +40,7 @@ from snowflake.cli.api.rendering.sql_templates import (
     choose_sql_jinja_env_based_on_template_syntax,
 )
 from snowflake.cli.api.secure_path import UNLIMITED, SecurePath
+from snowflake.cli.api.utils.path_utils import walk_tree
 from snowflake.connector import ProgrammingError
 
 
@@ -66,10 +66,9 @@ def _get_stage_paths_to_sync(
     stage_paths = []
     for path in local_paths_to_sync:
         if path.is_dir():
-            for current_dir, _dirs, files in os.walk(path):
-                for file in files:
-                    deploy_path = Path(current_dir, file).relative_to(deploy_root)
-                    stage_paths.append(to_stage_path(deploy_path))
+            deploy_dir = path.relative_to(deploy_root)
+            for relative_path, _ in walk_tree(path, follow_symlinks=False):
+                stage_paths.append(to_stage_path(deploy_dir / relative_path))
         else:
             stage_paths.append(to_stage_path(path.relative_to(deploy_root)))
     return stage_paths
@@ -174,8 +173,11 @@ def sync_deploy_root_with_stage(
     if print_diff:
         print_diff_to_console(diff, bundle_map)
 
-    # Upload diff-ed files to application package stage
-    if diff.has_changes():
+    # Upload diff-ed files to application package stage. A stage without a deploy manifest
+    # is synced even without changes, so that the manifest is created.
+    if diff.has_changes() or (
+        diff.manifest is not None and diff.manifest.stamp is None
+    ):
         console.step(
             "Updating the Snowflake stage from your local %s directory."
             % deploy_root.resolve(),
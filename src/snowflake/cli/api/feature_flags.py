@@ -64,3 +64,7 @@ class FeatureFlag(FeatureFlagMixin):
         "ENABLE_STREAMLIT_VERSIONED_STAGE", False
     )
     ENABLE_SPCS_LOG_STREAMING = BooleanFlag("ENABLE_SPCS_LOG_STREAMING", False)
+    ENABLE_STAGE_CHECKSUM_CACHE = BooleanFlag("ENABLE_STAGE_CHECKSUM_CACHE", False)
+    ENABLE_STAGE_DEPLOY_MANIFEST = BooleanFlag("ENABLE_STAGE_DEPLOY_MANIFEST", False)
+    ENABLE_SESSION_TOKEN_CACHE = BooleanFlag("ENABLE_SESSION_TOKEN_CACHE", False)
+    ENABLE_ARROW_QUERY_RESULTS = BooleanFlag("ENABLE_ARROW_QUERY_RESULTS", False)
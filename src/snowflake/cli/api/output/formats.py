@@ -18,3 +18,6 @@ from enum import Enum
 class OutputFormat(Enum):
     TABLE = "TABLE"
     JSON = "JSON"
+    CSV = "CSV"
+    TSV = "TSV"
+    NDJSON = "NDJSON"
@@ -17,7 +17,7 @@ from __future__ import annotations
 import json
 import typing as t
 
-from snowflake.connector import DictCursor
+from snowflake.connector import DictCursor, NotSupportedError, ProgrammingError
 from snowflake.connector.cursor import SnowflakeCursor
 
 
@@ -82,15 +82,32 @@ class QueryResult(CollectionResult):
         return self._query
 
 
+class ArrowQueryResult(QueryResult):
+    """
+    Query result read in Arrow record batches, when the result is in Arrow format and
+    pyarrow is installed, otherwise row by row like QueryResult. Delimited output formats
+    write the batches column by column; other formats get rows built from whole batches.
+
+    Values are converted by pyarrow instead of the connector, so timestamp, decimal and
+    binary values may be printed differently than by QueryResult.
+    """
+
+    def __init__(self, cursor: SnowflakeCursor | DictCursor):
+        self.batches = _arrow_batches(cursor)
+        super().__init__(cursor)
+
+    def _prepare_payload(self, cursor: SnowflakeCursor | DictCursor):
+        if self.batches is None:
+            return super()._prepare_payload(cursor)
+        return (row for batch in self.batches for row in batch.to_pylist())
+
+
 class SingleQueryResult(ObjectResult):
     def __init__(self, cursor: SnowflakeCursor):
         super().__init__(element=self._prepare_payload(cursor))
 
     def _prepare_payload(self, cursor):
-        results = list(QueryResult(cursor).result)
-        if results:
-            return results[0]
-        return None
+        return _fetch_first_row(cursor)
 
 
 class QueryJsonValueResult(QueryResult):
@@ -98,13 +115,32 @@ class QueryJsonValueResult(QueryResult):
         super().__init__(cursor)
 
     def _prepare_payload(self, cursor):
-        results = list(QueryResult(cursor).result)
-        if results:
+        row = _fetch_first_row(cursor)
+        if row:
             # Return value of the first tuple
-            return json.loads(list(results[0].items())[0][1])
+            return json.loads(list(row.values())[0])
         return None
 
 
+def _arrow_batches(cursor: SnowflakeCursor | DictCursor) -> t.Iterator | None:
+    """
+    Returns the Arrow batches of the result, or None if the result is not
+    in Arrow format or pyarrow is not installed.
+    """
+    try:
+        return cursor.fetch_arrow_batches()
+    except (NotSupportedError, ProgrammingError):
+        return None
+
+
+def _fetch_first_row(cursor: SnowflakeCursor) -> t.Dict | None:
+    """Fetches only the first row of the result, as a dictionary."""
+    row = cursor.fetchone()
+    if row is None or isinstance(row, dict):
+        return row
+    return dict(zip([col.name for col in cursor.description], row))
+
+
 class MessageResult(CommandResult):
     def __init__(self, message: str):
         self._message = message
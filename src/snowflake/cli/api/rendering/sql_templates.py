@@ -14,10 +14,10 @@
 
 from __future__ import annotations
 
-from typing import Dict, Optional
+from typing import Dict, Generator, Iterable, Optional
 
 from click import ClickException
-from jinja2 import Environment, StrictUndefined, loaders, meta
+from jinja2 import Environment, StrictUndefined, UndefinedError, loaders, meta
 from snowflake.cli.api.cli_global_context import get_cli_context
 from snowflake.cli.api.console.console import cli_console
 from snowflake.cli.api.exceptions import InvalidTemplate
@@ -33,6 +33,7 @@ _SQL_TEMPLATE_START = "<%"
 _SQL_TEMPLATE_END = "%>"
 _OLD_SQL_TEMPLATE_START = "&{"
 _OLD_SQL_TEMPLATE_END = "}"
+_JINJA_COMMENT_START = "{#"
 RESERVED_KEYS = [CONTEXT_KEY, FUNCTION_KEY]
 
 
@@ -85,7 +86,7 @@ def choose_sql_jinja_env_based_on_template_syntax(
     return new_syntax_env
 
 
-def snowflake_sql_jinja_render(content: str, data: Dict | None = None) -> str:
+def _get_template_context(data: Dict | None) -> Dict:
     data = data or {}
 
     for reserved_key in RESERVED_KEYS:
@@ -96,6 +97,11 @@ def snowflake_sql_jinja_render(content: str, data: Dict | None = None) -> str:
 
     context_data = get_cli_context().template_context
     context_data.update(data)
+    return context_data
+
+
+def snowflake_sql_jinja_render(content: str, data: Dict | None = None) -> str:
+    context_data = _get_template_context(data)
     env = choose_sql_jinja_env_based_on_template_syntax(content)
 
     get_cli_context().metrics.set_counter(
@@ -103,3 +109,82 @@ def snowflake_sql_jinja_render(content: str, data: Dict | None = None) -> str:
     )
 
     return env.from_string(content).render(context_data)
+
+
+def snowflake_sql_jinja_render_parts(
+    parts: Iterable[str], data: Dict | None = None
+) -> Generator[str, None, None]:
+    """
+    Renders consecutive parts (e.g. statements) of a single SQL template one by one,
+    so that the whole template does not need to be in memory. SQL templates support
+    variables only, not logic blocks, so each part can be rendered on its own.
+    Template syntax is checked across all parts, as if they were rendered together.
+    """
+    context_data = _get_template_context(data)
+    old_syntax_env = _get_sql_jinja_env(_OLD_SQL_TEMPLATE_START, _OLD_SQL_TEMPLATE_END)
+    new_syntax_env = _get_sql_jinja_env(_SQL_TEMPLATE_START, _SQL_TEMPLATE_END)
+    seen_old_syntax = seen_new_syntax = False
+    get_cli_context().metrics.set_counter(CLICounterField.SQL_TEMPLATES, 0)
+
+    for part in parts:
+        if not has_sql_templates(part) and _JINJA_COMMENT_START not in part:
+            # rendering would not change the part; skip compiling a template for it
+            yield part
+            continue
+
+        if has_sql_templates(part):
+            get_cli_context().metrics.set_counter(CLICounterField.SQL_TEMPLATES, 1)
+        has_old_syntax = _does_template_have_env_syntax(old_syntax_env, part)
+        has_new_syntax = _does_template_have_env_syntax(new_syntax_env, part)
+        _check_syntax_is_not_mixed(
+            has_old_syntax or seen_old_syntax, has_new_syntax or seen_new_syntax
+        )
+        if has_old_syntax and not seen_old_syntax:
+            cli_console.warning(
+                f"Warning: {_OLD_SQL_TEMPLATE_START} ... {_OLD_SQL_TEMPLATE_END} syntax is deprecated."
+                f" Use {_SQL_TEMPLATE_START} ... {_SQL_TEMPLATE_END} syntax instead."
+            )
+        seen_old_syntax = seen_old_syntax or has_old_syntax
+        seen_new_syntax = seen_new_syntax or has_new_syntax
+
+        env = old_syntax_env if seen_old_syntax else new_syntax_env
+        yield env.from_string(part).render(context_data)
+
+
+def validate_sql_jinja_render_parts(
+    parts: Iterable[str], data: Dict | None = None
+) -> None:
+    """
+    Checks all parts of a SQL template without rendering them, so that undefined
+    variables and mixed syntax can be reported before any of the parts is used.
+    Missing attributes of defined variables are only reported by rendering.
+    """
+    context_data = _get_template_context(data)
+    old_syntax_env = _get_sql_jinja_env(_OLD_SQL_TEMPLATE_START, _OLD_SQL_TEMPLATE_END)
+    new_syntax_env = _get_sql_jinja_env(_SQL_TEMPLATE_START, _SQL_TEMPLATE_END)
+    seen_old_syntax = seen_new_syntax = False
+
+    for part in parts:
+        if not has_sql_templates(part):
+            continue
+        old_syntax_variables = meta.find_undeclared_variables(
+            old_syntax_env.parse(part)
+        )
+        new_syntax_variables = meta.find_undeclared_variables(
+            new_syntax_env.parse(part)
+        )
+        seen_old_syntax = seen_old_syntax or bool(old_syntax_variables)
+        seen_new_syntax = seen_new_syntax or bool(new_syntax_variables)
+        _check_syntax_is_not_mixed(seen_old_syntax, seen_new_syntax)
+
+        for variable in sorted(old_syntax_variables | new_syntax_variables):
+            if variable not in context_data:
+                raise UndefinedError(f"'{variable}' is undefined")
+
+
+def _check_syntax_is_not_mixed(has_old_syntax: bool, has_new_syntax: bool) -> None:
+    if has_old_syntax and has_new_syntax:
+        raise InvalidTemplate(
+            f"The SQL query mixes {_OLD_SQL_TEMPLATE_START} ... {_OLD_SQL_TEMPLATE_END} syntax"
+            f" and {_SQL_TEMPLATE_START} ... {_SQL_TEMPLATE_END} syntax."
+        )
@@ -14,7 +14,10 @@
 
 from __future__ import annotations
 
+import os
 import sys
+from pathlib import Path
+from typing import Generator, Iterator, List, Tuple
 
 BUFFER_SIZE = 4096
 
@@ -34,3 +37,48 @@ def path_resolver(path_to_file: str) -> str:
 
 def is_stage_path(path: str) -> bool:
     return path.startswith("@") or path.startswith("snow://")
+
+
+def _sorted_entries(directory: str | Path) -> Iterator[os.DirEntry]:
+    with os.scandir(directory) as entries:
+        return iter(sorted(entries, key=lambda entry: entry.name))
+
+
+def walk_tree(
+    root: Path, follow_symlinks: bool = True, include_dirs: bool = False
+) -> Generator[Tuple[str, os.stat_result], None, None]:
+    """
+    Lazily yields (relative posix path, stat result) tuples for all files under root, recursively,
+    in sorted depth-first order. Each entry is stat-ed at most once, so callers can reuse the stat
+    result (e.g. size or mtime) instead of querying the filesystem again.
+
+    Like os.walk, symlinks to directories are only descended into if follow_symlinks is set,
+    and are skipped otherwise. If include_dirs is set, directories are yielded before their contents.
+    """
+    stack: List[Tuple[str, Iterator[os.DirEntry]]] = [("", _sorted_entries(root))]
+    while stack:
+        prefix, entries = stack[-1]
+        entry = next(entries, None)
+        if entry is None:
+            stack.pop()
+            continue
+
+        relative_path = prefix + entry.name
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+
+        if is_dir:
+            if not follow_symlinks and entry.is_symlink():
+                continue
+            if include_dirs:
+                yield relative_path, entry.stat()
+            stack.append((relative_path + "/", _sorted_entries(entry.path)))
+        else:
+            try:
+                stat_result = entry.stat()
+            except FileNotFoundError:
+                # broken symlink
+                stat_result = entry.stat(follow_symlinks=False)
+            yield relative_path, stat_result
@@ -0,0 +1,64 @@
+# Copyright (c) 2024 Snowflake Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from snowflake.cli.api.cache_files import (
+    config_dir_cache_path,
+    read_cache_file,
+    write_cache_file,
+)
+from snowflake.cli.api.secure_path import SecurePath
+from snowflake.connector import config_manager
+
+from tests_common import IS_WINDOWS
+
+
+def test_config_dir_cache_path_follows_loaded_config(temp_dir):
+    for config_dir in [Path(temp_dir) / "a", Path(temp_dir) / "b"]:
+        with mock.patch.object(
+            config_manager.CONFIG_MANAGER, "file_path", config_dir / "config.toml"
+        ):
+            assert config_dir_cache_path("cache", "file.json").path == (
+                config_dir / "cache" / "file.json"
+            )
+
+
+def test_cache_file_roundtrip(temp_dir):
+    cache_file = SecurePath(Path(temp_dir) / "cache" / "file.json")
+    assert write_cache_file(cache_file, 1, {"value": 42}, private=True)
+    assert read_cache_file(cache_file, 1, lambda data: data["value"]) == 42
+    if not IS_WINDOWS:
+        assert cache_file.path.stat().st_mode & 0o777 == 0o600
+
+
+@pytest.mark.parametrize(
+    "content", ['{"version": 0, "value": 42}', '{"version": 1}', "{not json", "[]"]
+)
+def test_outdated_or_corrupted_cache_file_is_ignored(temp_dir, content):
+    cache_file = SecurePath(Path(temp_dir) / "file.json")
+    cache_file.write_text(content)
+    assert read_cache_file(cache_file, 1, lambda data: data["value"]) is None
+
+
+def test_missing_cache_file_is_ignored(temp_dir):
+    cache_file = SecurePath(Path(temp_dir) / "file.json")
+    assert read_cache_file(cache_file, 1, lambda data: data["value"]) is None
+
+
+def test_cache_file_write_errors_are_ignored(temp_dir):
+    cache_file = SecurePath(Path(temp_dir) / "file.json")
+    with mock.patch.object(SecurePath, "write_text", side_effect=PermissionError):
+        assert not write_cache_file(cache_file, 1, {"value": 42})
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from pathlib import Path
 from textwrap import dedent
 
 import pytest
@@ -77,3 +78,32 @@ def test_json_format_disables_intermediate_output(runner):
     import json
 
     assert json.loads(result.output) == expected_output
+
+
+@pytest.mark.usefixtures("faker_app")
+def test_csv_format_disables_intermediate_output(runner):
+    result = runner.invoke(["Faker", "--format", "csv"])
+
+    assert result.output == dedent(
+        """\
+        string,number,array,object,date
+        string,42,"[""array""]","{""k"": ""object""}",2022-03-21T00:00:00
+        string,43,"[""array""]","{""k"": ""object""}",2022-03-21T00:00:00
+        """
+    )
+
+
+@pytest.mark.usefixtures("faker_app")
+def test_output_file(runner, temp_dir):
+    output_file = Path(temp_dir) / "result.ndjson"
+
+    result = runner.invoke(
+        ["Faker", "--format", "ndjson", "--output-file", str(output_file)]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert result.output == ""
+    assert output_file.read_text().splitlines() == [
+        '{"string": "string", "number": 42, "array": ["array"], "object": {"k": "object"}, "date": "2022-03-21T00:00:00"}',
+        '{"string": "string", "number": 43, "array": ["array"], "object": {"k": "object"}, "date": "2022-03-21T00:00:00"}',
+    ]
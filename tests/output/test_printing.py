@@ -14,13 +14,20 @@
 
 import json
 from datetime import datetime
+from pathlib import Path
 from textwrap import dedent
 from typing import NamedTuple
+from unittest import mock
 
 import pytest
-from snowflake.cli._app.printing import print_result
+from snowflake.cli._app.printing import keep_output_files_open, print_result
+from snowflake.cli.api.cli_global_context import (
+    fork_cli_context,
+    get_cli_context_manager,
+)
 from snowflake.cli.api.output.formats import OutputFormat
 from snowflake.cli.api.output.types import (
+    ArrowQueryResult,
     CollectionResult,
     MessageResult,
     MultipleResults,
@@ -29,6 +36,7 @@ from snowflake.cli.api.output.types import (
     SingleQueryResult,
     StreamResult,
 )
+from snowflake.connector import NotSupportedError
 
 from tests.testing_utils.conversion import get_output, get_output_as_json
 
@@ -61,6 +69,91 @@ def test_single_value_from_query(capsys, mock_cursor):
     )
 
 
+def test_single_value_from_query_fetches_only_first_row(mock_cursor):
+    cursor = mock_cursor(columns=["id"], rows=[(1,), (2,), (3,)])
+
+    assert SingleQueryResult(cursor).result == {"id": 1}
+    assert cursor.fetchall() == [(2,), (3,)]
+
+
+class _ArrowColumn(NamedTuple):
+    values: list
+
+    def to_pylist(self):
+        return self.values
+
+
+class _ArrowBatch:
+    def __init__(self, rows):
+        self._rows = rows
+        self.num_rows = len(rows)
+        self.columns = [
+            _ArrowColumn([row[name] for row in rows]) for name in ("id", "name")
+        ]
+
+    def to_pylist(self):
+        return self._rows
+
+
+def _arrow_cursor(mock_cursor, batches):
+    cursor = mock_cursor(columns=["id", "name"], rows=[])
+    cursor.fetch_arrow_batches = lambda: iter(batches)
+    cursor.fetchone = mock.Mock(side_effect=AssertionError("rows are not fetched"))
+    return cursor
+
+
+def test_query_result_does_not_use_arrow(mock_cursor):
+    cursor = mock_cursor(columns=["id"], rows=[(1,), (2,)])
+
+    with mock.patch.object(cursor, "fetch_arrow_batches") as fetch_arrow_batches:
+        assert list(QueryResult(cursor).result) == [{"id": 1}, {"id": 2}]
+    fetch_arrow_batches.assert_not_called()
+
+
+def test_arrow_query_result_from_arrow_batches(mock_cursor):
+    batches = [
+        _ArrowBatch([{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]),
+        _ArrowBatch([{"id": 3, "name": "c"}]),
+    ]
+
+    rows = list(ArrowQueryResult(_arrow_cursor(mock_cursor, batches)).result)
+
+    assert rows == [
+        {"id": 1, "name": "a"},
+        {"id": 2, "name": "b"},
+        {"id": 3, "name": "c"},
+    ]
+
+
+def test_arrow_query_result_falls_back_to_rows_without_arrow(mock_cursor):
+    cursor = mock_cursor(columns=["id"], rows=[(1,), (2,)])
+
+    with mock.patch.object(
+        cursor, "fetch_arrow_batches", side_effect=NotSupportedError
+    ):
+        result = ArrowQueryResult(cursor)
+        assert result.batches is None
+        assert list(result.result) == [{"id": 1}, {"id": 2}]
+
+
+def test_arrow_query_result_is_written_by_columns(capsys, mock_cursor):
+    batches = [
+        _ArrowBatch([{"id": 1, "name": "a"}, {"id": 2, "name": "b,c"}]),
+        _ArrowBatch([]),
+        _ArrowBatch([{"id": 3, "name": None}]),
+    ]
+    for batch in batches:
+        # rows are not built from the batches
+        batch.to_pylist = mock.Mock(side_effect=AssertionError("rows are built"))
+
+    print_result(
+        ArrowQueryResult(_arrow_cursor(mock_cursor, batches)),
+        output_format=OutputFormat.CSV,
+    )
+
+    assert get_output(capsys) == 'id,name\n1,a\n2,"b,c"\n3,\n'
+
+
 def test_single_object_result(capsys, mock_cursor):
     output_data = ObjectResult(
         {"array": ["array"], "object": {"k": "object"}, "date": datetime(2022, 3, 21)}
@@ -373,9 +466,147 @@ def test_print_stream_result_json(capsys):
     ]
 
 
+def test_print_collection_result_json_is_streamed(capsys):
+    rows = [{"id": i, "values": [i, str(i)]} for i in range(3)]
+    printed_before_row = []
+
+    def g():
+        for row in rows:
+            printed_before_row.append(capsys.readouterr().out)
+            yield row
+
+    print_result(CollectionResult(g()), output_format=OutputFormat.JSON)
+
+    output = "".join(printed_before_row) + get_output(capsys)
+    assert output == json.dumps(rows, indent=4) + "\n"
+    # every row is written before the next one is produced
+    assert printed_before_row[0] == ""
+    assert printed_before_row[1].endswith('"0"\n        ]\n    }')
+    assert printed_before_row[2].endswith('"1"\n        ]\n    }')
+
+
+def test_print_multiple_collection_results_json_is_streamed(capsys):
+    def g(n: int):
+        yield from ({"id": i} for i in range(n))
+
+    print_result(
+        MultipleResults([CollectionResult(g(2)), CollectionResult(g(0))]),
+        output_format=OutputFormat.JSON,
+    )
+
+    assert get_output_as_json(capsys) == [[{"id": 0}, {"id": 1}], []]
+
+
+def test_print_multiple_results_json_layout(capsys):
+    print_result(
+        MultipleResults(
+            [CollectionResult(iter([{"id": 0, "values": [1]}])), MessageResult("done")]
+        ),
+        output_format=OutputFormat.JSON,
+    )
+
+    assert get_output(capsys) == dedent(
+        """\
+        [
+          [
+            {
+              "id": 0,
+              "values": [
+                1
+              ]
+            }
+          ],
+          {
+            "message": "done"
+          }
+        ]
+
+        """
+    )
+
+
+def test_print_tsv_with_changing_columns(capsys):
+    print_result(
+        MultipleResults(
+            [
+                CollectionResult([{"id": 1, "name": "a\tb"}, {"id": 2, "name": None}]),
+                CollectionResult([]),
+                MessageResult("Done"),
+            ]
+        ),
+        output_format=OutputFormat.TSV,
+    )
+
+    assert get_output(capsys) == dedent(
+        """\
+        id\tname
+        1\t"a\tb"
+        2\t
+
+        message
+        Done
+        """
+    )
+
+
+def test_print_stream_result_ndjson(capsys):
+    def g():
+        yield MessageResult("1")
+        yield CollectionResult([{"2": "3"}, {"2": [4]}])
+        yield ObjectResult(None)
+
+    print_result(StreamResult(g()), output_format=OutputFormat.NDJSON)
+
+    assert get_output(capsys) == '{"message": "1"}\n{"2": "3"}\n{"2": [4]}\n'
+
+
+def test_print_large_collection_as_streamed_table(capsys, monkeypatch):
+    monkeypatch.setenv("SNOWFLAKE_CLI_OUTPUT_TABLE_SAMPLE_ROWS", "2")
+
+    def g():
+        yield {"id": 1, "name": "a"}
+        yield {"id": 2, "name": "bb\ncc"}
+        yield {"id": 3, "name": "longer than sampled rows"}
+
+    print_result(CollectionResult(g()), output_format=OutputFormat.TABLE)
+
+    assert get_output(capsys) == dedent(
+        """\
+        +-----------+
+        | id | name |
+        |----+------|
+        | 1  | a    |
+        | 2  | bb   |
+        |    | cc   |
+        | 3  | long |
+        |    | er t |
+        |    | han  |
+        |    | samp |
+        |    | led  |
+        |    | rows |
+        +-----------+
+        """
+    )
+
+
 @pytest.fixture
 def _empty_cursor(mock_cursor):
     return lambda: mock_cursor(
         columns=["string", "number", "array", "object", "date"],
         rows=[],
     )
+
+
+def test_output_file_is_opened_once_per_command(temp_dir):
+    output_file = Path(temp_dir) / "result.ndjson"
+    with fork_cli_context():
+        get_cli_context_manager().output_file = output_file
+
+        with keep_output_files_open():
+            print_result(ObjectResult({"a": 1}), output_format=OutputFormat.NDJSON)
+            print_result(ObjectResult({"b": 2}), output_format=OutputFormat.NDJSON)
+        assert output_file.read_text() == '{"a": 1}\n{"b": 2}\n'
+
+        # outside of a command, every result replaces the content of the file
+        print_result(ObjectResult({"c": 3}), output_format=OutputFormat.NDJSON)
+        assert output_file.read_text() == '{"c": 3}\n'
@@ -0,0 +1,173 @@
+# Copyright (c) 2024 Snowflake Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from unittest import mock
+
+from snowflake.cli._plugins.stage.checksum_cache import (
+    LAST_USED_RESOLUTION_SECONDS,
+    ChecksumCache,
+    checksum_cache,
+)
+from snowflake.cli._plugins.stage.md5 import file_matches_md5sum
+from snowflake.cli.api.secure_path import SecurePath
+
+from tests.testing_utils.files_and_dirs import temp_local_dir
+
+COMPUTE_MD5SUMS = "snowflake.cli._plugins.stage.md5.compute_md5sums"
+README_MD5 = "25d55ad283aa400af464c76d713c07ad"
+
+
+def _make_old(path: Path, seconds_ago: int = 60):
+    """Moves the mtime of a file out of the racy window."""
+    past = time.time() - seconds_ago
+    os.utime(path, (past, past))
+
+
+def test_put_and_get(temp_dir):
+    with temp_local_dir({"README.md": "12345678"}) as root:
+        _make_old(root / "README.md")
+        cache = ChecksumCache(SecurePath(Path(temp_dir) / "cache"))
+
+        assert cache.get(root / "README.md") is None
+        cache.put(root / "README.md", None, README_MD5)
+        cache.put(root / "README.md", 8, "abc-1")
+
+        assert cache.get(root / "README.md") == README_MD5
+        assert cache.get(root / "README.md", 8) == "abc-1"
+        assert cache.get(root / "README.md", 16) is None
+
+
+def test_changed_file_is_invalidated(temp_dir):
+    with temp_local_dir({"README.md": "12345678"}) as root:
+        _make_old(root / "README.md", seconds_ago=120)
+        cache = ChecksumCache(SecurePath(Path(temp_dir) / "cache"))
+        cache.put(root / "README.md", None, README_MD5)
+
+        (root / "README.md").write_text("87654321")
+        _make_old(root / "README.md")
+
+        assert cache.get(root / "README.md") is None
+        assert len(cache) == 0
+
+
+def test_recently_modified_file_is_not_cached(temp_dir):
+    with temp_local_dir({"README.md": "12345678"}) as root:
+        cache = ChecksumCache(SecurePath(Path(temp_dir) / "cache"))
+        cache.put(root / "README.md", None, README_MD5)
+        assert cache.get(root / "README.md") is None
+
+
+def test_save_and_load_roundtrip(temp_dir):
+    cache_file = SecurePath(Path(temp_dir) / "cache")
+    with temp_local_dir({"README.md": "12345678"}) as root:
+        _make_old(root / "README.md")
+        cache = ChecksumCache(cache_file)
+        cache.put(root / "README.md", None, README_MD5)
+        cache.save()
+
+        loaded = ChecksumCache.load(cache_file)
+        assert loaded.get(root / "README.md") == README_MD5
+
+
+def test_cache_hits_do_not_rewrite_cache_file(temp_dir):
+    cache_file = SecurePath(Path(temp_dir) / "cache")
+    with temp_local_dir({"README.md": "12345678"}) as root:
+        _make_old(root / "README.md")
+        cache = ChecksumCache(cache_file)
+        cache.put(root / "README.md", None, README_MD5)
+        cache.save()
+
+        loaded = ChecksumCache.load(cache_file)
+        assert loaded.get(root / "README.md") == README_MD5
+        with mock.patch.object(SecurePath, "write_text") as mock_write_text:
+            loaded.save()
+        mock_write_text.assert_not_called()
+
+
+def test_corrupted_cache_file_is_ignored(temp_dir):
+    cache_file = SecurePath(Path(temp_dir) / "cache")
+    cache_file.write_text("{not json")
+    assert len(ChecksumCache.load(cache_file)) == 0
+
+
+def test_least_recently_used_entries_are_evicted(temp_dir):
+    cache_file = SecurePath(Path(temp_dir) / "cache")
+    files = {f"file{i}.txt": str(i) for i in range(3)}
+    with temp_local_dir(files) as root:
+        cache = ChecksumCache(cache_file, max_entries=2)
+        for name in files:
+            _make_old(root / name)
+            cache.put(root / name, None, f"md5-{name}")
+        # file0.txt is accessed again a few days later, so file1.txt is the least recently used
+        with mock.patch(
+            "snowflake.cli._plugins.stage.checksum_cache.time.time",
+            return_value=time.time() + 3 * LAST_USED_RESOLUTION_SECONDS,
+        ):
+            cache.get(root / "file0.txt")
+        cache.save()
+
+        loaded = ChecksumCache.load(cache_file)
+        assert len(loaded) == 2
+        assert loaded.get(root / "file0.txt") == "md5-file0.txt"
+        assert loaded.get(root / "file1.txt") is None
+        assert loaded.get(root / "file2.txt") == "md5-file2.txt"
+
+
+def test_file_matches_md5sum_uses_cache(temp_dir):
+    with temp_local_dir({"README.md": "12345678"}) as root:
+        _make_old(root / "README.md")
+        cache = ChecksumCache(SecurePath(Path(temp_dir) / "cache"))
+
+        assert file_matches_md5sum(root / "README.md", README_MD5, cache)
+        with mock.patch(COMPUTE_MD5SUMS) as compute_md5sums:
+            assert file_matches_md5sum(root / "README.md", README_MD5, cache)
+            assert not file_matches_md5sum(root / "README.md", "0" * 32, cache)
+            compute_md5sums.assert_not_called()
+
+
+@mock.patch(
+    "snowflake.cli.api.feature_flags.FeatureFlag.ENABLE_STAGE_CHECKSUM_CACHE.is_enabled"
+)
+def test_checksum_cache_context_respects_feature_flag(mock_is_enabled, snowflake_home):
+    mock_is_enabled.return_value = False
+    with checksum_cache() as cache:
+        assert cache is None
+
+    mock_is_enabled.return_value = True
+    with temp_local_dir({"README.md": "12345678"}) as root:
+        _make_old(root / "README.md")
+        with checksum_cache() as cache:
+            assert cache is not None
+            cache.put(root / "README.md", None, README_MD5)
+
+        assert ChecksumCache.load().get(root / "README.md") == README_MD5
+
+
+def test_file_matches_md5sum_reuses_stat_result(temp_dir):
+    with temp_local_dir({"README.md": "12345678"}) as root:
+        _make_old(root / "README.md")
+        cache = ChecksumCache(SecurePath(Path(temp_dir) / "cache"))
+        stat_result = os.stat(root / "README.md")
+        cache.put(root / "README.md", None, README_MD5, stat_result)
+
+        with mock.patch("os.stat") as mock_stat:
+            assert file_matches_md5sum(
+                root / "README.md", README_MD5, cache, stat_result
+            )
+            mock_stat.assert_not_called()
@@ -21,9 +21,11 @@ from typing import Dict, List, Union
 from unittest import mock
 
 import pytest
+from click import ClickException
 from snowflake.cli._plugins.nativeapp.artifacts import BundleMap
 from snowflake.cli._plugins.stage.diff import (
     DiffResult,
+    DiffStatus,
     StagePathType,
     build_md5_map,
     compute_stage_diff,
@@ -31,7 +33,7 @@ from snowflake.cli._plugins.stage.diff import (
     enumerate_files,
     get_stage_subpath,
     preserve_from_diff,
-    put_files_on_stage,
+    put_files_on_stage_batched,
     sync_local_diff_with_stage,
 )
 from snowflake.cli._plugins.stage.manager import StageManager
@@ -204,6 +206,50 @@ def test_unmodified_file_no_remote_md5sum(mock_list, mock_cursor):
         assert len(diff_result.only_local) == 0
 
 
+@mock.patch(f"{STAGE_MANAGER}.list_files")
+@pytest.mark.parametrize("hash_workers", [1, 4])
+def test_parallel_hashing_keeps_order(mock_list, mock_cursor, hash_workers):
+    files = {f"dir{i % 3}/file{i:02}.txt": f"content {i}" for i in range(30)}
+    mock_list.return_value = mock_cursor(
+        rows=stage_contents(files),
+        columns=STAGE_LS_COLUMNS,
+    )
+    modified = sorted(f"dir{i % 3}/file{i:02}.txt" for i in range(0, 30, 4))
+
+    with temp_local_dir(
+        {**files, **{path: "modified" for path in modified}}
+    ) as local_path:
+        diff_result = compute_stage_diff(local_path, "a.b.c", hash_workers=hash_workers)
+        assert diff_result.different == as_stage_paths(modified)
+        assert diff_result.identical == as_stage_paths(
+            sorted(set(files) - set(modified))
+        )
+        assert len(diff_result.only_local) == 0
+        assert len(diff_result.only_on_stage) == 0
+
+
+@mock.patch(f"{STAGE_MANAGER}.list_files")
+@mock.patch("snowflake.cli._plugins.stage.diff.ThreadPoolExecutor")
+def test_hash_workers_are_read_from_config(
+    mock_executor, mock_list, mock_cursor, monkeypatch
+):
+    mock_list.return_value = mock_cursor(rows=[], columns=STAGE_LS_COLUMNS)
+    mock_executor.return_value.__enter__.return_value.map.return_value = []
+    monkeypatch.setenv("SNOWFLAKE_CLI_STAGE_HASH_WORKERS", "3")
+
+    with temp_local_dir(FILE_CONTENTS) as local_path:
+        compute_stage_diff(local_path, "a.b.c")
+        mock_executor.assert_called_with(max_workers=3)
+
+        # an explicitly given number of workers takes precedence
+        compute_stage_diff(local_path, "a.b.c", hash_workers=5)
+        mock_executor.assert_called_with(max_workers=5)
+
+        monkeypatch.setenv("SNOWFLAKE_CLI_STAGE_HASH_WORKERS", "0")
+        with pytest.raises(ClickException, match="hash_workers"):
+            compute_stage_diff(local_path, "a.b.c")
+
+
 def test_get_stage_path_from_file():
     expected = [
         "",
@@ -227,30 +273,41 @@ def test_get_stage_path_from_file():
     assert actual.sort() == expected
 
 
-@mock.patch(f"{STAGE_MANAGER}.remove")
-def test_delete_only_on_stage_files(mock_remove):
+@mock.patch(f"{STAGE_MANAGER}.remove_files")
+def test_delete_only_on_stage_files(mock_remove_files):
     stage_name = "some_stage_name"
-    random_file = "some_file_on_stage"
+    random_files = ["some_file_on_stage", "dir/other_file_on_stage"]
 
     delete_only_on_stage_files(
-        StageManager(), stage_name, as_stage_paths([random_file]), "some_role"
+        StageManager(), stage_name, as_stage_paths(random_files), "some_role"
     )
-    mock_remove.assert_has_calls(
-        [mock.call(stage_name=stage_name, path=random_file, role="some_role")]
+    mock_remove_files.assert_called_once_with(
+        stage_name=stage_name, paths=random_files, role="some_role"
     )
 
 
+@mock.patch(f"{STAGE_MANAGER}.remove_files")
+def test_delete_only_on_stage_files_nothing_to_delete(mock_remove_files):
+    delete_only_on_stage_files(StageManager(), "some_stage_name", [], "some_role")
+    mock_remove_files.assert_not_called()
+
+
 @mock.patch(f"{STAGE_MANAGER}.put")
 @pytest.mark.parametrize("overwrite_param", [True, False])
-def test_put_files_on_stage(mock_put, overwrite_param):
+def test_put_files_on_stage_batched_single_files(
+    mock_put, mock_cursor, overwrite_param
+):
     stage_name = "some_stage_name"
+    mock_put.side_effect = lambda local_path, **kwargs: mock_cursor(
+        [{"source": local_path.name, "status": "UPLOADED"}], []
+    )
     with temp_local_dir(
         {
             "ui/nested/environment.yml": "# this is a environment file\n",
             "README.md": "# this is an app file\n",
         }
     ) as local_path:
-        put_files_on_stage(
+        result = put_files_on_stage_batched(
             stage_manager=StageManager(),
             stage_fqn=stage_name,
             deploy_root_path=local_path,
@@ -258,21 +315,30 @@ def test_put_files_on_stage(mock_put, overwrite_param):
             role="some_role",
             overwrite=overwrite_param,
         )
+        # directories with a single file to upload do not use a wildcard PUT
         expected = [
             mock.call(
                 local_path=local_path / "ui/nested/environment.yml",
-                stage_path=f"{stage_name}/ui/nested",  # TODO: verify if trailing slash is needed, doesn't seem so from regression tests
+                stage_path=f"{stage_name}/ui/nested",
                 role="some_role",
                 overwrite=overwrite_param,
+                parallel=4,
+                use_dict_cursor=True,
             ),
             mock.call(
                 local_path=local_path / "README.md",
                 stage_path=f"{stage_name}",
                 role="some_role",
                 overwrite=overwrite_param,
+                parallel=4,
+                use_dict_cursor=True,
             ),
         ]
         assert mock_put.mock_calls == expected
+    assert result == {
+        path: "UPLOADED"
+        for path in as_stage_paths(["ui/nested/environment.yml", "README.md"])
+    }
 
 
 def test_build_md5_map(mock_cursor):
@@ -284,16 +350,123 @@ def test_build_md5_map(mock_cursor):
     )
 
     expected = {
-        StagePathType("README.md"): "9b650974f65cc49be96a5ed34ac6d1fd",
-        StagePathType("my.jar"): "fc605d0e2e50cf3e71873d57f4c598b0",
-        StagePathType("ui/streamlit.py"): "a7dfdfaf892ecfc5f164914123c7f2cc",
+        "README.md": "9b650974f65cc49be96a5ed34ac6d1fd",
+        "my.jar": "fc605d0e2e50cf3e71873d57f4c598b0",
+        "ui/streamlit.py": "a7dfdfaf892ecfc5f164914123c7f2cc",
     }
 
     assert actual == expected
 
 
+@mock.patch(f"{STAGE_MANAGER}.put")
+@mock.patch(f"{STAGE_MANAGER}.put_files")
+def test_put_files_on_stage_batched(mock_put_files, mock_put, mock_cursor):
+    stage_name = "some_stage_name"
+    mock_put_files.side_effect = lambda local_files, **kwargs: [
+        {"source": f.name, "status": "UPLOADED"} for f in local_files
+    ]
+    mock_put.side_effect = lambda local_path, **kwargs: mock_cursor(
+        [{"source": local_path.name, "status": "SKIPPED"}], []
+    )
+    with temp_local_dir({}) as local_path:
+        result = put_files_on_stage_batched(
+            stage_manager=StageManager(),
+            stage_fqn=stage_name,
+            deploy_root_path=local_path,
+            stage_paths=as_stage_paths(
+                [
+                    "ui/a.py",
+                    "README.md",
+                    "ui/b.py",
+                    "ui/.hidden",
+                    "ui/nested/environment.yml",
+                ]
+            ),
+            overwrite=True,
+            parallel=8,
+        )
+
+    assert mock_put_files.mock_calls == [
+        mock.call(
+            local_files=[local_path / "ui/a.py", local_path / "ui/b.py"],
+            stage_path=f"{stage_name}/ui",
+            parallel=8,
+            overwrite=True,
+            role=None,
+        )
+    ]
+    assert mock_put.mock_calls == [
+        mock.call(
+            local_path=local_path / "ui/.hidden",
+            stage_path=f"{stage_name}/ui",
+            role=None,
+            overwrite=True,
+            parallel=8,
+            use_dict_cursor=True,
+        ),
+        mock.call(
+            local_path=local_path / "README.md",
+            stage_path=stage_name,
+            role=None,
+            overwrite=True,
+            parallel=8,
+            use_dict_cursor=True,
+        ),
+        mock.call(
+            local_path=local_path / "ui/nested/environment.yml",
+            stage_path=f"{stage_name}/ui/nested",
+            role=None,
+            overwrite=True,
+            parallel=8,
+            use_dict_cursor=True,
+        ),
+    ]
+    assert result == {
+        StagePathType("ui/a.py"): "UPLOADED",
+        StagePathType("ui/b.py"): "UPLOADED",
+        StagePathType("ui/.hidden"): "SKIPPED",
+        StagePathType("README.md"): "SKIPPED",
+        StagePathType("ui/nested/environment.yml"): "SKIPPED",
+    }
+
+
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+@mock.patch(f"{STAGE_MANAGER}.put_files")
+def test_sync_local_diff_with_stage_switches_role_once(
+    mock_put_files, mock_execute, mock_cursor
+):
+    mock_execute.return_value = mock_cursor([("old_role",)], [])
+    mock_put_files.side_effect = lambda local_files, **kwargs: [
+        {"source": f.name, "status": "UPLOADED"} for f in local_files
+    ]
+    diff = DiffResult()
+    diff.different = as_stage_paths(["dir/a.txt", "dir/b.txt"])
+    diff.only_local = as_stage_paths(["dir/c.txt", "dir/d.txt"])
+    diff.only_on_stage = as_stage_paths(["old.txt"])
+
+    with temp_local_dir({}) as local_path:
+        sync_local_diff_with_stage(
+            role="new_role",
+            deploy_root_path=local_path,
+            diff_result=diff,
+            stage_fqn="stage",
+        )
+
+    assert mock_execute.mock_calls == [
+        mock.call("select current_role()"),
+        mock.call("use role new_role"),
+        mock.call("remove @stage/old.txt"),
+        mock.call("use role old_role"),
+    ]
+    assert mock_put_files.call_count == 2
+    assert diff.upload_status == {
+        p: "UPLOADED" for p in diff.different + diff.only_local
+    }
+
+
+@mock.patch(f"{STAGE_MANAGER}.use_role")
 @mock.patch(f"{STAGE_MANAGER}.remove")
-def test_sync_local_diff_with_stage(mock_remove, other_directory):
+def test_sync_local_diff_with_stage(mock_remove, mock_use_role, other_directory):
     temp_dir = Path(other_directory)
     mock_remove.side_effect = Exception("Mock Exception")
     mock_remove.return_value = None
@@ -358,6 +531,42 @@ def test_filter_from_diff():
     assert new_diff.identical == diff.identical
 
 
+def test_diff_result_columns():
+    diff = DiffResult(
+        identical=as_stage_paths(["same.txt"]),
+        only_local=["a/b.txt", "a-b.txt"],
+    )
+    assert not DiffResult(identical=["same.txt"]).has_changes()
+    assert diff.has_changes()
+    assert diff.only_local == as_stage_paths(["a/b.txt", "a-b.txt"])
+    # paths are sorted the same way as StagePathType objects
+    assert diff.to_dict() == {
+        "modified": [],
+        "added": ["a/b.txt", "a-b.txt"],
+        "deleted": [],
+    }
+
+    diff.only_local = []
+    diff.only_on_stage = as_stage_paths(["old.txt"])
+    assert diff == DiffResult(identical=["same.txt"], only_on_stage=["old.txt"])
+    assert len(diff) == 2
+
+
+def test_diff_result_paths_cannot_be_modified_in_place():
+    diff = DiffResult(only_local=["a.txt"])
+    with pytest.raises(TypeError):
+        diff.only_local.append(StagePathType("b.txt"))
+    with pytest.raises(TypeError):
+        diff.only_local[0] = StagePathType("b.txt")
+    with pytest.raises(TypeError):
+        diff.only_local += as_stage_paths(["b.txt"])
+    assert diff.only_local == as_stage_paths(["a.txt"])
+
+    diff.add_paths(as_stage_paths(["b.txt"]), DiffStatus.ONLY_LOCAL)
+    diff.add("c.txt", DiffStatus.ONLY_LOCAL)
+    assert diff.only_local == as_stage_paths(["a.txt", "b.txt", "c.txt"])
+
+
 def test_print_diff_to_console_no_bundlemap(
     capsys,
     os_agnostic_snapshot,
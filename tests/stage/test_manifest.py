@@ -0,0 +1,225 @@
+# Copyright (c) 2024 Snowflake Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path, PurePosixPath
+from unittest import mock
+
+import pytest
+from snowflake.cli._plugins.stage.diff import (
+    DiffResult,
+    compute_stage_diff,
+    sync_local_diff_with_stage,
+)
+from snowflake.cli._plugins.stage.manager import StageManager
+from snowflake.cli._plugins.stage.manifest import (
+    DEPLOY_MANIFEST_FILE_NAME,
+    DeployManifest,
+    ManifestEntry,
+    load_deploy_manifest,
+    save_deploy_manifest,
+)
+
+from tests.testing_utils.files_and_dirs import temp_local_dir
+
+STAGE_MANAGER = "snowflake.cli._plugins.stage.manager.StageManager"
+FEATURE_FLAG = "snowflake.cli.api.feature_flags.FeatureFlag.ENABLE_STAGE_DEPLOY_MANIFEST.is_enabled"
+STAGE_LS_COLUMNS = ["name", "size", "md5", "last_modified"]
+
+
+def md5_of(contents: str) -> str:
+    return hashlib.md5(contents.encode()).hexdigest()
+
+
+def manifest_ls_row(md5: str = "f" * 32, last_modified: str = "Tue, 1 Jan 2030"):
+    return {
+        "name": f"stage/{DEPLOY_MANIFEST_FILE_NAME}",
+        "size": 100,
+        "md5": md5,
+        "last_modified": last_modified,
+    }
+
+
+MANIFEST = DeployManifest(
+    entries={
+        PurePosixPath("README.md"): ManifestEntry(md5_of("readme"), 6, 1.0),
+        PurePosixPath("src/app.py"): ManifestEntry(md5_of("app"), 3, 1.0),
+        PurePosixPath("unknown.txt"): ManifestEntry(None),
+    }
+)
+
+
+def test_manifest_json_roundtrip():
+    assert DeployManifest.from_json(MANIFEST.to_json()) == MANIFEST
+
+
+def test_manifest_unknown_version():
+    with pytest.raises(ValueError):
+        DeployManifest.from_json('{"version": 0, "entries": {}}')
+
+
+@mock.patch(f"{STAGE_MANAGER}.get")
+@mock.patch(f"{STAGE_MANAGER}.list_files")
+def test_load_deploy_manifest_missing(mock_list, mock_get, mock_cursor):
+    mock_list.return_value = mock_cursor(rows=[], columns=STAGE_LS_COLUMNS)
+
+    assert load_deploy_manifest(StageManager(), "db.schema.stage") is None
+    mock_list.assert_called_once_with(f"db.schema.stage/{DEPLOY_MANIFEST_FILE_NAME}")
+    mock_get.assert_not_called()
+
+
+@mock.patch(f"{STAGE_MANAGER}.get")
+@mock.patch(f"{STAGE_MANAGER}.list_files")
+def test_load_deploy_manifest_downloads_once(
+    mock_list, mock_get, mock_cursor, snowflake_home
+):
+    mock_list.side_effect = lambda *args, **kwargs: mock_cursor(
+        rows=[manifest_ls_row()], columns=STAGE_LS_COLUMNS
+    )
+    mock_get.side_effect = lambda stage_path, dest_path: (
+        dest_path / DEPLOY_MANIFEST_FILE_NAME
+    ).write_text(MANIFEST.to_json())
+
+    assert load_deploy_manifest(StageManager(), "db.schema.stage") == MANIFEST
+    # the local copy is used as long as the manifest on the stage does not change
+    assert load_deploy_manifest(StageManager(), "db.schema.stage") == MANIFEST
+    mock_get.assert_called_once()
+
+    mock_list.side_effect = lambda *args, **kwargs: mock_cursor(
+        rows=[manifest_ls_row(md5="e" * 32)], columns=STAGE_LS_COLUMNS
+    )
+    assert load_deploy_manifest(StageManager(), "db.schema.stage") == MANIFEST
+    assert mock_get.call_count == 2
+
+
+@mock.patch(f"{STAGE_MANAGER}.get")
+@mock.patch(f"{STAGE_MANAGER}.put")
+@mock.patch(f"{STAGE_MANAGER}.list_files")
+def test_save_deploy_manifest(
+    mock_list, mock_put, mock_get, mock_cursor, snowflake_home
+):
+    uploaded = {}
+
+    def put(local_path, stage_path, overwrite):
+        uploaded[stage_path] = Path(local_path).read_text()
+
+    mock_put.side_effect = put
+    mock_list.return_value = mock_cursor(
+        rows=[manifest_ls_row()], columns=STAGE_LS_COLUMNS
+    )
+
+    manifest = DeployManifest(entries=dict(MANIFEST.entries))
+    save_deploy_manifest(StageManager(), "db.schema.stage", manifest)
+
+    assert DeployManifest.from_json(uploaded["db.schema.stage"]) == MANIFEST
+    assert manifest.stamp == ("f" * 32, "Tue, 1 Jan 2030")
+    # the saved manifest is read back from the local copy
+    assert load_deploy_manifest(StageManager(), "db.schema.stage") == MANIFEST
+    mock_get.assert_not_called()
+
+
+@mock.patch(FEATURE_FLAG, return_value=True)
+@mock.patch("snowflake.cli._plugins.stage.diff.load_deploy_manifest")
+@mock.patch(f"{STAGE_MANAGER}.list_files")
+def test_compute_stage_diff_uses_manifest(mock_list, mock_load, _, snowflake_home):
+    mock_load.return_value = MANIFEST
+    local_files = {
+        "README.md": "readme",
+        "src/app.py": "modified",
+        "unknown.txt": "?",
+        "new.txt": "new",
+    }
+    with temp_local_dir(local_files) as local_path:
+        diff = compute_stage_diff(local_path, "db.schema.stage")
+
+    mock_list.assert_not_called()
+    assert diff.identical == [PurePosixPath("README.md")]
+    assert sorted(diff.different) == [
+        PurePosixPath("src/app.py"),
+        PurePosixPath("unknown.txt"),
+    ]
+    assert diff.only_local == [PurePosixPath("new.txt")]
+    assert diff.only_on_stage == []
+    assert diff.manifest is MANIFEST
+
+
+@mock.patch(FEATURE_FLAG, return_value=True)
+@mock.patch(f"{STAGE_MANAGER}.list_files")
+def test_compute_stage_diff_without_manifest(mock_list, _, mock_cursor, snowflake_home):
+    # the first call lists only the manifest, the second one the whole stage
+    mock_list.side_effect = [
+        mock_cursor(rows=[], columns=STAGE_LS_COLUMNS),
+        mock_cursor(
+            rows=[
+                {"name": "stage/README.md", "md5": md5_of("readme")},
+                {"name": "stage/old.txt", "md5": md5_of("old")},
+                {"name": f"stage/{DEPLOY_MANIFEST_FILE_NAME}", "md5": "f" * 32},
+            ],
+            columns=STAGE_LS_COLUMNS,
+        ),
+    ]
+    with temp_local_dir({"README.md": "readme"}) as local_path:
+        diff = compute_stage_diff(local_path, "db.schema.stage")
+
+    assert diff.identical == [PurePosixPath("README.md")]
+    assert diff.only_on_stage == [PurePosixPath("old.txt")]
+    assert diff.manifest == DeployManifest(
+        entries={
+            PurePosixPath("README.md"): ManifestEntry(None),
+            PurePosixPath("old.txt"): ManifestEntry(None),
+        }
+    )
+    assert diff.manifest.stamp is None
+
+
+@mock.patch("snowflake.cli._plugins.stage.diff.save_deploy_manifest")
+@mock.patch(f"{STAGE_MANAGER}.remove_files")
+@mock.patch(f"{STAGE_MANAGER}.put")
+def test_sync_local_diff_with_stage_saves_manifest(
+    mock_put, mock_remove_files, mock_save
+):
+    mock_put.return_value.fetchall.return_value = [{"status": "UPLOADED"}]
+    diff = DiffResult(
+        identical=[PurePosixPath("README.md")],
+        different=[PurePosixPath("src/app.py")],
+        only_local=[PurePosixPath("new.txt")],
+        only_on_stage=[PurePosixPath("unknown.txt")],
+    )
+    diff.manifest = DeployManifest(entries=dict(MANIFEST.entries))
+    local_files = {"README.md": "readme", "src/app.py": "modified", "new.txt": "new"}
+
+    with temp_local_dir(local_files) as local_path:
+        sync_local_diff_with_stage(
+            role=None,
+            deploy_root_path=local_path,
+            diff_result=diff,
+            stage_fqn="db.schema.stage",
+        )
+
+    mock_save.assert_called_once_with(mock.ANY, "db.schema.stage", diff.manifest)
+    entries = diff.manifest.entries
+    assert set(entries) == {
+        PurePosixPath("README.md"),
+        PurePosixPath("src/app.py"),
+        PurePosixPath("new.txt"),
+    }
+    assert (
+        entries[PurePosixPath("README.md")]
+        == MANIFEST.entries[PurePosixPath("README.md")]
+    )
+    assert entries[PurePosixPath("src/app.py")].md5 == md5_of("modified")
+    assert entries[PurePosixPath("src/app.py")].size == len("modified")
+    assert entries[PurePosixPath("new.txt")].md5 == md5_of("new")
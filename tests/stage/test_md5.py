@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import math
 from pathlib import Path
 from typing import List, Tuple
@@ -24,7 +25,9 @@ from snowflake.cli._plugins.stage.md5 import (
     ONE_MEGABYTE,
     UnknownMD5FormatError,
     compute_md5sum,
+    compute_md5sums,
     file_matches_md5sum,
+    multipart_chunk_size_candidates,
 )
 from snowflake.connector.constants import S3_CHUNK_SIZE, S3_MAX_PARTS, S3_MIN_PART_SIZE
 
@@ -52,6 +55,51 @@ def test_multipart_md5sum():
         )
 
 
+def test_compute_md5sums_single_pass_matches_individual_md5sums():
+    contents = "This is a test. This is a test. This is a test."
+    with temp_local_dir({"README.md": contents}) as root:
+        expected = {
+            chunk_size: compute_md5sum(root / "README.md", chunk_size)
+            for chunk_size in [None, 8, 5, 100]
+        }
+        # blocks not aligned with any of the chunk sizes
+        with mock.patch("snowflake.cli._plugins.stage.md5.HASH_BLOCK_BYTES", 7):
+            assert compute_md5sums(root / "README.md", [None, 8, 5, 100]) == expected
+        assert expected[8] == "47754cc91d4369081c0153ef0cb86675-6"
+        assert expected[None] == hashlib.md5(contents.encode()).hexdigest()
+
+
+def test_compute_md5sums_without_mmap():
+    with temp_local_dir({"README.md": "12345678"}) as root:
+        with mock.patch("mmap.mmap", side_effect=OSError("mmap not supported")):
+            assert compute_md5sums(root / "README.md", [None, 3]) == {
+                None: "25d55ad283aa400af464c76d713c07ad",
+                3: compute_md5sum(root / "README.md", 3),
+            }
+
+
+@pytest.mark.parametrize(
+    "file_size, num_chunks, expected",
+    [
+        # default connector chunk size
+        (math.ceil(S3_CHUNK_SIZE * 1.4), 2, [S3_CHUNK_SIZE, 6 * ONE_MEGABYTE]),
+        # only the 1mb-aligned chunk size results in 6 parts
+        (math.ceil(S3_CHUNK_SIZE * 1.4), 6, [2 * ONE_MEGABYTE]),
+        # derived chunk size for max parts; duplicates are removed
+        (
+            S3_MAX_PARTS * S3_MIN_PART_SIZE * 2,
+            S3_MAX_PARTS,
+            [S3_MIN_PART_SIZE * 2],
+        ),
+        # no chunk size can split a small file in so many parts
+        (S3_MAX_PARTS * 50, S3_MAX_PARTS, []),
+        (0, 1, []),
+    ],
+)
+def test_multipart_chunk_size_candidates(file_size, num_chunks, expected):
+    assert multipart_chunk_size_candidates(file_size, num_chunks) == expected
+
+
 @pytest.mark.parametrize(
     "remote_md5, file_size, chunk_size_and_md5, expected",
     [
@@ -91,21 +139,22 @@ def test_multipart_md5sum():
             False,
         ),
         # multi-part md5sum w/ default chunk size
-        # we check the default S3 chunk size first
+        # all candidate chunk sizes are computed in a single pass
         (
             "00001111222233334444555566667777-2",
             math.ceil(S3_CHUNK_SIZE * 1.4),
-            [(S3_CHUNK_SIZE, "00001111222233334444555566667777-2")],
+            [
+                (S3_CHUNK_SIZE, "00001111222233334444555566667777-2"),
+                (6 * ONE_MEGABYTE, "badmd5-2"),
+            ],
             True,
         ),
         # multi-part md5sum w/ 2mb chunk size
-        # we check the default S3 chunk size first,
-        # then fall back to 1mb-aligned chunk size
+        # the default S3 chunk size would result in 2 parts, so it's not computed
         (
             "00001111222233334444555566667777-6",
             math.ceil(S3_CHUNK_SIZE * 1.4),
             [
-                (S3_CHUNK_SIZE, "badmd5-2"),
                 (2 * ONE_MEGABYTE, "00001111222233334444555566667777-6"),
             ],
             True,
@@ -124,21 +173,27 @@ def test_multipart_md5sum():
         ),
         # multi-part, but incorrect md5sum
         (
-            f"00001111222233334444555566667777-{S3_MAX_PARTS}",
-            S3_MAX_PARTS * 50,
+            "00001111222233334444555566667777-2",
+            math.ceil(S3_CHUNK_SIZE * 1.4),
             [
-                (max(50, S3_MIN_PART_SIZE), f"badmd5-{S3_MAX_PARTS}"),
-                (S3_CHUNK_SIZE, f"badmd5-50"),
-                (ONE_MEGABYTE, f"badmd5-400"),
+                (S3_CHUNK_SIZE, "badmd5-2"),
+                (6 * ONE_MEGABYTE, "badmd5-2"),
             ],
             False,
         ),
+        # multi-part, but no chunk size results in the given number of parts
+        (
+            f"00001111222233334444555566667777-{S3_MAX_PARTS}",
+            S3_MAX_PARTS * 50,
+            None,
+            False,
+        ),
     ],
 )
 @mock.patch("os.path.getsize")
-@mock.patch("snowflake.cli._plugins.stage.md5.compute_md5sum")
+@mock.patch("snowflake.cli._plugins.stage.md5.compute_md5sums")
 def test_file_matches_md5sum(
-    compute_md5sum: mock.NonCallableMock,
+    compute_md5sums: mock.NonCallableMock,
     getsize: mock.NonCallableMock,
     remote_md5: str | None,
     file_size: int | None,  # None if we don't expect it to be called
@@ -147,22 +202,7 @@ def test_file_matches_md5sum(
 ):
     local_file = mock.Mock(spec=Path)
     getsize.return_value = file_size
-
-    def get_md5_for_chunk(_, requested_chunk_size: int | None = None):
-        """Returns the test-configured md5 for a given chunk size"""
-        if chunk_size_and_md5:
-            for (chunk_size, md5) in chunk_size_and_md5:
-                if chunk_size == requested_chunk_size:
-                    return md5
-            # passed in a chunk size we didn't expect
-            assert requested_chunk_size in [
-                chunk_size for (chunk_size, _) in chunk_size_and_md5
-            ]
-        else:
-            # didn't expect any calls to compute_md5sum
-            assert False
-
-    compute_md5sum.side_effect = get_md5_for_chunk
+    compute_md5sums.return_value = dict(chunk_size_and_md5 or [])
 
     # actual test
     if isinstance(expected, bool):
@@ -172,13 +212,9 @@ def test_file_matches_md5sum(
             file_matches_md5sum(local_file, remote_md5)
 
     if chunk_size_and_md5 is None:
-        compute_md5sum.assert_not_called()
+        compute_md5sums.assert_not_called()
     else:
-        compute_md5sum.assert_has_calls(
-            [
-                mock.call(local_file, chunk_size)
-                if chunk_size is not None
-                else mock.call(local_file)
-                for (chunk_size, _) in chunk_size_and_md5
-            ]
+        # the file is read only once for all candidate chunk sizes
+        compute_md5sums.assert_called_once_with(
+            local_file, [chunk_size for (chunk_size, _) in chunk_size_and_md5]
         )
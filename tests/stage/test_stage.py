@@ -11,14 +11,17 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import hashlib
+import json
+import re
 import sys
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest import mock
-from unittest.mock import MagicMock
 
 import pytest
 from snowflake.cli._plugins.stage.manager import StageManager
+from snowflake.cli.api.commands.common import OnErrorType
 from snowflake.cli.api.errno import DOES_NOT_EXIST_OR_NOT_AUTHORIZED
 from snowflake.cli.api.stage_path import StagePath
 from snowflake.connector import ProgrammingError
@@ -43,7 +46,7 @@ skip_python_3_12 = pytest.mark.skipif(
 )
 @mock.patch(f"{STAGE_MANAGER}.execute_query")
 def test_stage_list(mock_execute, runner, mock_cursor, stage_name, expected_stage_name):
-    mock_execute.return_value = mock_cursor(["row"], [])
+    mock_execute.return_value = mock_cursor([{"name": "stageName/file.txt"}], ["name"])
     result = runner.invoke(["stage", "list-files", "-c", "empty", stage_name])
     assert result.exit_code == 0, result.output
     mock_execute.assert_called_once_with(
@@ -53,7 +56,7 @@ def test_stage_list(mock_execute, runner, mock_cursor, stage_name, expected_stag
 
 @mock.patch(f"{STAGE_MANAGER}.execute_query")
 def test_stage_list_pattern(mock_execute, runner, mock_cursor):
-    mock_execute.return_value = mock_cursor(["row"], [])
+    mock_execute.return_value = mock_cursor([{"name": "stageName/file.txt"}], ["name"])
     result = runner.invoke(
         ["stage", "list-files", "-c", "empty", "--pattern", "REGEX", "stageName"]
     )
@@ -63,6 +66,59 @@ def test_stage_list_pattern(mock_execute, runner, mock_cursor):
     )
 
 
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+def test_stage_list_prefixes(mock_execute, runner, mock_cursor):
+    def ls(query, **kwargs):
+        prefix = query.split("/", 1)[1].split(" ")[0]
+        return mock_cursor(
+            [{"name": f"stageName/{prefix}file{i}.txt"} for i in range(2)], ["name"]
+        )
+
+    mock_execute.side_effect = ls
+    result = runner.invoke(
+        [
+            "stage",
+            "list-files",
+            "stageName",
+            "--prefix",
+            "b/",
+            "--prefix",
+            "a/",
+            "--pattern",
+            ".*txt",
+            "--format",
+            "json",
+        ]
+    )
+    assert result.exit_code == 0, result.output
+    # rows are returned in the order of the prefixes
+    assert [row["name"] for row in json.loads(result.output)] == [
+        "stageName/b/file0.txt",
+        "stageName/b/file1.txt",
+        "stageName/a/file0.txt",
+        "stageName/a/file1.txt",
+    ]
+    assert sorted(c.args[0] for c in mock_execute.mock_calls) == [
+        "ls @stageName/a/ pattern = '.*txt'",
+        "ls @stageName/b/ pattern = '.*txt'",
+    ]
+
+
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+def test_stage_list_streams_rows(mock_execute, runner, mock_cursor):
+    rows = [{"name": "stageName/a.txt"}, {"name": "stageName/b.txt"}]
+    mock_execute.return_value = mock_cursor(list(rows), ["name"])
+
+    with mock.patch(
+        f"{STAGE_MANAGER}.iter_files", wraps=StageManager().iter_files
+    ) as mock_iter_files:
+        result = runner.invoke(["stage", "list-files", "stageName", "--format", "json"])
+
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output) == rows
+    mock_iter_files.assert_called_once()
+
+
 def test_stage_list_pattern_error(runner):
     result = runner.invoke(
         ["stage", "list-files", "--pattern", "REGEX without escaped '", "stageName"]
@@ -74,7 +130,7 @@ def test_stage_list_pattern_error(runner):
 
 @mock.patch(f"{STAGE_MANAGER}.execute_query")
 def test_stage_list_quoted(mock_execute, runner, mock_cursor):
-    mock_execute.return_value = mock_cursor(["row"], [])
+    mock_execute.return_value = mock_cursor([{"name": "stageName/file.txt"}], ["name"])
     result = runner.invoke(["stage", "list-files", "-c", "empty", '"stage name"'])
     assert result.exit_code == 0, result.output
     mock_execute.assert_called_once_with(
@@ -137,6 +193,105 @@ def test_stage_copy_remote_to_local_quoted_stage_recursive(
     ]
 
 
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+def test_stage_internal_put_files(mock_execute, mock_cursor):
+    uploaded_files = []
+
+    def _put(query, **kwargs):
+        # the temporary directory only exists while PUT is executed
+        tmp_dir = Path(query.split()[1].removeprefix("file://")).parent
+        uploaded_files.extend(sorted(p.name for p in tmp_dir.iterdir()))
+        return mock_cursor(
+            [{"source": name, "status": "UPLOADED"} for name in uploaded_files], []
+        )
+
+    mock_execute.side_effect = _put
+    with TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir).resolve()
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / "file1.txt").write_text("1")
+        (tmp_path / "file2.txt").write_text("2")
+
+        rows = StageManager().put_files(
+            [tmp_path / "a" / "file1.txt", tmp_path / "file2.txt"],
+            "stageName/dir",
+            parallel=8,
+        )
+
+    assert uploaded_files == ["file1.txt", "file2.txt"]
+    assert [r["source"] for r in rows] == ["file1.txt", "file2.txt"]
+    assert mock_execute.call_count == 1
+    query = mock_execute.call_args.args[0]
+    assert query.endswith(
+        "/* @stageName/dir auto_compress=false parallel=8 overwrite=False"
+    )
+    assert mock_execute.call_args.kwargs == {"cursor_class": DictCursor}
+
+
+@pytest.mark.parametrize(
+    "files", [["a/file.txt", "b/file.txt"], ["file.txt", ".hidden"]]
+)
+def test_stage_internal_put_files_invalid_names(files):
+    with pytest.raises(ValueError):
+        StageManager().put_files([Path(f) for f in files], "stageName")
+
+
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+def test_stage_remove_files_coalesces_paths(mock_execute, mock_cursor):
+    mock_execute.return_value = mock_cursor(["row"], [])
+    StageManager().remove_files(
+        "db.schema.stageName",
+        ["README.md", "src/app (1).py", "a*b?.txt", "it's.txt", "[x]$.txt"],
+    )
+    assert mock_execute.mock_calls == [
+        mock.call(
+            "remove @db.schema.stageName pattern = "
+            "'^[^/]+/(README[.]md|src/app [(]1[)][.]py|a[*]b[?][.]txt|[[]x[]][$][.]txt)$'"
+        ),
+        mock.call("remove '@db.schema.stageName/it\\'s.txt'"),
+    ]
+
+
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+def test_stage_remove_files_user_stage_subdirectory(mock_execute, mock_cursor):
+    mock_execute.return_value = mock_cursor(["row"], [])
+    StageManager().remove_files("~/dir", ["a.txt", "b.txt"])
+    mock_execute.assert_called_once_with(
+        "remove '@~' pattern = '^(dir/a[.]txt|dir/b[.]txt)$'"
+    )
+
+
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+def test_stage_remove_files_bounded_pattern_length(mock_execute, mock_cursor):
+    mock_execute.return_value = mock_cursor(["row"], [])
+    files = [f"file{i}.txt" for i in range(5)]
+    StageManager().remove_files("stageName", files, max_pattern_length=40)
+    assert mock_execute.mock_calls == [
+        mock.call("remove @stageName pattern = '^[^/]+/(file0[.]txt|file1[.]txt)$'"),
+        mock.call("remove @stageName pattern = '^[^/]+/(file2[.]txt|file3[.]txt)$'"),
+        mock.call("remove @stageName/file4.txt"),
+    ]
+
+
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+def test_stage_remove_files_switches_role_once(mock_execute, mock_cursor):
+    mock_execute.side_effect = [
+        mock_cursor([("old_role",)], []),
+        mock_cursor(["row"], []),
+        mock_cursor(["row"], []),
+        mock_cursor(["row"], []),
+        mock_cursor(["row"], []),
+    ]
+    StageManager().remove_files("stageName", ["a.txt", "b.txt", "c\\d"], role="r")
+    assert mock_execute.mock_calls == [
+        mock.call("select current_role()"),
+        mock.call("use role r"),
+        mock.call("remove @stageName pattern = '^[^/]+/(a[.]txt|b[.]txt)$'"),
+        mock.call("remove '@stageName/c\\\\d'"),
+        mock.call("use role old_role"),
+    ]
+
+
 @pytest.mark.parametrize(
     "raw_path,expected_uri",
     [
@@ -336,8 +491,6 @@ def test_stage_copy_local_to_remote_star(mock_execute, runner, mock_cursor):
 @pytest.mark.parametrize(
     "source, dest",
     [
-        ("@snow/stage", "@stage/snow"),
-        ("snow://stage", "snow://stage/snow"),
         ("local/path", "other/local/path"),
     ],
 )
@@ -349,6 +502,35 @@ def test_copy_throws_error_for_same_platform_operation(
     assert result.output == os_agnostic_snapshot
 
 
+@pytest.mark.parametrize(
+    "source, dest",
+    [
+        ("@snow/stage", "@stage/snow"),
+        ("snow://stage", "snow://stage/snow"),
+    ],
+)
+@pytest.mark.parametrize(
+    "options, expected_error",
+    [
+        (["--overwrite"], "`--overwrite` cannot be used"),
+        (["--parallel", "8"], "`--parallel` cannot be used"),
+        (
+            ["--overwrite", "--auto-compress"],
+            "`--overwrite`, `--auto-compress` cannot be used",
+        ),
+    ],
+)
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+def test_copy_stage_to_stage_rejects_upload_options(
+    mock_execute, runner, source, dest, options, expected_error
+):
+    result = runner.invoke(["stage", "copy", source, dest, *options])
+    assert result.exit_code == 2, result.output
+    assert expected_error in result.output
+    assert "when copying files between" in result.output
+    mock_execute.assert_not_called()
+
+
 @pytest.mark.parametrize(
     "stage_path, files_on_stage, expected_stage_path, expected_calls",
     [
@@ -506,6 +688,285 @@ def test_copy_get_recursive_from_user_stage(
     assert copy_calls == [mock.call(c.format(temp_dir)) for c in expected_calls]
 
 
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+def test_copy_get_recursive_sync(mock_execute, mock_cursor, temp_dir):
+    local_content = "select 1;"
+    local_md5 = hashlib.md5(local_content.encode()).hexdigest()
+    (Path(temp_dir) / "a").mkdir()
+    (Path(temp_dir) / "a" / "s1.sql").write_text(local_content)
+    (Path(temp_dir) / "a" / "s2.sql").write_text("outdated")
+    files_on_stage = ["a/s1.sql", "a/s2.sql", "a/s5.sql", "a/b/s3.sql", "s4.sql"]
+    mock_execute.return_value = mock_cursor(
+        [{"name": f"exe/{file}", "md5": local_md5} for file in files_on_stage], []
+    )
+
+    StageManager().get_recursive_sync("@exe", Path(temp_dir))
+
+    ls_call, *copy_calls = mock_execute.mock_calls
+    assert ls_call == mock.call("ls @exe", cursor_class=DictCursor)
+    # groups are downloaded concurrently
+    assert sorted(copy_calls) == sorted(
+        mock.call(c.format(temp_dir))
+        for c in [
+            "get @exe/a file://{}/a/ parallel=4 pattern = '^[^/]+/(a/s2[.]sql|a/s5[.]sql)$'",
+            "get @exe/a/b/s3.sql file://{}/a/b/ parallel=4",
+            "get @exe/s4.sql file://{}/ parallel=4",
+        ]
+    )
+    assert (Path(temp_dir) / "a" / "b").is_dir()
+
+
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+def test_copy_get_recursive_sync_nothing_to_download(
+    mock_execute, mock_cursor, temp_dir
+):
+    (Path(temp_dir) / "s1.sql").write_text("select 1;")
+    # names listed on the user stage are not prefixed with the stage name
+    mock_execute.return_value = mock_cursor(
+        [{"name": "s1.sql", "md5": hashlib.md5(b"select 1;").hexdigest()}], []
+    )
+
+    StageManager().get_recursive_sync("@~", Path(temp_dir))
+
+    mock_execute.assert_called_once_with("ls '@~'", cursor_class=DictCursor)
+
+
+@mock.patch(f"{STAGE_MANAGER}.get_recursive_sync")
+def test_copy_sync_calls_sync_download(mock_get_sync, runner, temp_dir):
+    mock_get_sync.return_value = []
+    result = runner.invoke(["stage", "copy", "@exe", temp_dir, "--recursive", "--sync"])
+    assert result.exit_code == 0, result.output
+    mock_get_sync.assert_called_once_with(
+        stage_path="@exe", dest_path=Path(temp_dir).resolve(), parallel=4
+    )
+
+
+@pytest.mark.parametrize(
+    "source, destination, flags",
+    [
+        ("@exe", "{}", []),
+        ("{}", "@exe", ["--recursive"]),
+    ],
+)
+def test_copy_sync_requires_recursive_download(
+    runner, temp_dir, source, destination, flags
+):
+    result = runner.invoke(
+        [
+            "stage",
+            "copy",
+            source.format(temp_dir),
+            destination.format(temp_dir),
+            "--sync",
+            *flags,
+        ]
+    )
+    assert result.exit_code == 1, result.output
+    assert "The `--sync` flag can only be used when downloading" in result.output
+
+
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+def test_copy_stage_to_stage_recursive(mock_execute, runner, mock_cursor):
+    mock_execute.return_value = mock_cursor([("dir/a.txt",)], ["file"])
+    result = runner.invoke(["stage", "copy", "@src/dir", "@dst/target", "--recursive"])
+    assert result.exit_code == 0, result.output
+    mock_execute.assert_called_once_with("copy files into @dst/target/ from @src/dir/")
+
+
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+def test_copy_stage_to_stage_top_level_files(mock_execute, runner, mock_cursor):
+    mock_execute.side_effect = [
+        mock_cursor(
+            [
+                {"name": "src/dir/a.txt", "md5": "1" * 32},
+                {"name": "src/dir/sub/b.txt", "md5": "2" * 32},
+                {"name": "src/dir_2/c.txt", "md5": "3" * 32},
+            ],
+            ["name", "md5"],
+        ),
+        mock_cursor([("a.txt",)], ["file"]),
+    ]
+    result = runner.invoke(
+        ["stage", "copy", "@src/dir", "@dst", "--pattern", ".*[.]txt"]
+    )
+    assert result.exit_code == 0, result.output
+    assert mock_execute.mock_calls == [
+        mock.call("ls @src/dir pattern = '.*[.]txt'", cursor_class=DictCursor),
+        mock.call("copy files into @dst/ from @src/dir/ files = ('a.txt')"),
+    ]
+
+
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+def test_copy_stage_to_stage_only_changed(mock_execute, runner, mock_cursor):
+    mock_execute.side_effect = [
+        mock_cursor(
+            [
+                {"name": "src/a.txt", "md5": "1" * 32},
+                {"name": "src/sub/b.txt", "md5": "2" * 32},
+                {"name": "src/sub/c.txt", "md5": "3" * 32},
+            ],
+            ["name", "md5"],
+        ),
+        mock_cursor(
+            [
+                {"name": "dst/a.txt", "md5": "1" * 32},
+                {"name": "dst/sub/b.txt", "md5": "f" * 32},
+            ],
+            ["name", "md5"],
+        ),
+        mock_cursor([("sub/b.txt",), ("sub/c.txt",)], ["file"]),
+    ]
+    result = runner.invoke(
+        ["stage", "copy", "@src", "@dst", "--recursive", "--sync", "--format", "json"]
+    )
+    assert result.exit_code == 0, result.output
+    assert mock_execute.mock_calls[-1] == mock.call(
+        "copy files into @dst/ from @src/ files = ('sub/b.txt', 'sub/c.txt')"
+    )
+    assert json.loads(result.output) == [
+        {"file": "sub/b.txt"},
+        {"file": "sub/c.txt"},
+    ]
+
+
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+def test_copy_stage_to_stage_batches_files(mock_execute, mock_cursor):
+    files = [{"name": f"src/f{i}.txt", "md5": None} for i in range(5)]
+    mock_execute.side_effect = [
+        mock_cursor(files, ["name", "md5"]),
+        mock_cursor([], ["name", "md5"]),
+    ] + [mock_cursor([], ["file"]) for _ in range(3)]
+    with mock.patch("snowflake.cli._plugins.stage.manager.COPY_FILES_MAX_FILES", 2):
+        StageManager().copy_stage_to_stage("@src", "@dst", only_changed=True)
+
+    assert [c.args[0] for c in mock_execute.mock_calls[2:]] == [
+        "copy files into @dst/ from @src/ files = ('f0.txt', 'f1.txt')",
+        "copy files into @dst/ from @src/ files = ('f2.txt', 'f3.txt')",
+        "copy files into @dst/ from @src/ files = ('f4.txt')",
+    ]
+
+
+def test_copy_pattern_requires_stage_to_stage(runner, temp_dir):
+    result = runner.invoke(["stage", "copy", "@exe", temp_dir, "--pattern", ".*"])
+    assert result.exit_code == 1, result.output
+    assert "The `--pattern` option can only be used" in result.output
+
+
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+@mock.patch(f"{STAGE_MANAGER}._conn", new_callable=mock.PropertyMock)
+def test_stage_load(mock_conn, mock_execute, mock_cursor, runner, temp_dir):
+    for name in ["a.csv", "b.csv", "c.csv", "sub/d.csv"]:
+        (Path(temp_dir) / name).parent.mkdir(exist_ok=True)
+        (Path(temp_dir) / name).write_text("1,2\n")
+    mock_conn.return_value.database = "db"
+    mock_conn.return_value.schema = "public"
+
+    def execute_query(query, **kwargs):
+        if query.startswith("copy into"):
+            return mock_cursor(
+                [{"file": "f", "status": "LOADED", "rows_loaded": 3}],
+                ["file", "status", "rows_loaded"],
+            )
+        return mock_cursor([], [])
+
+    mock_execute.side_effect = execute_query
+
+    result = runner.invoke(
+        [
+            "stage",
+            "load",
+            temp_dir,
+            "my_table",
+            "--batch-size",
+            "2",
+            "--max-concurrent-puts",
+            "1",
+            "--format",
+            "json",
+        ]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert [
+        (row["batch"], row["files"], row["bytes"], row["rows_loaded"])
+        for row in json.loads(result.output)
+    ] == [(1, 2, 8, 3), (2, 1, 4, 3), (3, 1, 4, 3)]
+
+    queries = [c.args[0] for c in mock_execute.mock_calls]
+    assert re.fullmatch(
+        r"create temporary stage if not exists IDENTIFIER\('db.public.snowflake_cli_tmp_load_stage_[0-9a-f]{32}'\)",
+        queries[0],
+    )
+    copies = [q for q in queries if q.startswith("copy into")]
+    assert len(copies) == 3
+    for batch_number, copy in enumerate(copies, start=1):
+        assert re.fullmatch(
+            rf"copy into my_table from @db.public.snowflake_cli_tmp_load_stage_[0-9a-f]{{32}}/batch_{batch_number}/ "
+            r"file_format = \(type = CSV\) purge = true",
+            copy,
+        )
+    # every batch is loaded after it has been uploaded
+    puts = [i for i, q in enumerate(queries) if q.startswith("put")]
+    assert puts[0] < queries.index(copies[0])
+
+
+@pytest.mark.parametrize(
+    "files, expected_file_format",
+    [
+        (["a.csv", "b.CSV.gz"], "type = CSV"),
+        (["a.tsv", "b.tsv.gz"], "type = CSV field_delimiter = '\\t'"),
+        (["a.jsonl", "b.json"], "type = JSON"),
+    ],
+)
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+@mock.patch(f"{STAGE_MANAGER}._conn", new_callable=mock.PropertyMock)
+def test_stage_load_infers_file_format(
+    mock_conn, mock_execute, mock_cursor, runner, temp_dir, files, expected_file_format
+):
+    for name in files:
+        (Path(temp_dir) / name).write_text("1\t2\n")
+    mock_conn.return_value.database = "db"
+    mock_conn.return_value.schema = "public"
+    mock_execute.side_effect = lambda query, **kwargs: mock_cursor([], [])
+
+    result = runner.invoke(["stage", "load", temp_dir, "my_table"])
+
+    assert result.exit_code == 0, result.output
+    copies = [
+        c.args[0] for c in mock_execute.mock_calls if c.args[0].startswith("copy into")
+    ]
+    assert len(copies) == 1
+    assert copies[0].endswith(
+        f"/batch_1/ file_format = ({expected_file_format}) purge = true"
+    )
+
+
+@pytest.mark.parametrize(
+    "files, options, error",
+    [
+        (["a.csv", "b.parquet"], [], "Cannot infer the file format"),
+        (["a.csv", "b.tsv"], [], "Cannot infer the file format"),
+        (
+            ["a.csv"],
+            ["--file-format", "ff", "--file-format-options", "type = csv"],
+            "not both",
+        ),
+    ],
+)
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+def test_stage_load_file_format_errors(
+    mock_execute, runner, temp_dir, files, options, error
+):
+    for name in files:
+        (Path(temp_dir) / name).write_text("1")
+
+    result = runner.invoke(["stage", "load", temp_dir, "my_table", *options])
+
+    assert result.exit_code == 2, result.output
+    assert error in result.output
+    mock_execute.assert_not_called()
+
+
 @mock.patch(f"{STAGE_MANAGER}.execute_query")
 def test_stage_create(mock_execute, runner, mock_cursor):
     mock_execute.return_value = mock_cursor(["row"], [])
@@ -1097,6 +1558,166 @@ def test_execute_continue_on_error(
     ]
 
 
+class _AsyncQueriesConnection:
+    """Fake connection running each asynchronous query for two status polls."""
+
+    def __init__(self, failing_files=()):
+        self.submitted = []
+        self.completed = []
+        self.completed_before_submit = {}
+        self.cursors = []
+        self.running = {}
+        self.max_running = 0
+        self._failing_files = failing_files
+
+    def cursor(self):
+        cursor = mock.Mock()
+        self.cursors.append(cursor)
+
+        def execute_async(query):
+            query_id = f"query-{len(self.submitted)}"
+            file = query.split("/", 1)[1]
+            self.submitted.append(file)
+            self.completed_before_submit[file] = list(self.completed)
+            self.running[query_id] = 2
+            self.max_running = max(self.max_running, len(self.running))
+            cursor.sfqid = query_id
+
+        cursor.execute_async.side_effect = execute_async
+        return cursor
+
+    def get_query_status(self, query_id):
+        self.running[query_id] -= 1
+        return self.running[query_id]
+
+    @staticmethod
+    def is_still_running(status):
+        return status > 0
+
+    def get_query_status_throw_if_error(self, query_id):
+        del self.running[query_id]
+        file = self.submitted[int(query_id.split("-")[1])]
+        self.completed.append(file)
+        if file in self._failing_files:
+            raise ProgrammingError(f"Error in {file}")
+
+
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+@mock.patch(f"{STAGE_MANAGER}._conn", new_callable=mock.PropertyMock)
+@mock.patch("snowflake.cli._plugins.stage.manager.EXECUTE_POLL_INTERVAL_SECONDS", 0)
+def test_execute_parallel(mock_conn, mock_execute, mock_cursor, runner):
+    files = [
+        "exe/a/s1.sql",
+        "exe/a/s2.sql",
+        "exe/b/s1.sql",
+        "exe/c/s1.sql",
+        "exe/s1.sql",
+    ]
+    mock_execute.return_value = mock_cursor([{"name": f} for f in files], [])
+    connection = _AsyncQueriesConnection()
+    mock_conn.return_value = connection
+
+    result = runner.invoke(
+        ["stage", "execute", "exe", "--parallel", "2", "--format", "json"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert sorted(
+        (row["File"], row["Status"]) for row in json.loads(result.output)
+    ) == [(f"@{f}", "SUCCESS") for f in sorted(files)]
+    assert connection.max_running == 2
+    # files from the same directory are executed in order
+    assert connection.submitted.index("a/s1.sql") < connection.submitted.index(
+        "a/s2.sql"
+    )
+    mock_execute.assert_called_once_with("ls @exe", cursor_class=DictCursor)
+    assert all(cursor.close.called for cursor in connection.cursors)
+
+
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+@mock.patch(f"{STAGE_MANAGER}._conn", new_callable=mock.PropertyMock)
+@mock.patch("snowflake.cli._plugins.stage.manager.EXECUTE_POLL_INTERVAL_SECONDS", 0)
+def test_execute_parallel_waits_for_parent_directories(
+    mock_conn, mock_execute, mock_cursor, runner
+):
+    files = [
+        "exe/s1.sql",
+        "exe/a/s1.sql",
+        "exe/a/b/s1.sql",
+        "exe/ab/s1.sql",
+        "exe/c/s1.sql",
+    ]
+    mock_execute.return_value = mock_cursor([{"name": f} for f in files], [])
+    connection = _AsyncQueriesConnection()
+    mock_conn.return_value = connection
+
+    result = runner.invoke(["stage", "execute", "exe", "--parallel", "4"])
+
+    assert result.exit_code == 0, result.output
+    completed_before = connection.completed_before_submit
+    # files in the root of the executed directory are executed before all others
+    for file in ["a/s1.sql", "a/b/s1.sql", "ab/s1.sql", "c/s1.sql"]:
+        assert "s1.sql" in completed_before[file]
+    # nested directories wait for their parent directories only
+    assert "a/s1.sql" in completed_before["a/b/s1.sql"]
+    assert "a/s1.sql" not in completed_before["ab/s1.sql"]
+    assert "a/s1.sql" not in completed_before["c/s1.sql"]
+
+
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+@mock.patch(f"{STAGE_MANAGER}._conn", new_callable=mock.PropertyMock)
+@mock.patch("snowflake.cli._plugins.stage.manager.EXECUTE_POLL_INTERVAL_SECONDS", 0)
+def test_execute_parallel_break_reports_failures_of_running_files(
+    mock_conn, mock_execute, mock_cursor, runner
+):
+    files = ["exe/a/s1.sql", "exe/b/s1.sql", "exe/c/s1.sql"]
+    mock_execute.return_value = mock_cursor([{"name": f} for f in files], [])
+    connection = _AsyncQueriesConnection(failing_files=["a/s1.sql", "b/s1.sql"])
+    mock_conn.return_value = connection
+
+    result = runner.invoke(
+        ["stage", "execute", "exe", "--parallel", "2", "--on-error", "break"]
+    )
+
+    assert result.exit_code == 1, result.output
+    assert "Error in a/s1.sql" in result.output
+    assert "FAILURE - @exe/b/s1.sql" in result.output
+    assert connection.submitted == ["a/s1.sql", "b/s1.sql"]
+    assert all(cursor.close.called for cursor in connection.cursors)
+
+
+@pytest.mark.parametrize("on_error", ["break", "continue"])
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+@mock.patch(f"{STAGE_MANAGER}._conn", new_callable=mock.PropertyMock)
+@mock.patch("snowflake.cli._plugins.stage.manager.EXECUTE_POLL_INTERVAL_SECONDS", 0)
+def test_execute_parallel_on_error(
+    mock_conn, mock_execute, mock_cursor, runner, on_error
+):
+    files = ["exe/a/s1.sql", "exe/a/s2.sql", "exe/b/s1.sql", "exe/c/s1.sql"]
+    mock_execute.return_value = mock_cursor([{"name": f} for f in files], [])
+    connection = _AsyncQueriesConnection(failing_files=["a/s1.sql"])
+    mock_conn.return_value = connection
+
+    result = runner.invoke(
+        ["stage", "execute", "exe", "--parallel", "2", "--on-error", on_error]
+    )
+
+    if on_error == "break":
+        assert result.exit_code == 1, result.output
+        assert "Error in a/s1.sql" in result.output
+        # the running execution is awaited, but no new file is started
+        assert connection.submitted == ["a/s1.sql", "b/s1.sql"]
+    else:
+        assert result.exit_code == 0, result.output
+        assert "FAILURE - @exe/a/s1.sql" in result.output
+        assert sorted(connection.submitted) == [
+            "a/s1.sql",
+            "a/s2.sql",
+            "b/s1.sql",
+            "c/s1.sql",
+        ]
+
+
 @mock.patch("snowflake.connector.connect")
 @pytest.mark.parametrize(
     "command, parameters",
@@ -1175,6 +1796,76 @@ def test_stage_manager_check_for_requirements_file(
     assert get_mock.download_file == selected
 
 
+@mock.patch(f"{STAGE_MANAGER}.snowpark_session")
+@mock.patch(f"{STAGE_MANAGER}.get")
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+def test_python_execution_procedure_is_cached(
+    mock_execute, mock_get, mock_session, mock_cursor, monkeypatch
+):
+    monkeypatch.setenv("SNOWFLAKE_CLI_STAGE_PYTHON_PROCEDURE_SCHEMA", "db.schema")
+    stage_path = StagePath.from_stage_str("@exe/dir")
+    listed_files = {
+        "exe/dir/requirements.txt": "0cc175b9c0f1b6a831c399e269772661",
+        "exe/dir/script.py": "92eb5ffee6ae2fec3ad71c777531578f",
+    }
+
+    def _get(stage_path, dest, **_):
+        (Path(dest) / "requirements.txt").write_text("pandas\nnumpy")
+
+    mock_get.side_effect = _get
+    mock_execute.side_effect = [
+        mock_cursor([], []),  # show procedures
+        mock_cursor([], []),  # create procedure
+        mock_cursor([{"name": "existing"}], ["name"]),  # show procedures
+    ]
+    procedure_name = (
+        StageManager()._bootstrap_snowpark_execution_environment(  # noqa: SLF001
+            stage_path, listed_files=listed_files
+        )
+    )
+    # the requirements are only downloaded if the procedure does not exist yet
+    assert (
+        StageManager()._bootstrap_snowpark_execution_environment(  # noqa: SLF001
+            stage_path, listed_files=listed_files
+        )
+        == procedure_name
+    )
+    mock_get.assert_called_once()
+
+    show_query, create_query, second_show_query = [
+        c.args[0] for c in mock_execute.mock_calls
+    ]
+    assert procedure_name.startswith("db.schema.SNOWFLAKE_CLI_EXECUTE_PYTHON_V2_")
+    assert show_query == second_show_query
+    assert show_query == (
+        f"show procedures like '{procedure_name.split('.')[-1]}' in schema db.schema"
+    )
+    assert f"create procedure if not exists {procedure_name}(" in create_query
+    assert "execute as caller" in create_query
+    assert (
+        "packages = ('numpy', 'pandas', 'snowflake-snowpark-python', 'snowflake.core')"
+        in create_query
+    )
+
+    # the procedure is called with plain SQL, without a Snowpark session
+    mock_execute.reset_mock(side_effect=True)
+    sm = StageManager()
+    sm._python_exe_procedure = procedure_name  # noqa: SLF001
+    result = sm._execute_python(  # noqa: SLF001
+        "@exe/dir/script.py",
+        on_error=OnErrorType.BREAK,
+        variables={"KEY": "value"},
+        original_file="@exe/dir/script.py",
+    )
+    assert result == {"File": "@exe/dir/script.py", "Status": "SUCCESS", "Error": None}
+    mock_execute.assert_called_once_with(
+        f"call {procedure_name}('@exe/dir/script.py', "
+        """parse_json('{"KEY": "value"}')::object)"""
+    )
+    mock_session.call.assert_not_called()
+    mock_session.add_packages.assert_not_called()
+
+
 class RecursiveUploadTester:
     def __init__(self, tmp_dir: str):
         self.calls: list[dict] = []
@@ -1191,36 +1882,28 @@ class RecursiveUploadTester:
 
         create_structure(self.tmp_dir, structure)
 
-    def execute(self, local_path):
+    def execute(self, local_path, **kwargs):
         calls = self.calls
+        tmp_dir = self.tmp_dir
+
+        def mock_put_files(local_files, stage_path, **_):
+            calls.append(
+                {
+                    "local_files": [str(f.relative_to(tmp_dir)) for f in local_files],
+                    "stage_path": stage_path,
+                }
+            )
+            return [{"source": f.name, "target": f.name} for f in local_files]
 
-        class MockPut(MagicMock):
-            def __call__(self, *args, **kwargs):
-                if kwargs:
-                    calls.append(
-                        {
-                            "local_path": kwargs["local_path"],
-                            "stage_path": kwargs["stage_path"],
-                        }
-                    )
-                return super().__call__(*args, **kwargs)
-
-        class MockTemporaryDirectory(TemporaryDirectory):
-            current_name: str
-
-            def __enter__(self):
-                MockTemporaryDirectory.current_name = self.name
-                return super().__enter__()
-
-        with mock.patch(f"{STAGE_MANAGER}.put", new_callable=MockPut):
-            with mock.patch(
-                "snowflake.cli._plugins.stage.manager.TemporaryDirectory",
-                MockTemporaryDirectory,
-            ):
-                generator = StageManager().put_recursive(Path(local_path), "stageName")
-                list(generator)
+        with mock.patch(f"{STAGE_MANAGER}.put_files", side_effect=mock_put_files):
+            generator = StageManager().put_recursive(
+                Path(local_path), "stageName", **kwargs
+            )
+            results = list(generator)
 
-        return Path(MockTemporaryDirectory.current_name)
+        # uploads run concurrently, so the order of calls is not deterministic
+        calls.sort(key=lambda call: call["stage_path"])
+        return results
 
 
 NESTED_STRUCTURE = {
@@ -1254,44 +1937,46 @@ NESTED_STRUCTURE = {
 
 
 @pytest.mark.parametrize("pattern", ["", "**/*", "**"])
-def test_recursive_upload(temp_dir, pattern):
+@pytest.mark.parametrize("max_concurrent_puts", [1, 4])
+def test_recursive_upload(temp_dir, pattern, max_concurrent_puts):
     tester = RecursiveUploadTester(temp_dir)
     tester.prepare(structure=NESTED_STRUCTURE)
-    tmp_created_by_copy = tester.execute(local_path=temp_dir + "/" + pattern)
+    results = tester.execute(
+        local_path=temp_dir + "/" + pattern, max_concurrent_puts=max_concurrent_puts
+    )
 
     assert tester.calls == [
-        # Leaves
+        dict(local_files=["file4.foo"], stage_path="@stageName"),
         dict(
-            local_path=tmp_created_by_copy / "dir2/dir21/dir211/dir2111",
-            stage_path=StagePath.from_stage_str("@stageName/dir2/dir21/dir211/dir2111"),
+            local_files=["dir1/file1.py", "dir1/file1.txt"],
+            stage_path="@stageName/dir1",
         ),
         dict(
-            local_path=tmp_created_by_copy / "dir1/dir12/",
-            stage_path=StagePath.from_stage_str("@stageName/dir1/dir12"),
+            local_files=["dir1/dir12/file121.py", "dir1/dir12/file122.md"],
+            stage_path="@stageName/dir1/dir12",
         ),
+        dict(local_files=["dir2/file21"], stage_path="@stageName/dir2"),
         dict(
-            local_path=tmp_created_by_copy / "dir3/dir32/",
-            stage_path=StagePath.from_stage_str("@stageName/dir3/dir32"),
+            local_files=["dir2/dir21/dir211/dir2111/file21111.py"],
+            stage_path="@stageName/dir2/dir21/dir211/dir2111",
         ),
-        # Next level
-        dict(
-            local_path=tmp_created_by_copy / "dir1/",
-            stage_path=StagePath.from_stage_str("@stageName/dir1"),
-        ),
-        dict(
-            local_path=tmp_created_by_copy / "dir3/",
-            stage_path=StagePath.from_stage_str("@stageName/dir3"),
-        ),
-        # Next level
-        dict(
-            local_path=tmp_created_by_copy / "dir2",
-            stage_path=StagePath.from_stage_str("@stageName/dir2"),
-        ),
-        # Next level
-        dict(
-            local_path=tmp_created_by_copy,
-            stage_path=StagePath.from_stage_str("@stageName"),
+        dict(local_files=["dir3/file31"], stage_path="@stageName/dir3"),
+        dict(local_files=["dir3/dir32/file321"], stage_path="@stageName/dir3/dir32"),
+    ]
+    # results are streamed in the planned order, with paths relative to the root
+    assert [(str(r["source"]), r["target"]) for r in results] == [
+        ("file4.foo", "@stageName/file4.foo"),
+        ("dir1/file1.py", "@stageName/dir1/file1.py"),
+        ("dir1/file1.txt", "@stageName/dir1/file1.txt"),
+        ("dir1/dir12/file121.py", "@stageName/dir1/dir12/file121.py"),
+        ("dir1/dir12/file122.md", "@stageName/dir1/dir12/file122.md"),
+        ("dir2/file21", "@stageName/dir2/file21"),
+        (
+            "dir2/dir21/dir211/dir2111/file21111.py",
+            "@stageName/dir2/dir21/dir211/dir2111/file21111.py",
         ),
+        ("dir3/file31", "@stageName/dir3/file31"),
+        ("dir3/dir32/file321", "@stageName/dir3/dir32/file321"),
     ]
 
 
@@ -1308,22 +1993,14 @@ def test_recursive_upload_with_empty_dir(temp_dir):
 def test_recursive_upload_glob_file_pattern(temp_dir):
     tester = RecursiveUploadTester(temp_dir)
     tester.prepare(structure=NESTED_STRUCTURE)
-    tmp_created_by_copy = tester.execute(local_path=f"{temp_dir}/**/*.py")
+    tester.execute(local_path=f"{temp_dir}/**/*.py")
 
     assert tester.calls == [
-        # Leaves
-        dict(
-            local_path=tmp_created_by_copy / "dir2/dir21/dir211/dir2111/",
-            stage_path=StagePath.from_stage_str("@stageName/dir2/dir21/dir211/dir2111"),
-        ),
-        dict(
-            local_path=tmp_created_by_copy / "dir1/dir12/",
-            stage_path=StagePath.from_stage_str("@stageName/dir1/dir12"),
-        ),
-        # Next level
+        dict(local_files=["dir1/file1.py"], stage_path="@stageName/dir1"),
+        dict(local_files=["dir1/dir12/file121.py"], stage_path="@stageName/dir1/dir12"),
         dict(
-            local_path=tmp_created_by_copy / "dir1/",
-            stage_path=StagePath.from_stage_str("@stageName/dir1"),
+            local_files=["dir2/dir21/dir211/dir2111/file21111.py"],
+            stage_path="@stageName/dir2/dir21/dir211/dir2111",
         ),
     ]
 
@@ -1331,11 +2008,84 @@ def test_recursive_upload_glob_file_pattern(temp_dir):
 def test_recursive_upload_no_recursive_glob_pattern(temp_dir):
     tester = RecursiveUploadTester(temp_dir)
     tester.prepare(structure=NESTED_STRUCTURE)
-    tmp_created_by_copy = tester.execute(local_path=f"{temp_dir}/*.foo")
+    tester.execute(local_path=f"{temp_dir}/*.foo")
 
     assert tester.calls == [
-        dict(
-            local_path=tmp_created_by_copy,
-            stage_path=StagePath.from_stage_str("@stageName"),
-        ),
+        dict(local_files=["file4.foo"], stage_path="@stageName"),
     ]
+
+
+@mock.patch(f"{STAGE_MANAGER}.put")
+def test_recursive_upload_hidden_files(mock_put, temp_dir):
+    tester = RecursiveUploadTester(temp_dir)
+    tester.prepare(structure={"dir": {".env": "secret", "file.txt": "content"}})
+    mock_put.return_value.fetchall.return_value = [{"source": ".env", "target": ".env"}]
+    results = tester.execute(local_path=f"{temp_dir}/**/.env")
+
+    assert tester.calls == []
+    mock_put.assert_called_once_with(
+        local_path=Path(temp_dir) / "dir" / ".env",
+        stage_path="@stageName/dir",
+        parallel=4,
+        overwrite=False,
+        auto_compress=False,
+        use_dict_cursor=True,
+    )
+    assert [(str(r["source"]), r["target"]) for r in results] == [
+        ("dir/.env", "@stageName/dir/.env")
+    ]
+
+
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+def test_recursive_upload_switches_role_once(mock_execute, mock_cursor, temp_dir):
+    mock_execute.side_effect = [
+        mock_cursor([("old_role",)], []),
+        mock_cursor(["row"], []),
+        mock_cursor(["row"], []),
+    ]
+    tester = RecursiveUploadTester(temp_dir)
+    tester.prepare(structure=NESTED_STRUCTURE)
+    tester.execute(local_path=temp_dir, role="new_role")
+
+    assert len(tester.calls) == 7
+    assert mock_execute.mock_calls == [
+        mock.call("select current_role()"),
+        mock.call("use role new_role"),
+        mock.call("use role old_role"),
+    ]
+
+
+@pytest.mark.parametrize("max_concurrent_puts", ["0", "-1"])
+def test_copy_recursive_invalid_max_concurrent_puts(runner, max_concurrent_puts):
+    result = runner.invoke(
+        [
+            "stage",
+            "copy",
+            ".",
+            "@stageName",
+            "--recursive",
+            "--max-concurrent-puts",
+            max_concurrent_puts,
+        ]
+    )
+    assert result.exit_code == 2, result.output
+
+
+@mock.patch(f"{STAGE_MANAGER}.put_recursive")
+def test_copy_recursive_passes_max_concurrent_puts(
+    mock_put_recursive, runner, temp_dir
+):
+    mock_put_recursive.return_value = iter([])
+    result = runner.invoke(
+        [
+            "stage",
+            "copy",
+            temp_dir,
+            "@stageName",
+            "--recursive",
+            "--max-concurrent-puts",
+            "8",
+        ]
+    )
+    assert result.exit_code == 0, result.output
+    assert mock_put_recursive.call_args.kwargs["max_concurrent_puts"] == 8
@@ -41,12 +41,13 @@ _KNOWN_SIG_GLOBAL_PARAMETERS_WITH_CONNECTION = [
     "diag_log_path",
     "diag_allowlist_path",
     "format",
+    "output_file",
     "verbose",
     "debug",
     "silent",
 ]
 
-_KNOWN_SIG_GLOBAL_PARAMETERS = ["format", "verbose", "debug", "silent"]
+_KNOWN_SIG_GLOBAL_PARAMETERS = ["format", "output_file", "verbose", "debug", "silent"]
 
 
 def _extract_arguments(func):
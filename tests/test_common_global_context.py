@@ -77,6 +77,7 @@ def test_connection_caching(mock_connect):
     mock_connect.assert_has_calls(
         [
             call(
+                use_session_cache=True,
                 temporary_connection=False,
                 enable_diag=False,
                 connection_name="default",
@@ -84,6 +85,7 @@ def test_connection_caching(mock_connect):
                 warehouse="newValue2",
             ),
             call(
+                use_session_cache=True,
                 temporary_connection=False,
                 enable_diag=False,
                 connection_name="default",
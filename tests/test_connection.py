@@ -500,6 +500,7 @@ def test_connection_test(mock_connect, mock_om, runner):
     assert "password" not in result.output
 
     mock_connect.assert_called_with(
+        use_session_cache=True,
         temporary_connection=False,
         enable_diag=False,
         diag_log_path=Path("/tmp"),
@@ -1041,6 +1042,7 @@ def test_connection_test_diag_report(mock_connect, mock_om, runner):
     assert "Host" in result.output
     assert "Diag Report" in result.output
     mock_connect.assert_called_once_with(
+        use_session_cache=True,
         temporary_connection=False,
         enable_diag=True,
         diag_log_path=Path("/tmp"),
@@ -1359,3 +1361,38 @@ def test_connection_add_no_interactive(mock_add, runner):
             _other_settings={},
         ),
     )
+
+
+def test_logout_removes_cached_sessions(runner, temp_dir):
+    from snowflake.cli._app.session_cache import save_session
+    from snowflake.cli.api.secure_path import SecurePath
+
+    cache_dir = SecurePath(temp_dir) / ".session_cache"
+    connection = mock.MagicMock()
+    connection.rest.token = "session"
+    connection.rest.master_token = "master"
+    connection.rest.master_validity_in_seconds = 3600
+    with mock.patch(
+        "snowflake.cli._app.session_cache.session_cache_dir", return_value=cache_dir
+    ), mock.patch("snowflake.connector.connect") as mock_connect:
+        save_session("conn1", {"role": "role1", "account": "acc"}, connection, {})
+        save_session("conn1", {"role": "role2", "account": "acc"}, connection, {})
+        save_session("conn2", {}, connection, {})
+
+        result = runner.invoke(["connection", "logout", "conn1"])
+        assert result.exit_code == 0, result.output
+        assert "Removed 2 cached session(s) of connection conn1." in result.output
+        assert len(list(cache_dir.path.glob("*.json"))) == 1
+        # the server sessions are closed instead of being kept alive until they expire
+        mock_connect.assert_called_with(
+            session_token="session",
+            master_token="master",
+            server_session_keep_alive=False,
+            account="acc",
+        )
+        assert mock_connect.return_value.close.call_count == 2
+
+        result = runner.invoke(["connection", "logout"])
+        assert result.exit_code == 0, result.output
+        assert "Removed 1 cached session(s) of all connections." in result.output
+        assert not list(cache_dir.path.glob("*.json"))
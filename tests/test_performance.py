@@ -13,12 +13,17 @@
 # limitations under the License.
 
 import subprocess
+import tracemalloc
+from pathlib import PurePosixPath
 from timeit import default_timer as timer
 
 import pytest
+from snowflake.cli._plugins.stage.diff import DiffResult
 
 SAMPLE_AMOUNT = 20
 EXECUTION_TIME_THRESHOLD = 2  # seconds
+DIFF_ENTRIES = 500_000
+DIFF_RESULT_MEMORY_LIMIT = 64 * 2**20  # bytes
 
 
 @pytest.mark.performance
@@ -32,3 +37,35 @@ def test_snow_help_performance():
 
     results.sort()
     assert results[int(SAMPLE_AMOUNT * 0.9)] <= EXECUTION_TIME_THRESHOLD
+
+
+def _peak_memory(fn) -> int:
+    tracemalloc.start()
+    try:
+        result = fn()  # noqa: F841, kept alive until the peak is measured
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.performance
+def test_diff_result_memory():
+    half = DIFF_ENTRIES // 2
+
+    def paths(start: int, stop: int):
+        # built inside the measured functions, so that their storage is counted
+        return (f"dir{i % 1000}/subdir/file{i}.txt" for i in range(start, stop))
+
+    def path_lists():
+        return (
+            [PurePosixPath(p) for p in paths(0, half)],
+            [PurePosixPath(p) for p in paths(half, DIFF_ENTRIES)],
+        )
+
+    def diff_result():
+        return DiffResult(identical=paths(0, half), different=paths(half, DIFF_ENTRIES))
+
+    path_lists_memory = _peak_memory(path_lists)
+    diff_result_memory = _peak_memory(diff_result)
+    assert diff_result_memory < DIFF_RESULT_MEMORY_LIMIT
+    assert diff_result_memory * 2 < path_lists_memory
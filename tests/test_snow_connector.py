@@ -12,12 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import os
+import time
 from unittest import mock
 
 import pytest
 from snowflake.cli._app.secret import SecretType
 
+from tests_common import IS_WINDOWS
+
 
 # Used as a solution to syrupy having some problems with comparing multilines string
 class CustomStr(str):
@@ -222,3 +226,278 @@ def test_returns_nice_error_in_case_of_missing_master_token(runner):
         "When using a session token, you must provide the corresponding master token"
         in result.output
     )
+
+
+SESSION_CACHE_FLAG = (
+    "snowflake.cli.api.feature_flags.FeatureFlag.ENABLE_SESSION_TOKEN_CACHE.is_enabled"
+)
+
+
+@pytest.fixture
+def session_cache_dir(temp_dir):
+    from snowflake.cli.api.secure_path import SecurePath
+
+    cache_dir = SecurePath(temp_dir) / ".session_cache"
+    with mock.patch(
+        "snowflake.cli._app.session_cache.session_cache_dir", return_value=cache_dir
+    ):
+        yield cache_dir.path
+
+
+def _mock_connection(
+    session_token="session",
+    master_token="master",
+    secondary_roles='{"roles":"","value":""}',
+    parameters=(),
+    variables=(),
+    **context,
+):
+    connection = mock.MagicMock()
+    connection.rest.token = session_token
+    connection.rest.master_token = master_token
+    connection.rest.master_validity_in_seconds = 3600
+    for key in ("role", "warehouse", "database", "schema"):
+        setattr(connection, key, context.get(key, key.upper()))
+    results = {
+        "select current_secondary_roles() as secondary_roles": [
+            {"SECONDARY_ROLES": secondary_roles}
+        ],
+        "show parameters in session": [
+            {"key": key, "value": value, "type": type_, "level": "SESSION"}
+            for key, value, type_ in parameters
+        ],
+        "show variables": [{"name": name} for name in variables],
+    }
+    connection.cursor.return_value.execute.side_effect = (
+        lambda query, **kwargs: mock.Mock(fetchall=lambda: results.get(query, []))
+    )
+    return connection
+
+
+@mock.patch(SESSION_CACHE_FLAG, return_value=True)
+@mock.patch("snowflake.connector.connect")
+@mock.patch("snowflake.cli._app.snow_connector.command_info")
+def test_session_is_cached_and_resumed(
+    mock_command_info, mock_connect, _, test_snowcli_config, session_cache_dir
+):
+    from snowflake.cli._app.snow_connector import connect_to_snowflake
+    from snowflake.cli.api.config import config_init
+
+    config_init(test_snowcli_config)
+    mock_command_info.return_value = "SNOWCLI.SQL"
+    mock_connect.return_value = _mock_connection()
+
+    connect_to_snowflake(connection_name="default", use_session_cache=True)
+    assert mock_connect.call_args.kwargs["password"] == "dummy_password"
+    assert mock_connect.call_args.kwargs["server_session_keep_alive"] is True
+    (session_file,) = session_cache_dir.glob("*.json")
+    if not IS_WINDOWS:
+        assert session_file.stat().st_mode & 0o777 == 0o600
+
+    connection = connect_to_snowflake(connection_name="default", use_session_cache=True)
+    mock_connect.assert_called_with(
+        application="SNOWCLI.SQL",
+        database="db_for_test",
+        schema="test_public",
+        role="test_role",
+        warehouse="xs",
+        session_token="session",
+        master_token="master",
+        server_session_keep_alive=True,
+        application_name="snowcli",
+    )
+    assert connection.cursor().execute.mock_calls[-3:] == [
+        mock.call("show parameters in session"),
+        mock.call("show variables"),
+        mock.call(
+            "use role test_role;\n"
+            "use secondary roles none;\n"
+            "use warehouse xs;\n"
+            "use database db_for_test;\n"
+            "use schema test_public",
+            num_statements=5,
+        ),
+    ]
+
+
+@mock.patch(SESSION_CACHE_FLAG, return_value=True)
+@mock.patch("snowflake.connector.connect")
+@mock.patch("snowflake.cli._app.snow_connector.command_info")
+def test_resumed_session_does_not_keep_state_of_previous_invocations(
+    _command_info, mock_connect, _, test_snowcli_config, session_cache_dir
+):
+    from snowflake.cli._app.snow_connector import connect_to_snowflake
+    from snowflake.cli.api.config import config_init
+
+    config_init(test_snowcli_config)
+    mock_connect.return_value = _mock_connection(
+        secondary_roles='{"roles":"ANALYST","value":""}',
+        parameters=[("TIMEZONE", "UTC", "STRING")],
+    )
+    connect_to_snowflake(connection_name="test_connections", use_session_cache=True)
+
+    # the previous invocation changed parameters, set variables and used other roles
+    resumed = _mock_connection(
+        parameters=[
+            ("TIMEZONE", "Europe/Warsaw", "STRING"),
+            ("QUERY_TAG", "tag", "STRING"),
+            ("AUTOCOMMIT", "false", "BOOLEAN"),
+        ],
+        variables=["X", "lower"],
+        role="OTHER_ROLE",
+        warehouse="OTHER_WH",
+    )
+    mock_connect.return_value = resumed
+    connection = connect_to_snowflake(
+        connection_name="test_connections", use_session_cache=True
+    )
+
+    assert connection is resumed
+    assert "session_token" in mock_connect.call_args.kwargs
+    assert resumed.cursor().execute.mock_calls[-1] == mock.call(
+        "alter session unset QUERY_TAG, AUTOCOMMIT;\n"
+        "alter session set TIMEZONE = 'UTC';\n"
+        'unset ("X", "lower");\n'
+        'use role "ROLE";\n'
+        'use secondary roles "ANALYST";\n'
+        'use warehouse "WAREHOUSE";\n'
+        'use database "DATABASE";\n'
+        'use schema "SCHEMA"',
+        num_statements=8,
+    )
+
+
+@mock.patch(SESSION_CACHE_FLAG, return_value=True)
+@mock.patch("snowflake.connector.connect")
+@mock.patch("snowflake.cli._app.snow_connector.command_info")
+def test_session_which_cannot_be_reset_is_closed(
+    _command_info, mock_connect, _, test_snowcli_config, session_cache_dir
+):
+    from snowflake.cli._app.snow_connector import connect_to_snowflake
+    from snowflake.cli.api.config import config_init
+
+    config_init(test_snowcli_config)
+    # a session created without a warehouse cannot stop using one
+    mock_connect.return_value = _mock_connection(warehouse=None)
+    connect_to_snowflake(connection_name="test_connections", use_session_cache=True)
+
+    resumed = _mock_connection(warehouse="OTHER_WH")
+    mock_connect.side_effect = [resumed, resumed, _mock_connection("new", "new")]
+    connect_to_snowflake(connection_name="test_connections", use_session_cache=True)
+
+    assert mock_connect.call_args_list[2].kwargs["server_session_keep_alive"] is False
+    assert mock_connect.call_args_list[2].kwargs["session_token"] == "session"
+    assert "session_token" not in mock_connect.call_args_list[3].kwargs
+    assert resumed.close.call_count == 2
+
+
+@mock.patch(SESSION_CACHE_FLAG, return_value=True)
+@mock.patch("snowflake.connector.connect")
+@mock.patch("snowflake.cli._app.snow_connector.command_info")
+def test_session_is_not_shared_between_connection_parameters(
+    _command_info, mock_connect, _, test_snowcli_config, session_cache_dir
+):
+    from snowflake.cli._app.snow_connector import connect_to_snowflake
+    from snowflake.cli.api.config import config_init
+
+    config_init(test_snowcli_config)
+    mock_connect.return_value = _mock_connection()
+
+    connect_to_snowflake(connection_name="default", use_session_cache=True)
+    connect_to_snowflake(
+        connection_name="default", use_session_cache=True, role="other_role"
+    )
+
+    assert "session_token" not in mock_connect.call_args.kwargs
+    assert len(list(session_cache_dir.glob("*.json"))) == 2
+
+
+@mock.patch(SESSION_CACHE_FLAG, return_value=True)
+@mock.patch("snowflake.connector.connect")
+@mock.patch("snowflake.cli._app.snow_connector.command_info")
+def test_expired_session_is_not_resumed(
+    _command_info, mock_connect, _, test_snowcli_config, session_cache_dir
+):
+    from snowflake.cli._app.snow_connector import connect_to_snowflake
+    from snowflake.cli.api.config import config_init
+
+    config_init(test_snowcli_config)
+    mock_connect.return_value = _mock_connection()
+    connect_to_snowflake(connection_name="default", use_session_cache=True)
+
+    with mock.patch(
+        "snowflake.cli._app.session_cache.time.time", return_value=time.time() + 3600
+    ):
+        connect_to_snowflake(connection_name="default", use_session_cache=True)
+
+    assert mock_connect.call_count == 2
+    assert "session_token" not in mock_connect.call_args.kwargs
+
+
+@mock.patch(SESSION_CACHE_FLAG, return_value=True)
+@mock.patch("snowflake.connector.connect")
+@mock.patch("snowflake.cli._app.snow_connector.command_info")
+def test_invalid_cached_session_falls_back_to_login(
+    _command_info, mock_connect, _, test_snowcli_config, session_cache_dir
+):
+    from snowflake.cli._app.session_cache import load_session
+    from snowflake.cli._app.snow_connector import connect_to_snowflake
+    from snowflake.cli.api.config import config_init
+    from snowflake.connector.errors import ProgrammingError
+
+    config_init(test_snowcli_config)
+    mock_connect.return_value = _mock_connection()
+    connect_to_snowflake(connection_name="default", use_session_cache=True)
+
+    mock_connect.side_effect = [
+        ProgrammingError("Session and master tokens invalid"),
+        _mock_connection("new-session", "new-master"),
+    ]
+    connect_to_snowflake(connection_name="default", use_session_cache=True)
+
+    assert "session_token" in mock_connect.call_args_list[1].kwargs
+    assert "password" in mock_connect.call_args_list[2].kwargs
+    (session_file,) = session_cache_dir.glob("*.json")
+    assert json.loads(session_file.read_text())["session_token"] == "new-session"
+    assert load_session("default", {}) is None
+
+
+@mock.patch(SESSION_CACHE_FLAG, return_value=False)
+@mock.patch("snowflake.connector.connect")
+@mock.patch("snowflake.cli._app.snow_connector.command_info")
+def test_session_is_not_cached_by_default(
+    _command_info, mock_connect, _, test_snowcli_config, session_cache_dir
+):
+    from snowflake.cli._app.snow_connector import connect_to_snowflake
+    from snowflake.cli.api.config import config_init
+
+    config_init(test_snowcli_config)
+    connect_to_snowflake(connection_name="default", use_session_cache=True)
+
+    assert "server_session_keep_alive" not in mock_connect.call_args.kwargs
+    assert not session_cache_dir.exists()
+
+
+@mock.patch(SESSION_CACHE_FLAG, return_value=True)
+@mock.patch("snowflake.connector.connect")
+@mock.patch("snowflake.cli._app.snow_connector.command_info")
+def test_secondary_connections_do_not_share_cached_session(
+    _command_info, mock_connect, _, test_snowcli_config, session_cache_dir
+):
+    from snowflake.cli._app.snow_connector import connect_to_snowflake
+    from snowflake.cli.api.config import config_init
+    from snowflake.cli.api.connections import ConnectionContext
+
+    config_init(test_snowcli_config)
+    mock_connect.return_value = _mock_connection()
+    connect_to_snowflake(connection_name="default", use_session_cache=True)
+    (session_file,) = session_cache_dir.glob("*.json")
+    cached = session_file.read_text()
+
+    # e.g. connections of the pool executing files in parallel
+    mock_connect.return_value = _mock_connection("other-session", "other-master")
+    ConnectionContext(connection_name="default").build_connection()
+
+    assert "session_token" not in mock_connect.call_args.kwargs
+    assert "server_session_keep_alive" not in mock_connect.call_args.kwargs
+    assert session_file.read_text() == cached
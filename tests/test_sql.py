@@ -11,11 +11,17 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import io
+import json
+import re
+import threading
 from pathlib import Path
 from tempfile import NamedTemporaryFile, TemporaryDirectory
 from unittest import mock
 
 import pytest
+from click import ClickException
+from snowflake.cli._plugins.sql.manager import SqlManager
 from snowflake.cli._plugins.sql.snowsql_templating import transpile_snowsql_templates
 from snowflake.cli.api.constants import ObjectType
 from snowflake.cli.api.exceptions import (
@@ -25,7 +31,8 @@ from snowflake.cli.api.exceptions import (
 from snowflake.cli.api.identifiers import FQN
 from snowflake.cli.api.project.util import identifier_to_show_like_pattern
 from snowflake.cli.api.sql_execution import SqlExecutionMixin, VerboseCursor
-from snowflake.connector.cursor import DictCursor
+from snowflake.connector import ProgrammingError
+from snowflake.connector.cursor import DictCursor, SnowflakeCursor
 
 from tests.testing_utils.result_assertions import assert_that_result_is_usage_error
 
@@ -40,6 +47,28 @@ def test_sql_execute_query(mock_execute, runner, mock_cursor):
     mock_execute.assert_called_once_with("query", cursor_class=VerboseCursor)
 
 
+@pytest.mark.parametrize("arrow_enabled", [True, False])
+@mock.patch("snowflake.cli._plugins.sql.manager.SqlExecutionMixin._execute_string")
+def test_sql_reads_arrow_batches_only_if_enabled(
+    mock_execute, runner, mock_cursor, arrow_enabled
+):
+    cursor = mock_cursor([("a",)], ["name"])
+    cursor.fetch_arrow_batches = mock.Mock(
+        return_value=iter([mock.Mock(to_pylist=lambda: [{"name": "b"}])])
+    )
+    mock_execute.return_value = iter([cursor])
+
+    with mock.patch(
+        "snowflake.cli.api.feature_flags.FeatureFlag.ENABLE_ARROW_QUERY_RESULTS.is_enabled",
+        return_value=arrow_enabled,
+    ):
+        result = runner.invoke(["sql", "-q", "query", "--format", "json"])
+
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output) == [{"name": "b" if arrow_enabled else "a"}]
+    assert cursor.fetch_arrow_batches.called == arrow_enabled
+
+
 @mock.patch("snowflake.cli._plugins.sql.manager.SqlExecutionMixin._execute_string")
 def test_sql_execute_file(mock_execute, runner, mock_cursor, named_temporary_file):
     mock_execute.return_value = (mock_cursor(["row"], []) for _ in range(1))
@@ -152,6 +181,7 @@ def test_sql_overrides_connection_configuration(mock_conn, runner, mock_cursor):
 
     assert result.exit_code == 0, result.output
     mock_conn.assert_called_once_with(
+        use_session_cache=True,
         temporary_connection=False,
         enable_diag=False,
         diag_log_path=Path("/tmp"),
@@ -434,8 +464,8 @@ def test_uses_variables_from_cli_are_added_outside_context(
 @pytest.mark.parametrize(
     "option,expected",
     [
-        ("--retain-comments", "SELECT 42;\n-- Commented line\n    SELECT 1;\n"),
-        ("", "SELECT 42;\nSELECT 1;\n"),
+        ("--retain-comments", ["SELECT 42;", "-- Commented line\n    SELECT 1;"]),
+        ("", ["SELECT 42;", "SELECT 1;"]),
     ],
 )
 @mock.patch("snowflake.cli._plugins.sql.manager.SqlExecutionMixin._execute_string")
@@ -462,7 +492,10 @@ def test_comments_are_handled_correctly_from_file(
         result = runner.invoke(arguments)
 
     assert result.exit_code == 0
-    mock_execute.assert_called_once_with(expected, cursor_class=VerboseCursor)
+    # statements from files are executed one by one, as soon as they are read
+    assert mock_execute.mock_calls == [
+        mock.call(statement, cursor_class=VerboseCursor) for statement in expected
+    ]
 
 
 @pytest.mark.parametrize(
@@ -495,3 +528,618 @@ def test_comments_are_handled_correctly_from_query(
 
     assert result.exit_code == 0
     mock_execute.assert_called_once_with(expected, cursor_class=VerboseCursor)
+
+
+class _PipelinedConnection:
+    """Fake connection completing each asynchronous statement after two status polls."""
+
+    def __init__(self, failing=()):
+        self.events = []
+        self.running = {}
+        self.max_running = 0
+        self._failing = failing
+
+    def cursor(self):
+        cursor = mock.Mock()
+
+        def execute_async(statement):
+            cursor.statement = cursor.sfqid = statement
+            self.running[statement] = 2
+            self.max_running = max(self.max_running, len(self.running))
+            self.events.append(f"start {statement}")
+
+        def execute(statement):
+            assert not self.running
+            cursor.statement = statement
+            self.events.append(f"execute {statement}")
+
+        def get_results_from_sfqid(sfqid):
+            assert self.running.pop(sfqid) == 0
+            self.events.append(f"finish {sfqid}")
+            if sfqid in self._failing:
+                raise ProgrammingError(f"Error in {sfqid}")
+
+        cursor.execute_async.side_effect = execute_async
+        cursor.execute.side_effect = execute
+        cursor.get_results_from_sfqid.side_effect = get_results_from_sfqid
+        return cursor
+
+    def get_query_status(self, sfqid):
+        self.running[sfqid] -= 1
+        return self.running[sfqid]
+
+    @staticmethod
+    def is_still_running(status):
+        return status > 0
+
+
+def test_pipelined_statements_yields_every_statement_of_a_part():
+    parts = ["select 1; use role r; select 2;", "-- !barrier\n", "select 3;"]
+
+    assert list(SqlManager._pipelined_statements(parts)) == [  # noqa: SLF001
+        ("select 1;", False),
+        ("use role r;", True),
+        ("select 2;", False),
+        ("select 3;", True),
+    ]
+
+
+def test_split_pipelined_statements():
+    query = """select 1; -- trailing comment
+    -- !barrier
+    select 2;
+    USE ROLE r;
+    alter session set query_tag = 'x';
+    -- just a comment
+    select 3;
+    -- !barrier
+    """
+
+    assert SqlManager._split_pipelined_statements(query) == [  # noqa: SLF001
+        ("select 1;", False),
+        ("select 2;", True),
+        ("USE ROLE r;", True),
+        ("alter session set query_tag = 'x';", True),
+        ("select 3;", False),
+    ]
+
+
+@mock.patch("snowflake.cli._plugins.sql.manager.ASYNC_POLL_INTERVAL_SECONDS", 0)
+@mock.patch(
+    "snowflake.cli._plugins.sql.manager.SqlManager._conn",
+    new_callable=mock.PropertyMock,
+)
+def test_execute_async_batch(mock_conn):
+    connection = _PipelinedConnection()
+    mock_conn.return_value = connection
+    query = (
+        "select 1; select 2; select 3;\n-- !barrier\nselect 4; use role r; select 5;"
+    )
+
+    single_statement, cursors = SqlManager().execute(query, None, False, async_batch=2)
+
+    assert not single_statement
+    assert [c.statement for c in cursors] == [
+        "select 1;",
+        "select 2;",
+        "select 3;",
+        "select 4;",
+        "use role r;",
+        "select 5;",
+    ]
+    assert connection.events == [
+        "start select 1;",
+        "start select 2;",
+        "finish select 1;",
+        "start select 3;",
+        "finish select 2;",
+        "finish select 3;",
+        "execute select 4;",
+        "execute use role r;",
+        "start select 5;",
+        "finish select 5;",
+    ]
+    assert connection.max_running == 2
+
+
+@mock.patch("snowflake.cli._plugins.sql.manager.ASYNC_POLL_INTERVAL_SECONDS", 0)
+@mock.patch(
+    "snowflake.cli._plugins.sql.manager.SqlManager._conn",
+    new_callable=mock.PropertyMock,
+)
+def test_execute_async_batch_failure_awaits_running_statements(mock_conn):
+    connection = _PipelinedConnection(failing=["select 2;"])
+    mock_conn.return_value = connection
+    query = "select 1; select 2; select 3; select 4; select 5;"
+
+    _, cursors = SqlManager().execute(query, None, False, async_batch=3)
+
+    with pytest.raises(ProgrammingError):
+        list(cursors)
+    assert connection.events == [
+        "start select 1;",
+        "start select 2;",
+        "start select 3;",
+        "finish select 1;",
+        "start select 4;",
+        "finish select 2;",
+        "finish select 3;",
+        "finish select 4;",
+    ]
+
+
+@mock.patch("snowflake.cli._plugins.sql.manager.SqlManager._execute_pipelined")
+def test_sql_async_batch_option(mock_pipelined, runner, mock_cursor):
+    mock_pipelined.return_value = iter(
+        [mock_cursor(["row"], []), mock_cursor(["row"], [])]
+    )
+
+    result = runner.invoke(["sql", "-q", "select 1; select 2;", "--async-batch", "4"])
+
+    assert result.exit_code == 0, result.output
+    mock_pipelined.assert_called_once_with(
+        [("select 1;", False), ("select 2;", False)], 4, True
+    )
+
+
+@mock.patch("snowflake.cli.api.connections.ConnectionContext.build_connection")
+@mock.patch(
+    "snowflake.cli._plugins.sql.manager.SqlExecutionMixin._execute_string",
+    autospec=True,
+)
+def test_execute_parallel_files(mock_execute, mock_build, mock_cursor, temp_dir):
+    files = []
+    for name in ["a", "b", "c"]:
+        file = Path(temp_dir) / f"{name}.sql"
+        file.write_text(f"select '{name}';")
+        files.append(file)
+    c_executed = threading.Event()
+    used_connections = set()
+
+    def execute_string(manager, sql_text, cursor_class):
+        assert cursor_class == SnowflakeCursor
+        used_connections.add(manager._connection)  # noqa: SLF001
+        if "'a'" in sql_text:
+            # the first file completes last
+            assert c_executed.wait(timeout=10)
+        if "'b'" in sql_text:
+            raise ProgrammingError("b failed")
+        if "'c'" in sql_text:
+            c_executed.set()
+        return iter([mock_cursor([(sql_text,)], ["query"])])
+
+    mock_execute.side_effect = execute_string
+    mock_build.side_effect = lambda: mock.Mock()
+    main_connection = mock.Mock()
+
+    _, cursors = SqlManager(main_connection).execute(
+        None, files, False, parallel_files=3
+    )
+    results = []
+    with pytest.raises(ClickException) as err:
+        for cursor in cursors:
+            results.append(cursor.fetchone()[0])
+
+    assert results == ["select 'a';", "select 'c';"]
+    assert (
+        err.value.message == f"Execution of 1 of 3 files failed:\n{files[1]}: b failed"
+    )
+    # connections are reused once released, so at most one per file is opened
+    assert 2 <= len(used_connections) <= 3
+    assert mock_build.call_count == len(used_connections) - 1
+    assert main_connection in used_connections
+    main_connection.close.assert_not_called()
+    for connection in used_connections - {main_connection}:
+        connection.close.assert_called_once()
+
+
+@mock.patch("snowflake.cli._plugins.sql.manager.SqlExecutionMixin._execute_string")
+def test_execute_stdin_streams_statements(mock_execute, mock_cursor):
+    text = "".join(f"select <% value %> + {i};\n" for i in range(4))
+    executed = []
+
+    def execute_string(statement, cursor_class):
+        executed.append(statement)
+        return iter([mock_cursor([(statement,)], ["statement"])])
+
+    mock_execute.side_effect = execute_string
+    with mock.patch("sys.stdin", io.StringIO(text)) as stdin:
+        single_statement, cursors = SqlManager().execute(
+            None, None, True, data={"value": 1}
+        )
+        cursors = iter(cursors)
+        first_statement = next(cursors).fetchone()[0]
+        # statements are executed one by one, as they are consumed
+        assert executed == ["select 1 + 0;"]
+        # without reading the standard input up to its end first
+        assert stdin.tell() < len(text)
+        statements = [first_statement] + [cursor.fetchone()[0] for cursor in cursors]
+
+    assert not single_statement
+    assert statements == [f"select 1 + {i};" for i in range(4)]
+
+
+@pytest.mark.parametrize(
+    "text, error",
+    [
+        (
+            "select 1;\nselect 2;\nselect <% unknown %>;",
+            "SQL template rendering error: 'unknown' is undefined",
+        ),
+        (
+            "select 1;\nselect <% aaa %>;\nselect &{ aaa };",
+            "The SQL query mixes &{ ... } syntax and <% ... %> syntax.",
+        ),
+    ],
+)
+@pytest.mark.parametrize("use_file", [True, False])
+@mock.patch("snowflake.cli._plugins.sql.commands.SqlManager._execute_string")
+def test_template_errors_are_reported_before_execution(
+    mock_execute, runner, named_temporary_file, text, error, use_file
+):
+    if use_file:
+        with named_temporary_file() as tmp_file:
+            tmp_file.write_text(text)
+            result = runner.invoke(["sql", "-f", tmp_file, "-D", "aaa=foo"])
+    else:
+        result = runner.invoke(["sql", "-i", "-D", "aaa=foo"], input=text)
+
+    assert result.exit_code == 1
+    assert error in result.output.replace("\n", " ")
+    if use_file:
+        mock_execute.assert_not_called()
+    else:
+        # statements from the standard input are executed as soon as they are read
+        assert mock_execute.call_args_list == [
+            mock.call("select 1;", cursor_class=VerboseCursor),
+            mock.call(mock.ANY, cursor_class=VerboseCursor),
+        ]
+
+
+@mock.patch("snowflake.cli._plugins.sql.manager.snowflake_sql_jinja_render_parts")
+@mock.patch("snowflake.cli._plugins.sql.commands.SqlManager._execute_string")
+def test_file_templates_are_rendered_once(
+    mock_execute, mock_render, runner, named_temporary_file
+):
+    mock_render.side_effect = lambda parts, data: list(parts)
+    with named_temporary_file() as tmp_file:
+        tmp_file.write_text("select <% aaa %>;\nselect 2;")
+        result = runner.invoke(["sql", "-f", tmp_file, "-D", "aaa=foo"])
+
+    assert result.exit_code == 0, result.output
+    mock_render.assert_called_once()
+
+
+@mock.patch("snowflake.cli._plugins.sql.commands.SqlManager._execute_string")
+def test_template_errors_of_all_files_are_reported_before_execution(
+    mock_execute, runner, temp_dir
+):
+    first_file = Path(temp_dir) / "first.sql"
+    first_file.write_text("select 1;")
+    second_file = Path(temp_dir) / "second.sql"
+    second_file.write_text("select <% unknown %>;")
+
+    result = runner.invoke(["sql", "-f", first_file, "-f", second_file])
+
+    assert result.exit_code == 1
+    assert "'unknown' is undefined" in result.output
+    mock_execute.assert_not_called()
+
+
+@mock.patch("snowflake.cli._plugins.sql.commands.SqlManager._execute_string")
+def test_old_template_syntax_warning_is_shown_once_per_file(
+    mock_execute, runner, named_temporary_file
+):
+    with named_temporary_file() as tmp_file:
+        tmp_file.write_text("select &{ aaa };\nselect &{ aaa };")
+        result = runner.invoke(["sql", "-f", tmp_file, "-D", "aaa=foo"])
+
+    assert result.exit_code == 0, result.output
+    assert result.output.count("syntax is deprecated") == 1
+    assert mock_execute.call_args_list == [
+        mock.call("select foo;", cursor_class=VerboseCursor),
+        mock.call("select foo;", cursor_class=VerboseCursor),
+    ]
+
+
+@mock.patch("snowflake.cli._plugins.sql.commands.SqlManager._execute_string")
+def test_mixed_template_syntax_across_statements_error(mock_execute, runner):
+    result = runner.invoke(
+        ["sql", "-i", "-D", "aaa=foo", "-D", "bbb=bar"],
+        input="select <% aaa %>;\nselect &{ bbb };",
+    )
+    assert result.exit_code == 1
+    assert "The SQL query mixes &{ ... } syntax and <% ... %> syntax." in result.output
+
+
+class _BindConnection:
+    """Connection recording the arguments of every executemany."""
+
+    is_pyformat = False
+
+    def __init__(self):
+        self.executed = []
+        self.rowcount = 2
+
+    def cursor(self):
+        connection = self
+
+        class _Cursor:
+            rowcount = connection.rowcount
+
+            def executemany(self, statement, rows, **kwargs):
+                connection.executed.append((statement, rows, kwargs))
+
+        return _Cursor()
+
+
+@mock.patch(
+    "snowflake.cli._plugins.sql.manager.SqlManager._conn",
+    new_callable=mock.PropertyMock,
+)
+def test_sql_bind_file_csv(mock_conn, runner, temp_dir):
+    connection = _BindConnection()
+    mock_conn.return_value = connection
+    bind_file = Path(temp_dir) / "rows.csv"
+    bind_file.write_text('1,a\n2,b\n3,"c,d"\n4,e\n5,f\n')
+
+    result = runner.invoke(
+        [
+            "sql",
+            "-q",
+            "insert into t values (?, ?)",
+            "--bind-file",
+            str(bind_file),
+            "--bind-batch-size",
+            "2",
+            "--format",
+            "json",
+        ]
+    )
+
+    assert result.exit_code == 0, result.output
+    single_request = {"num_statements": 1}
+    assert connection.executed == [
+        ("insert into t values (?, ?)", [["1", "a"], ["2", "b"]], single_request),
+        ("insert into t values (?, ?)", [["3", "c,d"], ["4", "e"]], single_request),
+        ("insert into t values (?, ?)", [["5", "f"]], single_request),
+    ]
+    assert [row["rows"] for row in json.loads(result.output)] == [2, 2, 1]
+
+
+@mock.patch(
+    "snowflake.cli._plugins.sql.manager.SqlManager._conn",
+    new_callable=mock.PropertyMock,
+)
+def test_sql_bind_file_csv_header_and_nulls(mock_conn, runner, temp_dir):
+    connection = _BindConnection()
+    mock_conn.return_value = connection
+    bind_file = Path(temp_dir) / "rows.csv"
+    bind_file.write_text('id,name\n1,\n2,\\N\n3,""\n4,N\n')
+
+    result = runner.invoke(
+        [
+            "sql",
+            "-q",
+            "insert into t values (?, ?)",
+            "--bind-file",
+            str(bind_file),
+            "--bind-file-header",
+        ]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert connection.executed == [
+        (
+            "insert into t values (?, ?)",
+            [["1", None], ["2", None], ["3", None], ["4", "N"]],
+            {"num_statements": 1},
+        ),
+    ]
+
+
+@mock.patch(
+    "snowflake.cli._plugins.sql.manager.SqlManager._conn",
+    new_callable=mock.PropertyMock,
+)
+def test_sql_bind_file_jsonl(mock_conn, runner, temp_dir):
+    connection = _BindConnection()
+    mock_conn.return_value = connection
+    bind_file = Path(temp_dir) / "rows.jsonl"
+    bind_file.write_text('[1, "a"]\n\n{"id": 2, "name": null}\n')
+
+    result = runner.invoke(
+        [
+            "sql",
+            "-q",
+            "update t set name = ? where id = ?;",
+            "--bind-file",
+            str(bind_file),
+        ]
+    )
+
+    assert result.exit_code == 0, result.output
+    # executemany sends the statements of a batch as a single multi-statement request
+    assert connection.executed == [
+        (
+            "update t set name = ? where id = ?",
+            [[1, "a"], [2, None]],
+            {"num_statements": 1},
+        )
+    ]
+
+
+@mock.patch("snowflake.cli._app.snow_connector.connect_to_snowflake")
+def test_sql_bind_file_connection_binds_on_server_side(mock_connect, runner, temp_dir):
+    mock_connect.return_value.is_pyformat = False
+    bind_file = Path(temp_dir) / "rows.csv"
+    bind_file.write_text("1\n")
+
+    result = runner.invoke(
+        ["sql", "-q", "insert into t values (?)", "--bind-file", str(bind_file)]
+    )
+
+    assert result.exit_code == 0, result.output
+    # the connection of the command is opened binding parameters on the server side
+    mock_connect.assert_called_once_with(
+        use_session_cache=True,
+        connection_name="default",
+        enable_diag=False,
+        diag_log_path=mock.ANY,
+        temporary_connection=False,
+        paramstyle="qmark",
+    )
+    mock_connect.return_value.cursor.return_value.executemany.assert_called_once_with(
+        "insert into t values (?)", [["1"]], num_statements=1
+    )
+
+
+@pytest.mark.parametrize(
+    "file_name, arguments, error",
+    [
+        ("rows.txt", ["-q", "select ?"], "Unsupported bind file format"),
+        ("rows.csv", ["-q", "select ?; select ?"], "must be a single statement"),
+        ("rows.csv", ["-i"], "requires `--query`"),
+    ],
+)
+def test_sql_bind_file_errors(runner, temp_dir, file_name, arguments, error):
+    bind_file = Path(temp_dir) / file_name
+    bind_file.write_text("1\n")
+
+    result = runner.invoke(["sql", *arguments, "--bind-file", str(bind_file)])
+
+    assert result.exit_code == 2, result.output
+    assert error in result.output
+
+
+@mock.patch("snowflake.cli._plugins.sql.manager.SqlManager._execute_string")
+@mock.patch("snowflake.cli.api.sql_execution.SqlExecutionMixin._conn")
+@mock.patch("snowflake.cli.api.sql_execution.SqlExecutionMixin.execute_query")
+def test_sql_output_dir(
+    mock_execute, mock_conn, mock_execute_string, runner, mock_cursor, temp_dir
+):
+    mock_conn.database = "db"
+    mock_conn.schema = "public"
+    stage_files = [f"data_0_0_{i}.csv.gz" for i in range(3)]
+
+    def execute_query(query, **kwargs):
+        if query.startswith("copy into"):
+            return mock_cursor(
+                [{"rows_unloaded": 30, "input_bytes": 100, "output_bytes": 50}],
+                ["rows_unloaded", "input_bytes", "output_bytes"],
+            )
+        if query.startswith("ls"):
+            return mock_cursor(
+                [
+                    {"name": f"snowflake_cli_tmp_unload_stage/{name}", "md5": None}
+                    for name in stage_files
+                ],
+                ["name", "md5"],
+            )
+        if query.startswith("get"):
+            return mock_cursor(
+                [("data.csv.gz", 10, "DOWNLOADED", "")],
+                ["file", "size", "status", "message"],
+            )
+        return mock_cursor([], [])
+
+    mock_execute.side_effect = execute_query
+    mock_execute_string.side_effect = lambda statement, **kwargs: iter(
+        [mock_cursor([("Statement executed successfully.",)], ["status"])]
+    )
+    output_dir = Path(temp_dir) / "out"
+
+    result = runner.invoke(
+        [
+            "sql",
+            "-q",
+            "use role r; select * from t;",
+            "--output-dir",
+            str(output_dir),
+            "--max-concurrent-gets",
+            "2",
+            "--format",
+            "json",
+        ]
+    )
+
+    assert result.exit_code == 0, result.output
+    # results of previous statements are printed before the unloaded files
+    assert json.loads(result.output) == [
+        [{"status": "Statement executed successfully."}],
+        [{"file": "data.csv.gz", "size": 10, "status": "DOWNLOADED", "message": ""}]
+        * 2,
+    ]
+    mock_execute_string.assert_called_once_with(
+        "use role r;", cursor_class=VerboseCursor
+    )
+    queries = [c.args[0] for c in mock_execute.call_args_list]
+    assert queries[0].startswith(
+        "create temporary stage if not exists IDENTIFIER('db.public.snowflake_cli_tmp_unload_stage_"
+    )
+    assert queries[1].startswith("copy into @db.public.snowflake_cli_tmp_unload_stage_")
+    assert queries[1].endswith(
+        "/ from (select * from t) file_format = (type = csv compression = AUTO) header = true"
+    )
+    # files are split between two concurrent GETs
+    gets = sorted(q for q in queries if q.startswith("get"))
+    assert len(gets) == 2
+    assert (
+        "pattern = '^[^/]+/(data_0_0_0[.]csv[.]gz|data_0_0_2[.]csv[.]gz)$'" in gets[0]
+    )
+    assert re.fullmatch(
+        r"get @snowflake_cli_tmp_unload_stage/data_0_0_1.csv.gz \S+ parallel=4",
+        gets[1],
+    )
+    assert output_dir.is_dir()
+
+
+@mock.patch("snowflake.cli.api.sql_execution.SqlExecutionMixin._conn")
+@mock.patch("snowflake.cli.api.sql_execution.SqlExecutionMixin.execute_query")
+def test_sql_output_dir_json_format(
+    mock_execute, mock_conn, runner, mock_cursor, temp_dir
+):
+    mock_conn.database = "db"
+    mock_conn.schema = "public"
+    mock_execute.side_effect = lambda *args, **kwargs: mock_cursor([], [])
+
+    result = runner.invoke(
+        [
+            "sql",
+            "-q",
+            "select 1",
+            "--output-dir",
+            temp_dir,
+            "--unload-format",
+            "JSON",
+            "--unload-compression",
+            "none",
+        ]
+    )
+
+    assert result.exit_code == 0, result.output
+    copy_query = mock_execute.call_args_list[1].args[0]
+    assert copy_query.endswith(
+        "/ from (select object_construct(*) from (select 1)) "
+        "file_format = (type = json compression = none)"
+    )
+
+
+@pytest.mark.parametrize(
+    "options, error",
+    [
+        (["--async-batch", "2"], "cannot be used with `--async-batch`"),
+        (["--parallel-files", "2"], "cannot be used with `--parallel-files`"),
+    ],
+)
+@mock.patch("snowflake.cli.api.sql_execution.SqlExecutionMixin.execute_query")
+def test_sql_output_dir_incompatible_options(
+    mock_execute, runner, temp_dir, options, error
+):
+    result = runner.invoke(
+        ["sql", "-q", "select 1", "--output-dir", temp_dir, *options]
+    )
+
+    assert result.exit_code == 2, result.output
+    assert error in result.output
+    mock_execute.assert_not_called()
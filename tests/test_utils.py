@@ -159,6 +159,45 @@ def test_path_resolver(mock_system, argument, expected):
     assert path_utils.path_resolver(argument) == expected
 
 
+def test_walk_tree(temp_dir):
+    root = Path(temp_dir)
+    (root / "b" / "c").mkdir(parents=True)
+    (root / "a.txt").write_text("a")
+    (root / "b" / "c" / "d.txt").write_text("dd")
+    (root / "b" / "e.txt").write_text("eee")
+
+    walked = list(path_utils.walk_tree(root))
+    assert [path for path, _ in walked] == ["a.txt", "b/c/d.txt", "b/e.txt"]
+    assert [stat_result.st_size for _, stat_result in walked] == [1, 2, 3]
+
+    assert [path for path, _ in path_utils.walk_tree(root, include_dirs=True)] == [
+        "a.txt",
+        "b",
+        "b/c",
+        "b/c/d.txt",
+        "b/e.txt",
+    ]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Symlinks require privileges on Windows")
+def test_walk_tree_symlinks(temp_dir):
+    root = Path(temp_dir) / "root"
+    (root / "dir").mkdir(parents=True)
+    (root / "dir" / "file.txt").write_text("file")
+    (root / "link").symlink_to(root / "dir", target_is_directory=True)
+    (root / "broken").symlink_to(root / "missing")
+
+    assert [path for path, _ in path_utils.walk_tree(root)] == [
+        "broken",
+        "dir/file.txt",
+        "link/file.txt",
+    ]
+    assert [path for path, _ in path_utils.walk_tree(root, follow_symlinks=False)] == [
+        "broken",
+        "dir/file.txt",
+    ]
+
+
 @pytest.mark.parametrize(
     "identifier, expected",
     [